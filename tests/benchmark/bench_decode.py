@@ -0,0 +1,163 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from time import perf_counter
+
+import typedb_protocol.common.answer_pb2 as answer_proto
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+from typedb.common.label import Label
+from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.proto import concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
+from typedb.concept.thing.attribute import _BooleanAttribute, _LongAttribute, _DoubleAttribute, _StringAttribute, \
+    _DateTimeAttribute
+from typedb.concept.thing.entity import _Entity
+from typedb.concept.thing.relation import _Relation
+from typedb.concept.type.attribute_type import _BooleanAttributeType, _LongAttributeType, _DoubleAttributeType, \
+    _StringAttributeType, _DateTimeAttributeType, _AttributeType
+from typedb.concept.type.entity_type import _EntityType
+from typedb.concept.type.relation_type import _RelationType
+from typedb.concept.type.role_type import _RoleType
+from typedb.concept.type.thing_type import _ThingType
+from typedb.concept.value.value import _BooleanValue, _LongValue, _DoubleValue, _StringValue, _DateTimeValue
+
+ANSWERS = 20000
+ROUNDS = 5
+
+
+def thing_type(proto_type: concept_proto.Type, label: str, encoding: str, value_type: str = "OBJECT"):
+    proto_type.label = label
+    proto_type.encoding = concept_proto.Type.Encoding.Value(encoding)
+    proto_type.value_type = concept_proto.ValueType.Value(value_type)
+
+
+def answer(i: int) -> answer_proto.ConceptMap:
+    concept_map = answer_proto.ConceptMap()
+    person = concept_map.map["x"].thing
+    person.iid = i.to_bytes(8, "big")
+    thing_type(person.type, "person", "ENTITY_TYPE")
+    employment = concept_map.map["e"].thing
+    employment.iid = (i + ANSWERS).to_bytes(8, "big")
+    thing_type(employment.type, "employment", "RELATION_TYPE")
+    name = concept_map.map["n"].thing
+    name.iid = (i + 2 * ANSWERS).to_bytes(8, "big")
+    thing_type(name.type, "name", "ATTRIBUTE_TYPE", "STRING")
+    name.value.string = "person-%d" % i
+    age = concept_map.map["a"].thing
+    age.iid = (i + 3 * ANSWERS).to_bytes(8, "big")
+    thing_type(age.type, "age", "ATTRIBUTE_TYPE", "LONG")
+    age.value.long = i % 100
+    thing_type(concept_map.map["t"].type, "person", "ENTITY_TYPE")
+    concept_map.map["v"].value.value_type = concept_proto.ValueType.Value("DOUBLE")
+    concept_map.map["v"].value.value.double = i / 2
+    return concept_map
+
+
+# The decoder as it was before the dispatch tables, kept as the baseline they are measured against.
+def if_elif_concept(proto_concept: concept_proto.Concept):
+    if proto_concept.HasField("thing"):
+        return if_elif_thing(proto_concept.thing)
+    elif proto_concept.HasField("type"):
+        if proto_concept.type.encoding == concept_proto.Type.Encoding.Value("ROLE_TYPE"):
+            return _RoleType.of(proto_concept.type)
+        return if_elif_thing_type(proto_concept.type)
+    else:
+        return if_elif_value(proto_concept.value)
+
+
+def if_elif_thing(proto_thing: concept_proto.Thing):
+    if proto_thing.type.encoding == concept_proto.Type.Encoding.Value("ENTITY_TYPE"):
+        return _Entity.of(proto_thing)
+    elif proto_thing.type.encoding == concept_proto.Type.Encoding.Value("RELATION_TYPE"):
+        return _Relation.of(proto_thing)
+    elif proto_thing.type.value_type == concept_proto.ValueType.Value("BOOLEAN"):
+        return _BooleanAttribute.of(proto_thing)
+    elif proto_thing.type.value_type == concept_proto.ValueType.Value("LONG"):
+        return _LongAttribute.of(proto_thing)
+    elif proto_thing.type.value_type == concept_proto.ValueType.Value("DOUBLE"):
+        return _DoubleAttribute.of(proto_thing)
+    elif proto_thing.type.value_type == concept_proto.ValueType.Value("STRING"):
+        return _StringAttribute.of(proto_thing)
+    else:
+        return _DateTimeAttribute.of(proto_thing)
+
+
+def if_elif_value(proto_value: concept_proto.Value):
+    if proto_value.value_type == concept_proto.ValueType.Value("BOOLEAN"):
+        return _BooleanValue.of(proto_value)
+    elif proto_value.value_type == concept_proto.ValueType.Value("LONG"):
+        return _LongValue.of(proto_value)
+    elif proto_value.value_type == concept_proto.ValueType.Value("DOUBLE"):
+        return _DoubleValue.of(proto_value)
+    elif proto_value.value_type == concept_proto.ValueType.Value("STRING"):
+        return _StringValue.of(proto_value)
+    else:
+        return _DateTimeValue.of(proto_value)
+
+
+def if_elif_thing_type(proto_type: concept_proto.Type):
+    if proto_type.encoding == concept_proto.Type.Encoding.Value("ENTITY_TYPE"):
+        return _EntityType.of(proto_type)
+    elif proto_type.encoding == concept_proto.Type.Encoding.Value("RELATION_TYPE"):
+        return _RelationType.of(proto_type)
+    elif proto_type.encoding == concept_proto.Type.Encoding.Value("THING_TYPE"):
+        return _ThingType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract)
+    elif proto_type.value_type == concept_proto.ValueType.Value("BOOLEAN"):
+        return _BooleanAttributeType.of(proto_type)
+    elif proto_type.value_type == concept_proto.ValueType.Value("LONG"):
+        return _LongAttributeType.of(proto_type)
+    elif proto_type.value_type == concept_proto.ValueType.Value("DOUBLE"):
+        return _DoubleAttributeType.of(proto_type)
+    elif proto_type.value_type == concept_proto.ValueType.Value("STRING"):
+        return _StringAttributeType.of(proto_type)
+    elif proto_type.value_type == concept_proto.ValueType.Value("DATETIME"):
+        return _DateTimeAttributeType.of(proto_type)
+    else:
+        return _AttributeType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract)
+
+
+def decode_concepts(answers, decoder) -> float:
+    start = perf_counter()
+    for res in answers:
+        for proto_concept in res.map.values():
+            decoder(proto_concept)
+    return perf_counter() - start
+
+
+def decode(answers, type_cache_factory) -> float:
+    start = perf_counter()
+    type_cache = type_cache_factory()
+    for res in answers:
+        concept_map = _ConceptMap.of(res, type_cache)
+        for concept in concept_map.concepts():
+            pass
+    return perf_counter() - start
+
+
+if __name__ == "__main__":
+    answers = [answer(i) for i in range(ANSWERS)]
+    for name, decoder in [("if/elif decoder", if_elif_concept), ("dispatch tables", concept_proto_reader.concept)]:
+        elapsed = min(decode_concepts(answers, decoder) for _ in range(ROUNDS))
+        print("%s: %.2fus per answer (%d variables)" % (name, elapsed / ANSWERS * 1e6, len(answers[0].map)))
+    for name, type_cache_factory in [("no type cache", lambda: None), ("type cache", _TypeCache)]:
+        elapsed = min(decode(answers, type_cache_factory) for _ in range(ROUNDS))
+        print("%s: %.2fus per answer (%d variables)" % (name, elapsed / ANSWERS * 1e6, len(answers[0].map)))
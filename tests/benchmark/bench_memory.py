@@ -0,0 +1,48 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import tracemalloc
+
+from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.proto.type_cache import _TypeCache
+from tests.benchmark.bench_decode import answer
+
+ANSWERS = 20000
+
+
+def materialise(answers, type_cache_factory) -> int:
+    type_cache = type_cache_factory()
+    tracemalloc.start()
+    start, _ = tracemalloc.get_traced_memory()
+    concept_maps = [_ConceptMap.of(res, type_cache) for res in answers]
+    for concept_map in concept_maps:
+        for concept in concept_map.concepts():
+            concept.is_thing() and concept.get_type().get_label()
+    end, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return end - start
+
+
+if __name__ == "__main__":
+    answers = [answer(i) for i in range(ANSWERS)]
+    for name, type_cache_factory in [("no type cache", lambda: None), ("type cache", _TypeCache)]:
+        allocated = materialise(answers, type_cache_factory)
+        print("%s: %d bytes per answer (%d variables)" % (name, allocated / ANSWERS, len(answers[0].map)))
@@ -0,0 +1,69 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from time import perf_counter
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+ROUND_TRIPS = 5000
+PIPELINED = 20000
+ROUNDS = 3
+
+
+def setup(client: TypeDBClient) -> str:
+    if not client.databases().contains(TYPEDB):
+        client.databases().create(TYPEDB)
+    with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+        tx.query().define("define marker sub entity;")
+        tx.commit()
+    with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+        iid = next(tx.query().insert("insert $x isa marker;")).get("x").get_iid()
+        tx.commit()
+    return iid
+
+
+def round_trips(tx: TypeDBTransaction, iid: str) -> float:
+    start = perf_counter()
+    for _ in range(ROUND_TRIPS):
+        tx.concepts().get_thing(iid)
+    return (perf_counter() - start) / ROUND_TRIPS
+
+
+def pipelined(tx: TypeDBTransaction) -> float:
+    start = perf_counter()
+    futures = [tx.query().match_aggregate("match $x isa marker; count;") for _ in range(PIPELINED)]
+    for future in futures:
+        future.get()
+    return (perf_counter() - start) / PIPELINED
+
+
+if __name__ == "__main__":
+    with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+        iid = setup(client)
+        with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+            print("get_thing round trip: %.1fus" % (min(round_trips(tx, iid) for _ in range(ROUNDS)) * 1e6))
+            print("pipelined match_aggregate: %.1fus per request" % (min(pipelined(tx) for _ in range(ROUNDS)) * 1e6))
@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from threading import Thread
+from time import perf_counter, sleep
+
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+CONSUMERS = 16
+AGGREGATES_PER_CONSUMER = 200
+PEOPLE = 2000
+SLOW_CONSUMER_PREFETCH_SIZE = 20
+SLOW_CONSUMER_WORK_SECONDS = 0.001
+
+
+def setup(client: TypeDBClient):
+    if client.databases().contains(TYPEDB):
+        client.databases().get(TYPEDB).delete()
+    client.databases().create(TYPEDB)
+    with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+        tx.query().define("define person sub entity, owns name; name sub attribute, value string;")
+        tx.commit()
+    with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+        for i in range(PEOPLE):
+            tx.query().insert("insert $x isa person, has name \"person-%d\";" % i)
+        tx.commit()
+
+
+def concurrent_consumers(tx: TypeDBTransaction) -> float:
+    def consume():
+        futures = [tx.query().match_aggregate("match $x isa person; count;") for _ in range(AGGREGATES_PER_CONSUMER)]
+        for future in futures:
+            future.get()
+        for _ in tx.query().match("match $x isa person, has name $n;"):
+            pass
+
+    start = perf_counter()
+    threads = [Thread(target=consume) for _ in range(CONSUMERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return perf_counter() - start
+
+
+def slow_consumer(tx: TypeDBTransaction) -> float:
+    # Small batches and per-answer work: the next batch should arrive while the current one is being processed
+    options = TypeDBOptions.core().set_prefetch_size(SLOW_CONSUMER_PREFETCH_SIZE)
+    start = perf_counter()
+    for _ in tx.query().match("match $x isa person, has name $n;", options):
+        sleep(SLOW_CONSUMER_WORK_SECONDS)
+    return perf_counter() - start
+
+
+def run(reader_thread: bool) -> (float, float):
+    with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, reader_thread=reader_thread) as client:
+        with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+            return concurrent_consumers(tx), slow_consumer(tx)
+
+
+if __name__ == "__main__":
+    with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+        setup(client)
+    for reader_thread in [False, True]:
+        concurrent, slow = run(reader_thread)
+        print("reader_thread=%s: %d consumers on one transaction took %.3fs" % (reader_thread, CONSUMERS, concurrent))
+        print("reader_thread=%s: one slow consumer took %.3fs" % (reader_thread, slow))
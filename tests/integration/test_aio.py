@@ -0,0 +1,72 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import asyncio
+import unittest
+from unittest import TestCase
+
+from typedb.aio.client import *
+from typedb.client import TypeDB as BlockingTypeDB
+
+TYPEDB = "typedb"
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestAio(TestCase):
+
+    def test_concurrent_queries_on_one_transaction(self):
+        async def run():
+            async with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+                if not await client.databases().contains(TYPEDB):
+                    await client.databases().create(TYPEDB)
+                async with client.session(TYPEDB, DATA) as session:
+                    async with session.transaction(READ) as tx:
+                        async def count(query):
+                            return len([answer async for answer in tx.query().match(query)])
+                        counts = await asyncio.gather(*(count("match $x sub thing;") for _ in range(10)))
+                        assert len(set(counts)) == 1 and counts[0] > 0
+                    assert not tx.is_open()
+            assert not client.is_open()
+
+        asyncio.run(run())
+
+    def test_commits_invalidate_the_caches_of_a_blocking_client(self):
+        with BlockingTypeDB.core_client(TypeDB.DEFAULT_ADDRESS, query_cache_max_bytes=1 << 20) as blocking_client:
+            if not blocking_client.databases().contains(TYPEDB):
+                blocking_client.databases().create(TYPEDB)
+            with blocking_client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                tx.query().match_aggregate("match $x sub thing; count;").get()
+            assert len(blocking_client.query_cache()) == 1
+
+            async def run():
+                async with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, cached_client=blocking_client) as client:
+                    async with client.session(TYPEDB, DATA) as session:
+                        tx = await session.transaction(WRITE)
+                        await tx.commit()
+
+            asyncio.run(run())
+            assert len(blocking_client.query_cache()) == 0
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
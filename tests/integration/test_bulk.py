@@ -0,0 +1,67 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from unittest import TestCase
+
+from typedb.bulk.loader import BulkLoader
+from typedb.client import *
+
+TYPEDB = "typedb"
+SCHEMA = SessionType.SCHEMA
+DATA = SessionType.DATA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestBulkLoader(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if client.databases().contains(TYPEDB):
+                client.databases().get(TYPEDB).delete()
+            client.databases().create(TYPEDB)
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query().define("define person sub entity, owns name; name sub attribute, value string;")
+                tx.commit()
+
+    def test_rows_are_loaded_in_parallel_batches(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                loader = BulkLoader(session, batch_size=50, parallelism=4)
+                report = loader.load_rows("insert $x isa person, has name ~name;", (("person-%d" % i,) for i in range(1000)))
+                assert report.queries() == 1000
+                assert report.batches() == 20
+                with session.transaction(READ) as tx:
+                    assert tx.query().match_aggregate("match $x isa person; count;").get().as_int() == 1000
+
+    def test_row_values_are_written_as_literals(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                name = 'O\'Neil"; insert $y isa person;'
+                BulkLoader(session).load_rows("insert $x isa person, has name ~name;", [{"name": name}])
+                with session.transaction(READ) as tx:
+                    answers = list(tx.query().match("match $x isa person, has name $n;"))
+                    assert [answer.get("n").get_value() for answer in answers] == [name]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from threading import Thread
+from time import sleep
+from unittest import TestCase
+
+from typedb.common.exception import TypeDBClientException, CHANNEL_POOL_TIMEOUT
+from typedb.connection.channel_pool import _ChannelPool
+
+
+class _StubChannel:
+
+    def subscribe(self, callback):
+        pass
+
+    def unsubscribe(self, callback):
+        pass
+
+    def close(self):
+        pass
+
+
+class TestChannelPool(TestCase):
+
+    def setUp(self):
+        self.pool = _ChannelPool(lambda: (_StubChannel(), None), max_idle=1, idle_timeout_seconds=60, max_channels=2,
+                                 borrow_timeout_seconds=0.1)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_borrow_fails_once_every_channel_is_borrowed(self):
+        self.pool.borrow(), self.pool.borrow()
+        with self.assertRaises(TypeDBClientException) as context:
+            self.pool.borrow()
+        assert context.exception.error_message is CHANNEL_POOL_TIMEOUT
+        assert self.pool.size() == 2
+
+    def test_borrow_waits_for_a_channel_to_be_given_back(self):
+        first, _ = self.pool.borrow(), self.pool.borrow()
+        Thread(target=lambda: (sleep(0.02), self.pool.give_back(first))).start()
+        assert self.pool.borrow() is first
+
+    def test_channels_closed_beyond_max_idle_free_their_slot(self):
+        first, second = self.pool.borrow(), self.pool.borrow()
+        self.pool.give_back(first)
+        self.pool.give_back(second)
+        assert (self.pool.idle_count(), self.pool.size()) == (1, 1)
+        self.pool.borrow(), self.pool.borrow()
+        assert self.pool.size() == 2
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,241 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+from time import monotonic, sleep
+from unittest import TestCase
+
+import typedb_protocol.cluster.cluster_database_pb2 as cluster_database_proto
+
+from typedb.client import *
+from typedb.common.concurrent.timer_service import TimerService
+from typedb.connection.cluster.database import _FailsafeTask
+from typedb.connection.cluster.topology import _ReplicaTopology
+
+ADDRESSES = ["127.0.0.1:11729", "127.0.0.1:21729", "127.0.0.1:31729"]
+
+
+class _FakeCluster:
+    """
+    Stands in for a cluster client whose primary replica has just failed: until election_seconds have passed, replica
+    lookups report no primary and every replica rejects operations as not being the primary.
+    """
+
+    def __init__(self, retry_policy: RetryPolicy, election_seconds: float, topology_ttl_seconds: float = 0,
+                 timer_service: TimerService = None, hanging_addresses=(), probe_deadline_seconds: float = 10):
+        self._retry_policy = retry_policy
+        self._elected_at = monotonic() + election_seconds
+        self._topology = _ReplicaTopology(self, topology_ttl_seconds, probe_deadline_seconds, timer_service)
+        self._hanging_addresses = set(hanging_addresses)
+        self.lookups = 0
+        self.timeouts = []
+
+    def primary(self):
+        return ADDRESSES[1] if monotonic() >= self._elected_at else None
+
+    def retry_policy(self):
+        return self._retry_policy
+
+    def topology(self):
+        return self._topology
+
+    def server_addresses(self):
+        return set(ADDRESSES)
+
+    def databases(self):
+        return self
+
+    def database_mgrs(self):
+        return {address: self for address in ADDRESSES}
+
+    def _stub(self, address):
+        return _FakeServer(self, address)
+
+    def stub(self):
+        return self
+
+    def databases_get(self, req, address=None, timeout=None):
+        self.lookups += 1
+        self.timeouts.append(timeout)
+        if address in self._hanging_addresses:
+            # Like a gRPC call, gives up once its timeout passes
+            sleep(5 if timeout is None else timeout)
+            if timeout is not None:
+                raise TimeoutError()
+        res = cluster_database_proto.ClusterDatabaseManager.Get.Res()
+        res.database.name = req.name
+        for address in ADDRESSES:
+            res.database.replicas.add(address=address, primary=address == self.primary(), term=1)
+        return res
+
+
+class _FakeServer:
+
+    def __init__(self, cluster: _FakeCluster, address: str):
+        self._cluster = cluster
+        self._address = address
+
+    def databases_get(self, req, timeout=None):
+        return self._cluster.databases_get(req, self._address, timeout)
+
+
+class _FailOnceTask(_FailsafeTask):
+
+    def run(self, replica):
+        raise TypeDBClientException.of(UNABLE_TO_CONNECT)
+
+    def rerun(self, replica):
+        return replica.address()
+
+
+class _PrimaryOnlyTask(_FailsafeTask):
+
+    def run(self, replica):
+        if replica.address() != self.client.primary():
+            raise TypeDBClientException.of(CLUSTER_REPLICA_NOT_PRIMARY)
+        return replica.address()
+
+
+class _ReachableOnceElectedTask(_FailsafeTask):
+
+    def __init__(self, client, database):
+        super().__init__(client, database)
+        self.attempts = 0
+
+    def run(self, replica):
+        self.attempts += 1
+        if self.client.primary() is None:
+            raise TypeDBClientException.of(UNABLE_TO_CONNECT)
+        return replica.address()
+
+
+def _with_primary(address: str) -> cluster_database_proto.ClusterDatabase:
+    proto_db = cluster_database_proto.ClusterDatabase(name="typedb")
+    for replica_address in ADDRESSES:
+        proto_db.replicas.add(address=replica_address, primary=replica_address == address, term=1)
+    return proto_db
+
+
+class TestClusterRetry(TestCase):
+
+    def test_failover_completes_soon_after_election(self):
+        cluster = _FakeCluster(ExponentialBackoff(), election_seconds=0.2)
+        start = monotonic()
+        assert _PrimaryOnlyTask(cluster, "typedb").run_primary_replica() == ADDRESSES[1]
+        assert monotonic() - start < 1.0
+
+    def test_gives_up_after_max_elapsed_time(self):
+        cluster = _FakeCluster(ExponentialBackoff(max_elapsed_seconds=0.5), election_seconds=60)
+        start = monotonic()
+        with self.assertRaises(TypeDBClientException) as context:
+            _PrimaryOnlyTask(cluster, "typedb").run_primary_replica()
+        assert context.exception.error_message is CLUSTER_UNABLE_TO_CONNECT
+        # The policy gives up before a retry would pass the limit; the margin is for the lookups and scheduling
+        assert monotonic() - start < 0.5 + 0.25
+
+    def test_does_not_retry_errors_the_policy_rejects(self):
+        cluster = _FakeCluster(ExponentialBackoff(retryable_errors=[UNABLE_TO_CONNECT]), election_seconds=0)
+        cluster.topology().update(_with_primary(ADDRESSES[0]))
+        with self.assertRaises(TypeDBClientException) as context:
+            _PrimaryOnlyTask(cluster, "typedb").run_primary_replica()
+        assert context.exception.error_message is CLUSTER_REPLICA_NOT_PRIMARY
+        assert cluster.lookups == 0
+
+    def test_cached_primary_is_used_without_lookup(self):
+        cluster = _FakeCluster(FixedDelay(2), election_seconds=0)
+        cluster.topology().update(_with_primary(ADDRESSES[1]))
+        assert _PrimaryOnlyTask(cluster, "typedb").run_primary_replica() == ADDRESSES[1]
+        assert cluster.lookups == 0
+
+    def test_stale_primary_is_replaced_without_waiting(self):
+        cluster = _FakeCluster(FixedDelay(2), election_seconds=0)
+        cluster.topology().update(_with_primary(ADDRESSES[0]))
+        start = monotonic()
+        assert _PrimaryOnlyTask(cluster, "typedb").run_primary_replica() == ADDRESSES[1]
+        assert monotonic() - start < 1.0
+        assert cluster.lookups == len(ADDRESSES)
+
+    def test_unchanged_primary_is_retried_without_another_lookup(self):
+        cluster = _FakeCluster(FixedDelay(0.05), election_seconds=0)
+        cluster.topology().update(_with_primary(ADDRESSES[1]))
+        assert _FailOnceTask(cluster, "typedb").run_primary_replica() == ADDRESSES[1]
+        assert cluster.lookups == len(ADDRESSES)
+
+    def test_topology_is_refreshed_in_background(self):
+        timer_service = TimerService(1)
+        cluster = _FakeCluster(ExponentialBackoff(), election_seconds=0, topology_ttl_seconds=0.1,
+                               timer_service=timer_service)
+        cluster.topology().update(_with_primary(ADDRESSES[0]))
+        with redirect_stdout(StringIO()) as output:
+            sleep(0.35)
+        cluster.topology().close()
+        timer_service.shutdown()
+        assert cluster.lookups >= 2 * len(ADDRESSES)
+        assert output.getvalue() == ""
+        assert cluster.topology().primary_replica("typedb").address() == ADDRESSES[1]
+
+    def test_unresponsive_server_does_not_delay_replica_lookup(self):
+        cluster = _FakeCluster(ExponentialBackoff(), election_seconds=0, hanging_addresses=ADDRESSES[:2])
+        start = monotonic()
+        assert cluster.topology().fetch("typedb").primary_replica().address() == ADDRESSES[1]
+        assert monotonic() - start < 1.0
+
+    def test_replica_lookup_gives_up_at_probe_deadline(self):
+        cluster = _FakeCluster(ExponentialBackoff(), election_seconds=0, hanging_addresses=ADDRESSES,
+                               probe_deadline_seconds=0.2)
+        start = monotonic()
+        with self.assertRaises(TypeDBClientException) as context:
+            cluster.topology().fetch("typedb")
+        assert context.exception.error_message is CLUSTER_UNABLE_TO_CONNECT
+        assert monotonic() - start < 1.0
+        assert cluster.timeouts == [0.2] * len(ADDRESSES)
+
+    def test_any_replica_is_retried_until_one_is_reachable(self):
+        cluster = _FakeCluster(FixedDelay(0.05, max_attempts=30), election_seconds=0.2)
+        with redirect_stdout(StringIO()):
+            assert _ReachableOnceElectedTask(cluster, "typedb").run_any_replica() in ADDRESSES
+
+    def test_any_replica_gives_up_with_the_policy(self):
+        cluster = _FakeCluster(FixedDelay(0.01, max_attempts=5), election_seconds=60)
+        with self.assertRaises(TypeDBClientException) as context, redirect_stdout(StringIO()):
+            _ReachableOnceElectedTask(cluster, "typedb").run_any_replica()
+        assert context.exception.error_message is CLUSTER_UNABLE_TO_CONNECT
+
+    def test_any_replica_does_not_retry_errors_the_policy_rejects(self):
+        cluster = _FakeCluster(ExponentialBackoff(retryable_errors=[CLUSTER_REPLICA_NOT_PRIMARY]), election_seconds=60)
+        task = _ReachableOnceElectedTask(cluster, "typedb")
+        with self.assertRaises(TypeDBClientException) as context:
+            task.run_any_replica()
+        assert context.exception.error_message is UNABLE_TO_CONNECT
+        assert task.attempts == 1
+
+    def test_jitter_spreads_retries(self):
+        policy = ExponentialBackoff(initial_delay_seconds=0.1, multiplier=2.0, max_delay_seconds=10, jitter=0.5,
+                                     max_attempts=10)
+        delays = [policy.next_delay(3, 0) for _ in range(100)]
+        assert all(0.4 <= delay <= 0.8 for delay in delays)
+        assert len(set(delays)) > 90
+        assert policy.next_delay(10, 0) is None
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,98 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import importlib.util
+import unittest
+from unittest import TestCase
+
+import typedb_protocol.common.answer_pb2 as answer_proto
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+from typedb.client import *
+from typedb.concept.answer.concept_column import _ConceptColumnsCollector
+
+ENTITY_TYPE = concept_proto.Type.ENTITY_TYPE
+ATTRIBUTE_TYPE = concept_proto.Type.ATTRIBUTE_TYPE
+
+
+def _answer(i: int, age_is_string: bool = False) -> answer_proto.ConceptMap:
+    res = answer_proto.ConceptMap()
+    person = res.map["x"].thing
+    person.iid = bytes([0x1a, i, 0])
+    person.type.label = "person" if i % 2 == 0 else "employee"
+    person.type.encoding = ENTITY_TYPE
+    age = res.map["a"].thing
+    age.iid = bytes([0x2b, i])
+    age.type.label = "age"
+    age.type.encoding = ATTRIBUTE_TYPE
+    if age_is_string:
+        age.type.value_type = concept_proto.STRING
+        age.value.string = str(i)
+    else:
+        age.type.value_type = concept_proto.LONG
+        age.value.long = i
+    return res
+
+
+def _columns(answers, variables=None):
+    collector = _ConceptColumnsCollector(variables)
+    collector.add_all(answers)
+    return collector.columns()
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "columnar results need the optional numpy dependency")
+class TestConceptColumn(TestCase):
+
+    def test_iids_are_kept_as_raw_bytes(self):
+        columns = _columns([_answer(i) for i in range(3)])
+        assert [iid.tobytes() for iid in columns["x"].iids()] == [bytes([0x1a, i, 0]) for i in range(3)]
+
+    def test_type_labels_are_int32_codes(self):
+        column = _columns([_answer(i) for i in range(4)])["x"]
+        assert column.type_codes().dtype.name == "int32"
+        assert list(column.type_codes()) == [0, 1, 0, 1]
+        assert [label.name() for label in column.labels()] == ["person", "employee"]
+
+    def test_values_of_one_type_are_typed(self):
+        column = _columns([_answer(i) for i in range(3)])["a"]
+        assert column.values().dtype.name == "int64"
+        assert list(column.values()) == [0, 1, 2]
+
+    def test_mixed_or_missing_values_fall_back_to_objects(self):
+        columns = _columns([_answer(0), _answer(1, age_is_string=True)])
+        assert columns["a"].values().dtype == object
+        assert list(columns["a"].values()) == [0, "1"]
+        assert columns["x"].values().dtype == object
+        assert list(columns["x"].values()) == [None, None]
+
+    def test_missing_variable_raises(self):
+        with self.assertRaises(TypeDBClientException) as context:
+            _columns([_answer(0)], ["y"])
+        assert context.exception.error_message is VARIABLE_DOES_NOT_EXIST
+
+    def test_empty_result_has_empty_columns(self):
+        columns = _columns([], ["x"])
+        assert len(columns["x"]) == 0
+        assert len(columns["x"].values()) == 0
+        assert _columns([]) == {}
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
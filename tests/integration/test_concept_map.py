@@ -0,0 +1,74 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import unittest
+from unittest import TestCase
+
+import typedb_protocol.common.answer_pb2 as answer_proto
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+from typedb.client import *
+from typedb.concept.answer.concept_map import _ConceptMap
+
+
+def _concept_map_proto() -> answer_proto.ConceptMap:
+    res = answer_proto.ConceptMap()
+    for i, variable in enumerate(["x", "y", "z"]):
+        thing = res.map[variable].thing
+        thing.iid = bytes([0x1a, i])
+        thing.type.label = "person"
+        thing.type.encoding = concept_proto.Type.ENTITY_TYPE
+    res.explainables.relations["x"].conjunction = "{ $x isa person; }"
+    res.explainables.relations["x"].id = 7
+    return res
+
+
+class TestConceptMap(TestCase):
+
+    def test_concepts_are_decoded_on_first_access_and_cached(self):
+        concept_map = _ConceptMap.of(_concept_map_proto())
+        assert len(concept_map.map()._concepts) == 0
+        concept = concept_map.get("y")
+        assert list(concept_map.map()._concepts) == ["y"]
+        assert concept_map.get("y") is concept
+        assert concept.get_iid() == "0x1a01"
+
+    def test_map_and_concepts_iterate_in_the_same_order(self):
+        concept_map = _ConceptMap.of(_concept_map_proto())
+        assert sorted(concept_map.map()) == ["x", "y", "z"]
+        assert list(concept_map.concepts()) == [concept_map.map()[variable] for variable in concept_map.map()]
+
+    def test_explainables_are_decoded_on_first_access(self):
+        concept_map = _ConceptMap.of(_concept_map_proto())
+        assert concept_map._explainables is None
+        explainables = concept_map.explainables()
+        assert explainables.relation("x").explainable_id() == 7
+        assert concept_map.explainables() is explainables
+
+    def test_unknown_variable_raises(self):
+        concept_map = _ConceptMap.of(_concept_map_proto())
+        with self.assertRaises(TypeDBClientException) as context:
+            concept_map.get("w")
+        assert context.exception.error_message is VARIABLE_DOES_NOT_EXIST
+        assert "w" not in concept_map.map()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,162 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+import unittest
+from unittest import TestCase
+
+from typedb.client import *
+from typedb.pool.session_pool import SessionPool
+from typedb.pool.transaction_pool import TransactionPool
+
+TYPEDB = "typedb"
+DATA = SessionType.DATA
+SCHEMA = SessionType.SCHEMA
+READ = TransactionType.READ
+WRITE = TransactionType.WRITE
+
+
+class TestConnection(TestCase):
+
+    def setUp(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            if TYPEDB not in [db.name() for db in client.databases().all()]:
+                client.databases().create(TYPEDB)
+
+    def test_transactions_reuse_pooled_channel(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session:
+                for _ in range(20):
+                    with session.transaction(READ) as tx:
+                        assert client.channel_pool().idle_count() == 0
+                        next(tx.query().match("match $x sub thing; limit 1;"))
+                    assert client.channel_pool().idle_count() == 1
+            assert client.channel_pool().idle_count() == 1
+        assert client.channel_pool().idle_count() == 0
+
+    def test_answers_share_interned_types(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                answers = list(tx.query().match("match $x sub thing; $y sub thing; limit 10;"))
+                types = [answer.get("x") for answer in answers] + [answer.get("y") for answer in answers]
+                for type_ in types:
+                    assert tx.concepts().get_thing_type(type_.get_label().name()) is type_
+
+    def test_schema_cache_serves_interned_types(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA, TypeDBOptions.core().set_schema_cache(True)) as session:
+                for _ in range(2):
+                    with session.transaction(READ) as tx:
+                        answers = list(tx.query().match("match $x sub thing; limit 10;"))
+                        subtypes = list(tx.concepts().get_thing_type("thing").as_remote(tx).get_subtypes())
+                        for type_ in [answer.get("x") for answer in answers]:
+                            assert tx.concepts().get_thing_type(type_.get_label().name()) is type_
+                            assert any(subtype is type_ for subtype in subtypes)
+
+    def test_schema_cache_is_invalidated_by_schema_commits(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA, TypeDBOptions.core().set_schema_cache(True)) as session:
+                with session.transaction(READ) as tx:
+                    assert tx.concepts().get_thing_type("cached-person") is None
+                with client.session(TYPEDB, SCHEMA) as schema_session, schema_session.transaction(WRITE) as tx:
+                    tx.query().define("define cached-person sub entity;")
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    assert tx.concepts().get_thing_type("cached-person") is not None
+
+    def test_schema_cache_ignores_transactions_opened_before_a_schema_commit(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA, TypeDBOptions.core().set_schema_cache(True)) as session:
+                stale = session.transaction(READ)
+                with client.session(TYPEDB, SCHEMA) as schema_session, schema_session.transaction(WRITE) as tx:
+                    tx.query().define("define stale-cached-person sub entity;")
+                    tx.commit()
+                assert stale.concepts().get_thing_type("stale-cached-person") is None
+                stale.close()
+                with session.transaction(READ) as tx:
+                    assert tx.concepts().get_thing_type("stale-cached-person") is not None
+
+    def test_query_cache_serves_reads_until_a_write_commits(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, query_cache_max_bytes=1 << 20) as client:
+            query_cache = client.query_cache()
+            with client.session(TYPEDB, DATA) as session:
+                for _ in range(2):
+                    with session.transaction(READ) as tx:
+                        tx.query().match_aggregate("match $x sub thing; count;").get()
+                assert (query_cache.misses(), query_cache.hits()) == (1, 1)
+                with session.transaction(WRITE) as tx:
+                    tx.commit()
+                assert len(query_cache) == 0
+
+    def test_query_cache_keys_transaction_options_and_refuses_stale_reads(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, query_cache_max_bytes=1 << 20) as client:
+            query_cache = client.query_cache()
+            with client.session(TYPEDB, DATA) as session:
+                for options in (TypeDBOptions.core().set_infer(False), TypeDBOptions.core().set_infer(True)):
+                    with session.transaction(READ, options) as tx:
+                        tx.query().match_aggregate("match $x sub thing; count;").get()
+                assert (query_cache.misses(), query_cache.hits(), len(query_cache)) == (2, 0, 2)
+                stale = session.transaction(READ)
+                with session.transaction(WRITE) as tx:
+                    tx.commit()
+                stale.query().match_aggregate("match $x sub thing; count;").get()
+                stale.close()
+                assert len(query_cache) == 0
+
+    def test_session_pool_replaces_closed_sessions(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, SessionPool(client, max_sessions=1) as pool:
+            pool.prewarm(TYPEDB, DATA)
+            with pool.session(TYPEDB, DATA) as session:
+                session.close()
+            with pool.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                tx.query().match_aggregate("match $x sub thing; count;").get()
+            metrics = pool.metrics()
+            assert (metrics.opened(), metrics.replaced(), metrics.borrows()) == (2, 1, 3)
+
+    def test_session_pool_shares_default_options_and_evicts_closed_idle_sessions(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, SessionPool(client, max_sessions=1) as pool:
+            with pool.session(TYPEDB, DATA) as session:
+                pass
+            with pool.session(TYPEDB, DATA, TypeDBOptions.core()) as same_session:
+                assert same_session is session
+            # Closes the idle session, as a pulse that finds it dead does
+            session.close()
+            metrics = pool.metrics()
+            assert (metrics.sessions(), metrics.opened(), metrics.replaced()) == (0, 1, 1)
+
+    def test_transaction_pool_hands_out_pre_opened_transactions(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client, client.session(TYPEDB, DATA) as session:
+            with TransactionPool(session, size=1) as pool:
+                for _ in range(3):
+                    # Wait for the background thread to open the next transaction, so that each borrow is a hit
+                    deadline = time.monotonic() + 10
+                    while not pool._ready and time.monotonic() < deadline:
+                        time.sleep(0.01)
+                    with pool.transaction() as tx:
+                        assert tx.transaction_type() == READ
+                        tx.query().match_aggregate("match $x sub thing; count;").get()
+                assert (pool.hits(), pool.misses()) == (3, 0)
+                with self.assertRaises(TypeDBClientException):
+                    TransactionPool(session, max_age_seconds=0)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
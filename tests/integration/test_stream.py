@@ -55,5 +55,126 @@ class TestStream(TestCase):
                     _attrs = list(person_type.get_owns(annotations=set([Annotations.KEY])))
                     next(tx.query().match("match $x sub thing; limit 1;"))
 
+    def test_event_driven_transmitter(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, transmitter_mode=TransmitterMode.EVENT_DRIVEN) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                futures = [tx.query().match_aggregate("match $x sub thing; count;") for _ in range(500)]
+                counts = {future.get().as_int() for future in futures}
+                assert len(counts) == 1
+                assert len(list(tx.query().match("match $x sub thing;"))) == counts.pop()
+
+    def test_event_driven_transmitter_with_small_batches(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, transmitter_mode=TransmitterMode.EVENT_DRIVEN, max_batch=4,
+                                max_delay_seconds=0.002) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                futures = [tx.query().match_aggregate("match $x sub thing; count;") for _ in range(100)]
+                assert len({future.get().as_int() for future in futures}) == 1
+
+    def test_void_inserts_surface_errors_at_commit(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query().define("define lodger sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    for _ in range(1000):
+                        tx.query().insert_void("insert $x isa lodger;")
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    assert tx.query().match_aggregate("match $x isa lodger; count;").get().as_int() >= 1000
+                with session.transaction(WRITE) as tx:
+                    tx.query().insert_void("insert $x isa lodger;")
+                    tx.query().insert_void("insert $x isa no-such-type;")
+                    with self.assertRaises(TypeDBClientException):
+                        tx.commit()
+
+    def test_void_streams_are_forgotten_once_done(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query().define("define lodger sub entity;")
+                tx.commit()
+            with client.session(TYPEDB, DATA) as session, session.transaction(WRITE) as tx:
+                stream = tx._bidirectional_stream
+                queues = len(stream._response_collector._response_queues)
+                for _ in range(500):
+                    tx.query().insert_void("insert $x isa lodger;")
+                tx.commit()
+                assert not stream._void_streams
+                # Only the commit, a single request, may have left a queue behind
+                assert len(stream._response_collector._response_queues) <= queues + 1
+
+    def test_prepared_queries_bind_parameters_as_literals(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, SCHEMA) as session, session.transaction(WRITE) as tx:
+                tx.query().define("define guest sub entity, owns nickname; nickname sub attribute, value string;")
+                tx.commit()
+            nicknames = ['plain', 'with "double" quotes', "with 'single' quotes", "# not a comment"]
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(WRITE) as tx:
+                    insert = tx.query().prepare("insert $x isa guest, has nickname ~nickname;")
+                    for nickname in nicknames:
+                        insert.insert_void(nickname=nickname)
+                    tx.commit()
+                with session.transaction(READ) as tx:
+                    match = tx.query().prepare("match $x isa guest, has nickname ~nickname; count;")
+                    for nickname in nicknames:
+                        assert match.match_aggregate(nickname=nickname).get().as_int() >= 1
+                    with self.assertRaises(TypeDBClientException):
+                        match.match_aggregate(nickname="both \" and '")
+
+    def test_abandoned_streams_do_not_disturb_the_transaction(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                expected = len(list(tx.query().match("match $x sub thing;")))
+                options = TypeDBOptions.core().set_prefetch_size(1)
+                for _ in range(100):
+                    next(tx.query().match("match $x sub thing; $y sub thing;", options))
+                assert len(list(tx.query().match("match $x sub thing;"))) == expected
+
+    def test_finished_and_cancelled_streams_leave_no_state(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                stream = tx._bidirectional_stream
+                queues = len(stream._response_collector._response_queues)
+                options = TypeDBOptions.core().set_prefetch_size(1)
+                for _ in range(50):
+                    list(tx.query().match("match $x sub thing;", options))
+                    tx.query().match("match $x sub thing;", options).close()
+                    next(tx.query().match("match $x sub thing; $y sub thing;", options))
+                assert tx.query().match_aggregate("match $x sub thing; count;").get().as_int() > 0
+                assert not stream._deferred_streams and not stream._dropped_streams
+                # Only the aggregate, a single request, may have left a queue behind
+                assert len(stream._response_collector._response_queues) <= queues + 1
+
+    def test_bounded_stream_buffers_deliver_every_answer(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS, reader_thread=True) as client:
+            with client.session(TYPEDB, DATA) as session:
+                with session.transaction(READ) as tx:
+                    expected = len(list(tx.query().match("match $x sub thing; $y sub thing;")))
+                tx_options = TypeDBOptions.core().set_stream_buffer_size(1).set_stream_buffer_bytes(1)
+                with session.transaction(READ, tx_options) as tx:
+                    query_options = TypeDBOptions.core().set_prefetch_size(1)
+                    assert len(list(tx.query().match("match $x sub thing; $y sub thing;", query_options))) == expected
+
+    def test_query_futures_complete_out_of_order(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                futures = [tx.query().match_aggregate("match $x sub thing; count;") for _ in range(200)]
+                completed = list(QueryFuture.as_completed(futures, timeout=30))
+                assert len(completed) == len(futures)
+                assert len({future.get().as_int() for future in completed}) == 1
+                done, not_done = QueryFuture.wait(futures, timeout=0)
+                assert len(done) == len(futures) and not not_done
+
+    def test_query_future_after_get(self):
+        with TypeDB.core_client(TypeDB.DEFAULT_ADDRESS) as client:
+            with client.session(TYPEDB, DATA) as session, session.transaction(READ) as tx:
+                future = tx.query().match_aggregate("match $x sub thing; count;")
+                count = future.get().as_int()
+                assert future.as_future().result(timeout=10).as_int() == count
+                assert future.done()
+                done, _ = QueryFuture.wait([future], timeout=10)
+                assert done == {future}
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
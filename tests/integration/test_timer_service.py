@@ -0,0 +1,83 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import unittest
+from threading import Event
+from time import monotonic, sleep
+from unittest import TestCase
+
+from typedb.common.concurrent.timer_service import TimerService
+
+
+class TestTimerService(TestCase):
+
+    def setUp(self):
+        self.timer_service = TimerService(2)
+
+    def tearDown(self):
+        self.timer_service.shutdown()
+
+    def test_fixed_rate_actions_run_on_schedule(self):
+        ticks = []
+        start = monotonic()
+        task = self.timer_service.schedule_at_fixed_rate(0.05, lambda: ticks.append(monotonic() - start))
+        sleep(0.325)
+        task.cancel()
+        assert 5 <= len(ticks) <= 7
+        # Each tick is due at a multiple of the interval from the start, not an interval after the previous one ran
+        assert all(abs(tick - 0.05 * (i + 1)) < 0.04 for i, tick in enumerate(ticks))
+
+    def test_delayed_action_runs_once(self):
+        runs = []
+        self.timer_service.schedule(0.02, lambda: runs.append(1))
+        sleep(0.1)
+        assert runs == [1]
+
+    def test_tick_is_skipped_while_previous_run_is_in_progress(self):
+        runs = []
+        task = self.timer_service.schedule_at_fixed_rate(0.01, lambda: (runs.append(1), sleep(0.1)))
+        sleep(0.35)
+        task.cancel()
+        # Ticks fall every 10ms, but a run only starts once the one before has finished
+        assert 2 <= len(runs) <= 4
+
+    def test_cancelled_task_stops_running(self):
+        runs = []
+        task = self.timer_service.schedule_at_fixed_rate(0.02, lambda: runs.append(1))
+        sleep(0.1)
+        task.cancel()
+        assert task.is_cancelled()
+        sleep(0.03)
+        count = len(runs)
+        sleep(0.1)
+        assert count > 0 and len(runs) == count
+
+    def test_shutdown_drops_pending_and_later_actions(self):
+        ran = Event()
+        self.timer_service.schedule(0.05, ran.set)
+        self.timer_service.shutdown()
+        self.timer_service.schedule(0.01, ran.set)
+        self.timer_service.schedule_at_fixed_rate(0.01, ran.set)
+        assert not ran.wait(0.15)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
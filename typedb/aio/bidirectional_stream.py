@@ -0,0 +1,259 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set, TypeVar, Union
+from itertools import count
+
+import typedb_protocol.common.transaction_pb2 as transaction_proto
+from grpc import RpcError
+from grpc.aio import EOF
+
+from typedb.aio.future import AsyncQueryFuture
+from typedb.aio.stub import _AsyncCoreStub
+from typedb.common.exception import TypeDBClientException, ILLEGAL_ARGUMENT, MISSING_RESPONSE, TRANSACTION_CLOSED, \
+    UNKNOWN_REQUEST_ID
+from typedb.common.rpc.request_builder import transaction_client_msg, transaction_stream_req
+from typedb.stream.response_collector import DoneResponse, Response, ValueResponse
+
+T = TypeVar('T')
+Res = Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]
+
+
+class AsyncBidirectionalStream:
+    """
+    The asyncio counterpart of ``BidirectionalStream``: one task writes queued requests to the gRPC call, coalescing
+    whatever has been queued since its last write into a single message, and another reads responses into the
+    queue of the request they answer.
+    """
+    _DEFAULT_BUFFER_SIZE = 32
+
+    def __init__(self, stub: _AsyncCoreStub, buffer_size: Optional[int] = None, buffer_bytes: Optional[int] = None):
+        self._call = stub.transaction()
+        self._request_queue: "asyncio.Queue[Optional[transaction_proto.Transaction.Req]]" = asyncio.Queue()
+        self._response_queues: Dict[bytes, "asyncio.Queue[Response]"] = {}
+        self._request_ids = count(1)
+        self._void_streams: Set[bytes] = set()
+        self._deferred_streams: Set[bytes] = set()
+        self._dropped_streams: Deque[bytes] = deque()
+        self._buffer_size = buffer_size or self._DEFAULT_BUFFER_SIZE
+        self._buffer_bytes = buffer_bytes
+        self._buffered_bytes: Dict[bytes, int] = {}
+        self._is_open = True
+        self._error: Optional[TypeDBClientException] = None
+        self._writer = asyncio.ensure_future(self._write_requests())
+        self._reader = asyncio.ensure_future(self._read_responses())
+
+    def single(self, req: transaction_proto.Transaction.Req) -> "AsyncBidirectionalStream.Single[transaction_proto.Transaction.Res]":
+        request_id = self._dispatch(req)
+        return AsyncBidirectionalStream.Single(request_id, self)
+
+    def stream(self, req: transaction_proto.Transaction.Req) -> AsyncIterator[transaction_proto.Transaction.ResPart]:
+        request_id = self._dispatch(req)
+        return AsyncResponsePartIterator(request_id, self)
+
+    def stream_void(self, req: transaction_proto.Transaction.Req) -> None:
+        request_id = next(self._request_ids).to_bytes(16, "big")
+        req.req_id = request_id
+        self._void_streams.add(request_id)
+        self._request_queue.put_nowait(req)
+
+    def _dispatch(self, req: transaction_proto.Transaction.Req) -> bytes:
+        request_id = next(self._request_ids).to_bytes(16, "big")
+        req.req_id = request_id
+        response_queue = asyncio.Queue()
+        if not self._is_open:
+            response_queue.put_nowait(DoneResponse(self._error))
+        self._response_queues[request_id] = response_queue
+        self._request_queue.put_nowait(req)
+        return request_id
+
+    def cancel(self, request_id: bytes) -> None:
+        # Frees a streamed request, whether its consumer stopped early or read its DONE; whatever the server still
+        # sends for it is dropped as it arrives
+        self._deferred_streams.discard(request_id)
+        self._response_queues.pop(request_id, None)
+        self._buffered_bytes.pop(request_id, None)
+
+    def drop(self, request_id: bytes) -> None:
+        # Garbage collection may run this in the middle of any code on the event loop's thread, including while the
+        # response queues are being iterated, so the request is only queued here and cancelled by the next response
+        self._dropped_streams.append(request_id)
+
+    def dispatch_stream_req(self, request_id: bytes) -> None:
+        self._request_queue.put_nowait(transaction_stream_req(request_id))
+
+    def is_open(self) -> bool:
+        return self._is_open
+
+    async def fetch_part(self, request_id: bytes) -> transaction_proto.Transaction.ResPart:
+        res_part = await self.fetch(request_id)
+        if request_id in self._deferred_streams and not self._is_buffer_full(request_id):
+            self._deferred_streams.remove(request_id)
+            self.dispatch_stream_req(request_id)
+        return res_part
+
+    async def fetch(self, request_id: bytes) -> Res:
+        response_queue = self._response_queues[request_id]
+        response = await response_queue.get()
+        if response.is_value():
+            if response.size_bytes:
+                self._buffered_bytes[request_id] -= response.size_bytes
+            return response.value
+        # Keep the done marker queued so that every later fetch fails the same way
+        response_queue.put_nowait(response)
+        if response.error is not None:
+            raise response.error
+        raise TypeDBClientException.of(TRANSACTION_CLOSED)
+
+    async def _write_requests(self):
+        try:
+            while True:
+                requests: List[transaction_proto.Transaction.Req] = [await self._request_queue.get()]
+                while not self._request_queue.empty():
+                    requests.append(self._request_queue.get_nowait())
+                if None in requests:
+                    requests = requests[:requests.index(None)]
+                    if requests:
+                        await self._call.write(transaction_client_msg(requests))
+                    await self._call.done_writing()
+                    return
+                await self._call.write(transaction_client_msg(requests))
+        except RpcError as e:
+            self._close(TypeDBClientException.of_rpc(e))
+        except asyncio.InvalidStateError:
+            # The call has already finished; the reader reports why.
+            pass
+
+    async def _read_responses(self):
+        try:
+            while True:
+                server_msg = await self._call.read()
+                if server_msg is EOF:
+                    break
+                server_case = server_msg.WhichOneof("server")
+                if server_case == "res":
+                    self._collect(server_msg.res)
+                elif server_case == "res_part":
+                    self._collect(server_msg.res_part)
+                else:
+                    raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
+            self._close(None)
+        except RpcError as e:
+            self._close(TypeDBClientException.of_rpc(e))
+        except TypeDBClientException as e:
+            self._close(e)
+
+    def _collect(self, response: Res):
+        while self._dropped_streams:
+            self.cancel(self._dropped_streams.popleft())
+        is_continue = response.WhichOneof("res") == "stream_res_part" and \
+            response.stream_res_part.state == transaction_proto.Transaction.Stream.State.Value("CONTINUE")
+        if response.req_id in self._void_streams:
+            # Once DONE, a void stream is forgotten; like any finished stream, a late second DONE is dropped as it arrives
+            if is_continue:
+                self.dispatch_stream_req(response.req_id)
+            elif response.WhichOneof("res") == "stream_res_part":
+                self._void_streams.discard(response.req_id)
+            return
+        response_queue = self._response_queues.get(response.req_id)
+        if response_queue is None:
+            # The parts of a cancelled stream that were in flight, and the late DONE that the server may send after
+            # the DONE of a finished stream, are recognised by their already issued IDs
+            if int.from_bytes(response.req_id, "big") < next(self._request_ids):
+                return
+            raise TypeDBClientException.of(UNKNOWN_REQUEST_ID, (response.req_id.hex(), str(response)))
+        elif not is_continue:
+            size_bytes = response.ByteSize() if self._buffer_bytes is not None else 0
+            if size_bytes:
+                self._buffered_bytes[response.req_id] = self._buffered_bytes.get(response.req_id, 0) + size_bytes
+            response_queue.put_nowait(ValueResponse(response, size_bytes))
+        elif not self._is_buffer_full(response.req_id):
+            self.dispatch_stream_req(response.req_id)
+        else:
+            self._deferred_streams.add(response.req_id)
+
+    def _is_buffer_full(self, request_id: bytes) -> bool:
+        return self._response_queues[request_id].qsize() >= self._buffer_size or \
+            (self._buffer_bytes is not None and self._buffered_bytes.get(request_id, 0) >= self._buffer_bytes)
+
+    def get_error(self) -> Optional[TypeDBClientException]:
+        return self._error
+
+    def _close(self, error: Optional[TypeDBClientException]):
+        if self._is_open:
+            self._is_open = False
+            self._error = error
+            self._request_queue.put_nowait(None)
+            for response_queue in self._response_queues.values():
+                response_queue.put_nowait(DoneResponse(error))
+
+    async def close(self, error: Optional[TypeDBClientException] = None):
+        self._close(error)
+        await self._writer
+
+    class Single(AsyncQueryFuture[T]):
+
+        def __init__(self, request_id: bytes, stream: "AsyncBidirectionalStream"):
+            self._request_id = request_id
+            self._stream = stream
+
+        async def get(self) -> T:
+            return await self._stream.fetch(self._request_id)
+
+
+class AsyncResponsePartIterator(AsyncIterator[transaction_proto.Transaction.ResPart]):
+
+    def __init__(self, request_id: bytes, stream: AsyncBidirectionalStream):
+        self._request_id = request_id
+        self._stream = stream
+        self._done = False
+        self._closed = False
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._stream.cancel(self._request_id)
+
+    def __del__(self):
+        if not self._closed:
+            self._closed = True
+            self._stream.drop(self._request_id)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> transaction_proto.Transaction.ResPart:
+        if self._done or self._closed:
+            raise StopAsyncIteration
+        res_part = await self._stream.fetch_part(self._request_id)
+        res_case = res_part.WhichOneof("res")
+        if res_case == "stream_res_part":
+            if res_part.stream_res_part.state != transaction_proto.Transaction.Stream.State.Value("DONE"):
+                raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
+            self._done = True
+            self._closed = True
+            self._stream.cancel(self._request_id)
+            raise StopAsyncIteration
+        elif res_case is None:
+            raise TypeDBClientException.of(MISSING_RESPONSE, self._request_id.hex())
+        return res_part
@@ -0,0 +1,146 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import Optional, Set
+
+from grpc.aio import insecure_channel
+
+from typedb.aio.database import AsyncTypeDBDatabaseManager
+from typedb.aio.future import _AsyncOpener
+from typedb.aio.session import AsyncTypeDBSession
+from typedb.aio.stub import _AsyncCoreStub
+from typedb.api.connection.client import TypeDBClient
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import SessionType
+from typedb.common.exception import TypeDBClientException, CLIENT_NOT_OPEN
+
+# Repackaging these symbols allows them to be imported from "typedb.aio.client"
+
+from typedb.api.answer.concept_column import *  # noqa # pylint: disable=unused-import
+from typedb.api.answer.concept_map import *  # noqa # pylint: disable=unused-import
+from typedb.api.answer.concept_map_group import *  # noqa # pylint: disable=unused-import
+from typedb.api.answer.numeric import *  # noqa # pylint: disable=unused-import
+from typedb.api.answer.numeric_group import *  # noqa # pylint: disable=unused-import
+
+from typedb.api.concept.thing.attribute import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.thing.entity import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.thing.relation import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.thing.thing import *  # noqa # pylint: disable=unused-import
+
+from typedb.api.concept.type.attribute_type import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.type.entity_type import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.type.relation_type import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.type.role_type import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.type.thing_type import *  # noqa # pylint: disable=unused-import
+from typedb.api.concept.type.type import *  # noqa # pylint: disable=unused-import
+
+from typedb.api.concept.concept import *  # noqa # pylint: disable=unused-import
+
+from typedb.api.connection.options import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.session import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.transaction import *  # noqa # pylint: disable=unused-import
+
+from typedb.api.logic.explanation import *  # noqa # pylint: disable=unused-import
+
+from typedb.common.exception import *  # noqa # pylint: disable=unused-import
+from typedb.common.label import *  # noqa # pylint: disable=unused-import
+
+
+class AsyncTypeDBClient:
+    """
+    A TypeDB Core client for asyncio applications. All sessions and transactions share one ``grpc.aio`` channel and
+    run on the event loop of the caller, so no threads are started.
+
+    The sessions of this client cache nothing, but a blocking client to the same server may: once given as
+    ``cached_client``, its query and schema caches are invalidated by the commits of this client, as they are by its own.
+    """
+
+    def __init__(self, address: str, cached_client: Optional[TypeDBClient] = None):
+        self._address = address
+        self._cached_client = cached_client
+        self._channel = insecure_channel(address)
+        self._stub = _AsyncCoreStub(self._channel)
+        self._databases = AsyncTypeDBDatabaseManager(self._stub)
+        self._sessions: Set[AsyncTypeDBSession] = set()
+        self._is_open = False
+
+    async def _open(self) -> "AsyncTypeDBClient":
+        try:
+            await self._stub.connection_open()
+        except TypeDBClientException as e:
+            await self._channel.close()
+            raise e
+        self._is_open = True
+        return self
+
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def address(self) -> str:
+        return self._address
+
+    def databases(self) -> AsyncTypeDBDatabaseManager:
+        if not self._is_open:
+            raise TypeDBClientException.of(CLIENT_NOT_OPEN)
+        return self._databases
+
+    def session(self, database: str, session_type: SessionType,
+                options: TypeDBOptions = None) -> _AsyncOpener[AsyncTypeDBSession]:
+        if not self._is_open:
+            raise TypeDBClientException.of(CLIENT_NOT_OPEN)
+        return _AsyncOpener(self._open_session(database, session_type, options))
+
+    async def _open_session(self, database: str, session_type: SessionType, options: TypeDBOptions = None) -> AsyncTypeDBSession:
+        session = await AsyncTypeDBSession(self, database, session_type, options)._open()
+        self._sessions.add(session)
+        return session
+
+    def remove_session(self, session: AsyncTypeDBSession) -> None:
+        self._sessions.discard(session)
+
+    def stub(self) -> _AsyncCoreStub:
+        return self._stub
+
+    def cached_client(self) -> Optional[TypeDBClient]:
+        return self._cached_client
+
+    async def close(self) -> None:
+        if self._is_open:
+            self._is_open = False
+            for session in list(self._sessions):
+                await session.close()
+            await self._channel.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        if exc_tb is not None:
+            return False
+
+
+class TypeDB:
+    DEFAULT_ADDRESS = "localhost:1729"
+
+    @staticmethod
+    def core_client(address: str, cached_client: Optional[TypeDBClient] = None) -> _AsyncOpener[AsyncTypeDBClient]:
+        return _AsyncOpener(AsyncTypeDBClient(address, cached_client)._open())
@@ -0,0 +1,69 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import List
+
+from typedb.aio.stub import _AsyncCoreStub
+from typedb.common.exception import TypeDBClientException, DB_DOES_NOT_EXIST
+from typedb.common.rpc.request_builder import core_database_manager_contains_req, core_database_manager_create_req, \
+    core_database_manager_all_req, core_database_schema_req, core_database_delete_req
+from typedb.connection.database_manager import _not_blank
+
+
+class AsyncTypeDBDatabase:
+
+    def __init__(self, stub: _AsyncCoreStub, name: str):
+        self._name = name
+        self._stub = stub
+
+    def name(self) -> str:
+        return self._name
+
+    async def schema(self) -> str:
+        return (await self._stub.database_schema(core_database_schema_req(self._name))).schema
+
+    async def delete(self) -> None:
+        await self._stub.database_delete(core_database_delete_req(self._name))
+
+    def __str__(self):
+        return self._name
+
+
+class AsyncTypeDBDatabaseManager:
+
+    def __init__(self, stub: _AsyncCoreStub):
+        self._stub = stub
+
+    async def get(self, name: str) -> AsyncTypeDBDatabase:
+        if await self.contains(name):
+            return AsyncTypeDBDatabase(self._stub, name)
+        else:
+            raise TypeDBClientException.of(DB_DOES_NOT_EXIST, name)
+
+    async def contains(self, name: str) -> bool:
+        return (await self._stub.databases_contains(core_database_manager_contains_req(_not_blank(name)))).contains
+
+    async def create(self, name: str) -> None:
+        await self._stub.databases_create(core_database_manager_create_req(_not_blank(name)))
+
+    async def all(self) -> List[AsyncTypeDBDatabase]:
+        databases: List[str] = (await self._stub.databases_all(core_database_manager_all_req())).names
+        return [AsyncTypeDBDatabase(self._stub, name) for name in databases]
@@ -0,0 +1,72 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Generator, Generic, TypeVar
+
+T = TypeVar('T')
+U = TypeVar('U')
+
+
+class AsyncQueryFuture(Generic[T], ABC):
+
+    @abstractmethod
+    async def get(self) -> T:
+        pass
+
+    def map(self, function: Callable[[T], U]) -> "AsyncQueryFuture[U]":
+        return _MappedAsyncQueryFuture(self, function)
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self.get().__await__()
+
+
+class _MappedAsyncQueryFuture(Generic[T, U], AsyncQueryFuture[U]):
+
+    def __init__(self, query_future: AsyncQueryFuture[T], function: Callable[[T], U]):
+        self._query_future = query_future
+        self._function = function
+
+    async def get(self) -> U:
+        return self._function(await self._query_future.get())
+
+
+class _AsyncOpener(Generic[T]):
+    """
+    Wraps the coroutine that opens a client, session or transaction, so that the result can either be awaited
+    directly or used in an ``async with`` block that closes it on exit.
+    """
+
+    def __init__(self, opener: Awaitable[T]):
+        self._opener = opener
+        self._opened = None
+
+    def __await__(self) -> Generator[Any, None, T]:
+        return self._opener.__await__()
+
+    async def __aenter__(self) -> T:
+        self._opened = await self._opener
+        return self._opened
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._opened.close()
+        if exc_tb is not None:
+            return False
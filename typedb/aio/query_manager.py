@@ -0,0 +1,151 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import TYPE_CHECKING, AsyncIterator, Callable, Iterable, Mapping, TypeVar
+
+import typedb_protocol.common.query_pb2 as query_proto
+import typedb_protocol.common.transaction_pb2 as transaction_proto
+
+from typedb.aio.future import AsyncQueryFuture
+from typedb.api.answer.concept_column import ConceptColumn
+from typedb.api.answer.concept_map import ConceptMap
+from typedb.api.answer.concept_map_group import ConceptMapGroup
+from typedb.api.answer.numeric import Numeric
+from typedb.api.answer.numeric_group import NumericGroup
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.logic.explanation import Explanation
+from typedb.common.rpc.request_builder import query_manager_match_req, query_manager_match_aggregate_req, \
+    query_manager_match_group_req, query_manager_match_group_aggregate_req, query_manager_insert_req, \
+    query_manager_delete_req, query_manager_update_req, query_manager_define_req, query_manager_undefine_req, \
+    query_manager_explain_req
+from typedb.concept.answer.concept_column import _ConceptColumnsCollector
+from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.answer.concept_map_group import _ConceptMapGroup
+from typedb.concept.answer.numeric import _Numeric
+from typedb.concept.answer.numeric_group import _NumericGroup
+from typedb.logic.explanation import _Explanation
+
+if TYPE_CHECKING:
+    from typedb.aio.transaction import AsyncTypeDBTransaction
+
+T = TypeVar('T')
+
+
+class AsyncQueryManager:
+    """
+    The asyncio counterpart of ``QueryManager``. Every query is sent as soon as the method is called; streamed
+    answers are then consumed with ``async for`` and single results are awaited.
+    """
+
+    def __init__(self, transaction: "AsyncTypeDBTransaction"):
+        self._transaction = transaction
+
+    def match(self, query: str, options: TypeDBOptions = None) -> AsyncIterator[ConceptMap]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_match_req(query, options.proto())),
+                        lambda rp: (_ConceptMap.of(cm, type_cache) for cm in rp.match_res_part.answers))
+
+    async def match_columnar(self, query: str, columns: Iterable[str] = None,
+                             options: TypeDBOptions = None) -> Mapping[str, ConceptColumn]:
+        if not options:
+            options = TypeDBOptions.core()
+        collector = _ConceptColumnsCollector(columns)
+        async for rp in self.stream(query_manager_match_req(query, options.proto())):
+            collector.add_all(rp.query_manager_res_part.match_res_part.answers)
+        return collector.columns()
+
+    def match_aggregate(self, query: str, options: TypeDBOptions = None) -> AsyncQueryFuture[Numeric]:
+        if not options:
+            options = TypeDBOptions.core()
+        return self.query(query_manager_match_aggregate_req(query, options.proto())).map(lambda res: _Numeric.of(res.match_aggregate_res.answer))
+
+    def match_group(self, query: str, options: TypeDBOptions = None) -> AsyncIterator[ConceptMapGroup]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_match_group_req(query, options.proto())),
+                        lambda rp: (_ConceptMapGroup.of(cmg, type_cache) for cmg in rp.match_group_res_part.answers))
+
+    def match_group_aggregate(self, query: str, options: TypeDBOptions = None) -> AsyncIterator[NumericGroup]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_match_group_aggregate_req(query, options.proto())),
+                        lambda rp: (_NumericGroup.of(ng, type_cache) for ng in rp.match_group_aggregate_res_part.answers))
+
+    def insert(self, query: str, options: TypeDBOptions = None) -> AsyncIterator[ConceptMap]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_insert_req(query, options.proto())),
+                        lambda rp: (_ConceptMap.of(cm, type_cache) for cm in rp.insert_res_part.answers))
+
+    def insert_void(self, query: str, options: TypeDBOptions = None) -> None:
+        if not options:
+            options = TypeDBOptions.core()
+        self._transaction.stream_void(query_manager_insert_req(query, options.proto()))
+
+    def delete(self, query: str, options: TypeDBOptions = None) -> AsyncQueryFuture:
+        if not options:
+            options = TypeDBOptions.core()
+        return self.query_void(query_manager_delete_req(query, options.proto()))
+
+    def update(self, query: str, options: TypeDBOptions = None) -> AsyncIterator[ConceptMap]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_update_req(query, options.proto())),
+                        lambda rp: (_ConceptMap.of(cm, type_cache) for cm in rp.update_res_part.answers))
+
+    def explain(self, explainable: ConceptMap.Explainable, options: TypeDBOptions = None) -> AsyncIterator[Explanation]:
+        if not options:
+            options = TypeDBOptions.core()
+        type_cache = self._transaction.type_cache()
+        return _answers(self.stream(query_manager_explain_req(explainable.explainable_id(), options.proto())),
+                        lambda rp: (_Explanation.of(ex, type_cache) for ex in rp.explain_res_part.explanations))
+
+    def define(self, query: str, options: TypeDBOptions = None) -> AsyncQueryFuture:
+        if not options:
+            options = TypeDBOptions.core()
+        return self.query_void(query_manager_define_req(query, options.proto()))
+
+    def undefine(self, query: str, options: TypeDBOptions = None) -> AsyncQueryFuture:
+        if not options:
+            options = TypeDBOptions.core()
+        return self.query_void(query_manager_undefine_req(query, options.proto()))
+
+    def query_void(self, req: transaction_proto.Transaction.Req):
+        return self._transaction.run_query(req)
+
+    def query(self, req: transaction_proto.Transaction.Req):
+        return self._transaction.run_query(req).map(lambda res: res.query_manager_res)
+
+    def stream(self, req: transaction_proto.Transaction.Req):
+        return self._transaction.stream(req)
+
+
+async def _answers(res_parts: AsyncIterator[transaction_proto.Transaction.ResPart],
+                   unpack: Callable[[query_proto.QueryManager.ResPart], Iterable[T]]) -> AsyncIterator[T]:
+    async for rp in res_parts:
+        for answer in unpack(rp.query_manager_res_part):
+            yield answer
@@ -0,0 +1,124 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Optional
+
+import typedb_protocol.common.session_pb2 as session_proto
+
+from typedb.aio.database import AsyncTypeDBDatabase
+from typedb.aio.future import _AsyncOpener
+from typedb.aio.transaction import AsyncTypeDBTransaction
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import SessionType
+from typedb.api.connection.transaction import TransactionType
+from typedb.common.exception import TypeDBClientException, SESSION_CLOSED
+from typedb.common.rpc.request_builder import session_open_req
+
+if TYPE_CHECKING:
+    from typedb.aio.client import AsyncTypeDBClient
+
+
+class AsyncTypeDBSession:
+    _PULSE_INTERVAL_SECONDS = 5
+
+    def __init__(self, client: "AsyncTypeDBClient", database: str, session_type: SessionType, options: TypeDBOptions = None):
+        if not options:
+            options = TypeDBOptions.core()
+        self._client = client
+        self._session_type = session_type
+        self._options = options
+        self._database = AsyncTypeDBDatabase(client.stub(), database)
+        self._session_id: Optional[bytes] = None
+        self._network_latency_millis = 1
+        self._is_open = False
+        self._pulse: Optional[asyncio.Task] = None
+
+    async def _open(self) -> "AsyncTypeDBSession":
+        start_time = time.time() * 1000.0
+        res = await self._client.stub().session_open(session_open_req(self._database.name(), self._session_type.proto(),
+                                                                      self._options.proto()))
+        end_time = time.time() * 1000.0
+        self._network_latency_millis = max(int(end_time - start_time - res.server_duration_millis), 1)
+        self._session_id = res.session_id
+        self._is_open = True
+        self._pulse = asyncio.ensure_future(self._transmit_pulses())
+        return self
+
+    def is_open(self) -> bool:
+        return self._is_open
+
+    def session_type(self) -> SessionType:
+        return self._session_type
+
+    def database(self) -> AsyncTypeDBDatabase:
+        return self._database
+
+    def options(self) -> TypeDBOptions:
+        return self._options
+
+    def transaction(self, transaction_type: TransactionType,
+                    options: TypeDBOptions = None) -> _AsyncOpener[AsyncTypeDBTransaction]:
+        if not self._is_open:
+            raise TypeDBClientException.of(SESSION_CLOSED)
+        return _AsyncOpener(AsyncTypeDBTransaction(self, transaction_type, options)._open())
+
+    def session_id(self) -> bytes:
+        return self._session_id
+
+    def network_latency_millis(self) -> int:
+        return self._network_latency_millis
+
+    def client(self) -> "AsyncTypeDBClient":
+        return self._client
+
+    async def close(self) -> None:
+        if self._is_open:
+            self._is_open = False
+            self._client.remove_session(self)
+            self._pulse.cancel()
+            req = session_proto.Session.Close.Req()
+            req.session_id = self._session_id
+            try:
+                await self._client.stub().session_close(req)
+            except TypeDBClientException:  # This generally means the session is already closed.
+                pass
+
+    async def _transmit_pulses(self):
+        while self._is_open:
+            await asyncio.sleep(self._PULSE_INTERVAL_SECONDS)
+            pulse_req = session_proto.Session.Pulse.Req()
+            pulse_req.session_id = self._session_id
+            try:
+                alive = (await self._client.stub().session_pulse(pulse_req)).alive
+            except TypeDBClientException:
+                alive = False
+            if not alive:
+                self._is_open = False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        if exc_tb is not None:
+            return False
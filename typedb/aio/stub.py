@@ -0,0 +1,80 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import Awaitable, Callable, TypeVar
+
+import typedb_protocol.common.session_pb2 as session_proto
+import typedb_protocol.core.core_database_pb2 as core_database_proto
+import typedb_protocol.core.core_service_pb2_grpc as core_service_proto
+from grpc import RpcError
+from grpc.aio import Channel, StreamStreamCall
+
+from typedb.common.exception import TypeDBClientException
+from typedb.common.rpc.request_builder import connection_open_req
+
+T = TypeVar('T')
+
+
+class _AsyncCoreStub:
+
+    def __init__(self, channel: Channel):
+        self._channel = channel
+        self._stub = core_service_proto.TypeDBStub(channel)
+
+    async def connection_open(self) -> None:
+        await self.resilient_call(lambda: self._stub.connection_open(connection_open_req()))
+
+    async def databases_contains(self, req: core_database_proto.CoreDatabaseManager.Contains.Req) -> core_database_proto.CoreDatabaseManager.Contains.Res:
+        return await self.resilient_call(lambda: self._stub.databases_contains(req))
+
+    async def databases_create(self, req: core_database_proto.CoreDatabaseManager.Create.Req) -> core_database_proto.CoreDatabaseManager.Create.Res:
+        return await self.resilient_call(lambda: self._stub.databases_create(req))
+
+    async def databases_all(self, req: core_database_proto.CoreDatabaseManager.All.Req) -> core_database_proto.CoreDatabaseManager.All.Res:
+        return await self.resilient_call(lambda: self._stub.databases_all(req))
+
+    async def database_schema(self, req: core_database_proto.CoreDatabase.Schema.Req) -> core_database_proto.CoreDatabase.Schema.Res:
+        return await self.resilient_call(lambda: self._stub.database_schema(req))
+
+    async def database_delete(self, req: core_database_proto.CoreDatabase.Delete.Req) -> core_database_proto.CoreDatabase.Delete.Res:
+        return await self.resilient_call(lambda: self._stub.database_delete(req))
+
+    async def session_open(self, req: session_proto.Session.Open.Req) -> session_proto.Session.Open.Res:
+        return await self.resilient_call(lambda: self._stub.session_open(req))
+
+    async def session_close(self, req: session_proto.Session.Close.Req) -> session_proto.Session.Close.Res:
+        return await self.resilient_call(lambda: self._stub.session_close(req))
+
+    async def session_pulse(self, req: session_proto.Session.Pulse.Req) -> session_proto.Session.Pulse.Res:
+        return await self.resilient_call(lambda: self._stub.session_pulse(req))
+
+    def transaction(self) -> StreamStreamCall:
+        return self._stub.transaction()
+
+    def channel(self) -> Channel:
+        return self._channel
+
+    @staticmethod
+    async def resilient_call(function: Callable[[], Awaitable[T]]) -> T:
+        try:
+            return await function()
+        except RpcError as e:
+            raise TypeDBClientException.of_rpc(e)
@@ -0,0 +1,132 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import TYPE_CHECKING, AsyncIterator
+
+import typedb_protocol.common.transaction_pb2 as transaction_proto
+
+from typedb.aio.bidirectional_stream import AsyncBidirectionalStream
+from typedb.aio.future import AsyncQueryFuture
+from typedb.aio.query_manager import AsyncQueryManager
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.transaction import TransactionType
+from typedb.common.exception import TypeDBClientException, TRANSACTION_CLOSED, TRANSACTION_CLOSED_WITH_ERRORS
+from typedb.common.rpc.request_builder import transaction_commit_req, transaction_rollback_req, transaction_open_req
+from typedb.concept.proto.type_cache import _TypeCache
+
+if TYPE_CHECKING:
+    from typedb.aio.session import AsyncTypeDBSession
+
+
+class AsyncTypeDBTransaction:
+
+    def __init__(self, session: "AsyncTypeDBSession", transaction_type: TransactionType, options: TypeDBOptions = None):
+        if not options:
+            options = TypeDBOptions.core()
+        self._session = session
+        self._transaction_type = transaction_type
+        self._options = options
+        self._query_manager = AsyncQueryManager(self)
+        self._type_cache = _TypeCache()
+        self._bidirectional_stream = AsyncBidirectionalStream(session.client().stub(), options.get_stream_buffer_size(),
+                                                              options.get_stream_buffer_bytes())
+
+    async def _open(self) -> "AsyncTypeDBTransaction":
+        req = transaction_open_req(self._session.session_id(), self._transaction_type.proto(), self._options.proto(),
+                                   self._session.network_latency_millis())
+        try:
+            await self.execute(req)
+        except TypeDBClientException as e:
+            await self._bidirectional_stream.close(e)
+            raise e
+        return self
+
+    def transaction_type(self) -> TransactionType:
+        return self._transaction_type
+
+    def options(self) -> TypeDBOptions:
+        return self._options
+
+    def is_open(self) -> bool:
+        return self._bidirectional_stream.is_open()
+
+    def query(self) -> AsyncQueryManager:
+        return self._query_manager
+
+    def type_cache(self) -> _TypeCache:
+        return self._type_cache
+
+    async def execute(self, request: transaction_proto.Transaction.Req) -> transaction_proto.Transaction.Res:
+        return await self.run_query(request)
+
+    def run_query(self, request: transaction_proto.Transaction.Req) -> AsyncQueryFuture[transaction_proto.Transaction.Res]:
+        if not self.is_open():
+            self._raise_transaction_closed()
+        return self._bidirectional_stream.single(request)
+
+    def stream(self, request: transaction_proto.Transaction.Req) -> AsyncIterator[transaction_proto.Transaction.ResPart]:
+        if not self.is_open():
+            self._raise_transaction_closed()
+        return self._bidirectional_stream.stream(request)
+
+    def stream_void(self, request: transaction_proto.Transaction.Req) -> None:
+        if not self.is_open():
+            self._raise_transaction_closed()
+        self._bidirectional_stream.stream_void(request)
+
+    async def commit(self):
+        try:
+            await self.execute(transaction_commit_req())
+            if self._transaction_type.is_write():
+                self._invalidate_caches()
+        finally:
+            await self.close()
+
+    def _invalidate_caches(self):
+        cached_client = self._session.client().cached_client()
+        if cached_client is None:
+            return
+        database = self._session.database().name()
+        if self._session.session_type().is_schema():
+            cached_client.invalidate_schema_caches(database)
+        if cached_client.query_cache() is not None:
+            cached_client.query_cache().invalidate(database)
+
+    async def rollback(self):
+        await self.execute(transaction_rollback_req())
+
+    async def close(self):
+        await self._bidirectional_stream.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        if exc_tb is not None:
+            return False
+
+    def _raise_transaction_closed(self):
+        error = self._bidirectional_stream.get_error()
+        if error is None:
+            raise TypeDBClientException.of(TRANSACTION_CLOSED)
+        else:
+            raise TypeDBClientException.of(TRANSACTION_CLOSED_WITH_ERRORS, error)
@@ -0,0 +1,73 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, List
+
+from typedb.common.label import Label
+
+if TYPE_CHECKING:
+    import numpy
+
+
+class ConceptColumn(ABC):
+    """
+    The concepts bound to one variable across every answer of a query, stored as NumPy arrays with one entry per
+    answer. Requires the optional ``numpy`` dependency.
+    """
+
+    __slots__ = ()
+
+    @abstractmethod
+    def variable(self) -> str:
+        pass
+
+    @abstractmethod
+    def iids(self) -> "numpy.ndarray":
+        """
+        The IIDs of the things, as a fixed-width void array whose elements convert to bytes with ``tobytes()``.
+        Types and values have an all-zero IID.
+        """
+        pass
+
+    @abstractmethod
+    def type_codes(self) -> "numpy.ndarray":
+        """
+        For things, the index of their type in ``labels()``; for types, the index of their own label. Values have
+        code -1.
+        """
+        pass
+
+    @abstractmethod
+    def labels(self) -> List[Label]:
+        pass
+
+    @abstractmethod
+    def values(self) -> "numpy.ndarray":
+        """
+        The values of attributes and values. The array has a native dtype when every entry has the same value
+        type, and is an object array holding ``None`` for other concepts otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
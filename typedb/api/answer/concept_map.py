@@ -26,6 +26,8 @@ from typedb.api.concept.concept import Concept
 
 class ConceptMap(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def map(self) -> Mapping[str, Concept]:
         pass
@@ -50,6 +52,8 @@ class ConceptMap(ABC):
 
     class Explainables(ABC):
 
+        __slots__ = ()
+
         @abstractmethod
         def relation(self, variable: str) -> "ConceptMap.Explainable":
             pass
@@ -76,6 +80,8 @@ class ConceptMap(ABC):
 
     class Explainable(ABC):
 
+        __slots__ = ()
+
         @abstractmethod
         def conjunction(self) -> str:
             pass
@@ -27,6 +27,8 @@ from typedb.api.concept.concept import Concept
 
 class ConceptMapGroup(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def owner(self) -> Concept:
         pass
@@ -23,6 +23,8 @@ from abc import ABC, abstractmethod
 
 class Numeric(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def is_int(self) -> bool:
         pass
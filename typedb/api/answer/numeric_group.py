@@ -26,6 +26,8 @@ from typedb.api.concept.concept import Concept
 
 class NumericGroup(ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def owner(self) -> Concept:
         pass
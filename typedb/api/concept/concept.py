@@ -42,6 +42,8 @@ if TYPE_CHECKING:
 
 class Concept(ABC):
 
+    __slots__ = ()
+
     def is_type(self) -> bool:
         return False
 
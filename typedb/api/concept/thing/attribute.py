@@ -33,6 +33,8 @@ if TYPE_CHECKING:
 
 class Attribute(Thing, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_type(self) -> "AttributeType":
         pass
@@ -79,6 +81,8 @@ class RemoteAttribute(RemoteThing, Attribute, ABC):
 
 class BooleanAttribute(Attribute, ABC):
 
+    __slots__ = ()
+
     def is_boolean(self) -> bool:
         return True
 
@@ -101,6 +105,8 @@ class RemoteBooleanAttribute(RemoteAttribute, BooleanAttribute, ABC):
 
 class LongAttribute(Attribute, ABC):
 
+    __slots__ = ()
+
     def is_long(self) -> bool:
         return True
 
@@ -123,6 +129,8 @@ class RemoteLongAttribute(RemoteAttribute, LongAttribute, ABC):
 
 class DoubleAttribute(Attribute, ABC):
 
+    __slots__ = ()
+
     def is_double(self) -> bool:
         return True
 
@@ -145,6 +153,8 @@ class RemoteDoubleAttribute(RemoteAttribute, DoubleAttribute, ABC):
 
 class StringAttribute(Attribute, ABC):
 
+    __slots__ = ()
+
     def is_string(self) -> bool:
         return True
 
@@ -167,6 +177,8 @@ class RemoteStringAttribute(RemoteAttribute, StringAttribute, ABC):
 
 class DateTimeAttribute(Attribute, ABC):
 
+    __slots__ = ()
+
     def is_datetime(self) -> bool:
         return True
 
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
 
 class Entity(Thing, ABC):
 
+    __slots__ = ()
+
     def is_entity(self):
         return True
 
@@ -33,6 +33,8 @@ if TYPE_CHECKING:
 
 class Thing(Concept, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_iid(self) -> str:
         pass
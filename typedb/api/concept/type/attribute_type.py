@@ -34,6 +34,8 @@ if TYPE_CHECKING:
 
 class AttributeType(ThingType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> "ValueType":
         return ValueType.OBJECT
 
@@ -125,6 +127,8 @@ class RemoteAttributeType(RemoteThingType, AttributeType, ABC):
 
 class BooleanAttributeType(AttributeType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.BOOLEAN
 
@@ -161,6 +165,8 @@ class RemoteBooleanAttributeType(RemoteAttributeType, BooleanAttributeType, ABC)
 
 class LongAttributeType(AttributeType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.LONG
 
@@ -197,6 +203,8 @@ class RemoteLongAttributeType(RemoteAttributeType, LongAttributeType, ABC):
 
 class DoubleAttributeType(AttributeType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.DOUBLE
 
@@ -233,6 +241,8 @@ class RemoteDoubleAttributeType(RemoteAttributeType, DoubleAttributeType, ABC):
 
 class StringAttributeType(AttributeType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.STRING
 
@@ -277,6 +287,8 @@ class RemoteStringAttributeType(RemoteAttributeType, StringAttributeType, ABC):
 
 class DateTimeAttributeType(AttributeType, ABC):
 
+    __slots__ = ()
+
     def get_value_type(self) -> ValueType:
         return ValueType.DATETIME
 
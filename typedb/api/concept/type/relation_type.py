@@ -31,6 +31,8 @@ if TYPE_CHECKING:
 
 class RelationType(ThingType, ABC):
 
+    __slots__ = ()
+
     def is_relation_type(self) -> bool:
         return True
 
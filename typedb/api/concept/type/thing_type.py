@@ -35,6 +35,8 @@ if TYPE_CHECKING:
 
 class ThingType(Type, ABC):
 
+    __slots__ = ()
+
     def is_thing_type(self) -> bool:
         return True
 
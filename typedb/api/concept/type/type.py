@@ -30,6 +30,8 @@ if TYPE_CHECKING:
 
 class Type(Concept, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_label(self) -> Label:
         pass
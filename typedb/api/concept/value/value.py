@@ -30,6 +30,8 @@ from typedb.common.exception import TypeDBClientException, VALUE_HAS_NO_REMOTE
 
 class Value(Concept, ABC):
 
+    __slots__ = ()
+
     @abstractmethod
     def get_value_type(self) -> "ValueType":
         pass
@@ -68,6 +70,8 @@ class Value(Concept, ABC):
 
 class BooleanValue(Value, ABC):
 
+    __slots__ = ()
+
     def is_boolean(self) -> bool:
         return True
 
@@ -78,6 +82,8 @@ class BooleanValue(Value, ABC):
 
 class LongValue(Value, ABC):
 
+    __slots__ = ()
+
     def is_long(self) -> bool:
         return True
 
@@ -88,6 +94,8 @@ class LongValue(Value, ABC):
 
 class DoubleValue(Value, ABC):
 
+    __slots__ = ()
+
     def is_double(self) -> bool:
         return True
 
@@ -98,6 +106,8 @@ class DoubleValue(Value, ABC):
 
 class StringValue(Value, ABC):
 
+    __slots__ = ()
+
     def is_string(self) -> bool:
         return True
 
@@ -108,6 +118,8 @@ class StringValue(Value, ABC):
 
 class DateTimeValue(Value, ABC):
 
+    __slots__ = ()
+
     def is_datetime(self) -> bool:
         return True
 
@@ -18,12 +18,33 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+import enum
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from typedb.api.connection.database import DatabaseManager, ClusterDatabaseManager
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.connection.session import TypeDBSession, SessionType
 from typedb.api.connection.user import UserManager, User
+from typedb.api.query.query_cache import QueryCache
+
+
+class TransmitterMode(enum.Enum):
+    """
+    How a client batches the requests of its transactions into gRPC messages. BATCH_WINDOW flushes on a fixed 1-3ms
+    window. EVENT_DRIVEN flushes as soon as requests are queued, coalescing those that arrive within max_delay_seconds
+    of the previous flush into messages of at most max_batch requests. Both are client settings, 0.5ms and 128 by
+    default, and only apply to EVENT_DRIVEN.
+    """
+
+    BATCH_WINDOW = 0
+    EVENT_DRIVEN = 1
+
+    def is_batch_window(self):
+        return self is TransmitterMode.BATCH_WINDOW
+
+    def is_event_driven(self):
+        return self is TransmitterMode.EVENT_DRIVEN
 
 
 class TypeDBClient(ABC):
@@ -40,6 +61,10 @@ class TypeDBClient(ABC):
     def session(self, database: str, session_type: SessionType, options: TypeDBOptions = None) -> TypeDBSession:
         pass
 
+    @abstractmethod
+    def query_cache(self) -> Optional[QueryCache]:
+        pass
+
     @abstractmethod
     def is_cluster(self) -> bool:
         pass
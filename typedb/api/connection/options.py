@@ -22,6 +22,8 @@ from typing import Optional
 
 import typedb_protocol.common.options_pb2 as options_proto
 
+from typedb.common.exception import TypeDBClientException, NEGATIVE_VALUE_NOT_ALLOWED
+
 
 class TypeDBOptions:
 
@@ -35,6 +37,9 @@ class TypeDBOptions:
         self.session_idle_timeout_millis: Optional[int] = None
         self.transaction_timeout_millis: Optional[int] = None
         self.schema_lock_acquire_timeout_millis: Optional[int] = None
+        self.schema_cache: Optional[bool] = None
+        self.stream_buffer_size: Optional[int] = None
+        self.stream_buffer_bytes: Optional[int] = None
 
     @staticmethod
     def core() -> "TypeDBOptions":
@@ -110,6 +115,43 @@ class TypeDBOptions:
         self.schema_lock_acquire_timeout_millis = schema_lock_acquire_timeout_millis
         return self
 
+    def get_schema_cache(self) -> Optional[bool]:
+        return self.schema_cache
+
+    def set_schema_cache(self, schema_cache: bool):
+        """
+        Enables the client-side schema cache of a data session. This option is never sent to the server.
+        """
+        self.schema_cache = schema_cache
+        return self
+
+    def get_stream_buffer_size(self) -> Optional[int]:
+        return self.stream_buffer_size
+
+    def set_stream_buffer_size(self, stream_buffer_size: int):
+        """
+        Bounds the number of response parts a transaction buffers for each streamed query before it stops asking the
+        server for more. The server still completes its current batch, so up to one more batch of answers may arrive.
+        This option is never sent to the server.
+        """
+        if stream_buffer_size < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, stream_buffer_size)
+        self.stream_buffer_size = stream_buffer_size
+        return self
+
+    def get_stream_buffer_bytes(self) -> Optional[int]:
+        return self.stream_buffer_bytes
+
+    def set_stream_buffer_bytes(self, stream_buffer_bytes: int):
+        """
+        Like the stream buffer size, but bounds the serialised size of the buffered response parts of each streamed
+        query. This option is never sent to the server.
+        """
+        if stream_buffer_bytes < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, stream_buffer_bytes)
+        self.stream_buffer_bytes = stream_buffer_bytes
+        return self
+
     def proto(self) -> options_proto.Options:
         proto_options = options_proto.Options()
 
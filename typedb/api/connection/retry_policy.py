@@ -0,0 +1,89 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import random
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from typedb.common.exception import TypeDBClientException, ErrorMessage, CLUSTER_REPLICA_NOT_PRIMARY, \
+    UNABLE_TO_CONNECT, NEGATIVE_VALUE_NOT_ALLOWED
+
+
+class RetryPolicy(ABC):
+    """
+    Decides whether and when a cluster client retries an operation after it fails, e.g. against the primary replica
+    while a new primary is being elected, or against any replica while none can be reached.
+    """
+
+    @abstractmethod
+    def is_retryable(self, error: Optional[TypeDBClientException]) -> bool:
+        pass
+
+    @abstractmethod
+    def next_delay(self, attempt: int, elapsed_seconds: float) -> Optional[float]:
+        """
+        Returns how long to wait before retry number ``attempt + 1``, or None to give up. ``elapsed_seconds`` is the
+        time since the operation was first attempted.
+        """
+        pass
+
+
+class ExponentialBackoff(RetryPolicy):
+    """
+    Waits initial_delay_seconds before the first retry, multiplying the wait by multiplier up to max_delay_seconds,
+    and gives up after max_attempts retries or once max_elapsed_seconds have passed. With the defaults the elapsed
+    time is the limit that applies: even with the most jitter, 30 retries wait over 25s, so a failover is given at
+    least the 20s that the former fixed 2s wait between 10 retries allowed.
+    """
+
+    def __init__(self, initial_delay_seconds: float = 0.1, max_delay_seconds: float = 2.0, multiplier: float = 2.0,
+                 jitter: float = 0.5, max_attempts: int = 30, max_elapsed_seconds: float = 30.0,
+                 retryable_errors: Iterable[ErrorMessage] = (CLUSTER_REPLICA_NOT_PRIMARY, UNABLE_TO_CONNECT)):
+        if max_attempts < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, max_attempts)
+        self._initial_delay_seconds = initial_delay_seconds
+        self._max_delay_seconds = max_delay_seconds
+        self._multiplier = multiplier
+        self._jitter = min(max(jitter, 0.0), 1.0)
+        self._max_attempts = max_attempts
+        self._max_elapsed_seconds = max_elapsed_seconds
+        self._retryable_errors = list(retryable_errors)
+
+    def is_retryable(self, error: Optional[TypeDBClientException]) -> bool:
+        # A missing error means no primary replica has been elected yet, which is always worth waiting for.
+        return error is None or any(error.error_message is message for message in self._retryable_errors)
+
+    def next_delay(self, attempt: int, elapsed_seconds: float) -> Optional[float]:
+        if attempt >= self._max_attempts:
+            return None
+        delay = min(self._initial_delay_seconds * self._multiplier ** attempt, self._max_delay_seconds)
+        # Jitter spreads the retries of clients that saw the same failover, so they do not all retry in lockstep.
+        delay *= 1 - self._jitter * random.random()
+        if elapsed_seconds + delay > self._max_elapsed_seconds:
+            return None
+        return delay
+
+
+class FixedDelay(ExponentialBackoff):
+
+    def __init__(self, delay_seconds: float, max_attempts: int = 10,
+                 retryable_errors: Iterable[ErrorMessage] = (CLUSTER_REPLICA_NOT_PRIMARY, UNABLE_TO_CONNECT)):
+        super().__init__(delay_seconds, delay_seconds, multiplier=1.0, jitter=0.0, max_attempts=max_attempts,
+                         max_elapsed_seconds=float("inf"), retryable_errors=retryable_errors)
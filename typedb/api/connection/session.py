@@ -20,6 +20,7 @@
 #
 import enum
 from abc import ABC, abstractmethod
+from typing import Callable
 
 import typedb_protocol.common.session_pb2 as session_proto
 
@@ -64,6 +65,13 @@ class TypeDBSession(ABC):
     def transaction(self, transaction_type: TransactionType, options: TypeDBOptions = None) -> TypeDBTransaction:
         pass
 
+    @abstractmethod
+    def on_close(self, function: Callable[[], None]) -> None:
+        """
+        Registers a function to run once the session closes, whether it is closed by the user or found dead by a pulse.
+        """
+        pass
+
     @abstractmethod
     def close(self) -> None:
         pass
@@ -21,7 +21,7 @@
 
 import enum
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 
@@ -31,6 +31,11 @@ from typedb.api.connection.options import TypeDBOptions
 from typedb.api.query.future import QueryFuture
 from typedb.api.query.query_manager import QueryManager
 
+if TYPE_CHECKING:
+    from typedb.concept.proto.type_cache import _TypeCache
+    from typedb.connection.schema_cache import _SchemaCache
+    from typedb.query.query_cache import _QueryCache
+
 
 class TransactionType(enum.Enum):
     READ = 0
@@ -106,3 +111,31 @@ class _TypeDBTransactionExtended(TypeDBTransaction, ABC):
     @abstractmethod
     def stream(self, request: transaction_proto.Transaction.Req) -> Iterator[transaction_proto.Transaction.ResPart]:
         pass
+
+    @abstractmethod
+    def stream_void(self, request: transaction_proto.Transaction.Req) -> None:
+        pass
+
+    @abstractmethod
+    def type_cache(self) -> "_TypeCache":
+        pass
+
+    @abstractmethod
+    def schema_cache(self) -> Optional["_SchemaCache"]:
+        pass
+
+    @abstractmethod
+    def schema_cache_generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def query_cache(self) -> Optional["_QueryCache"]:
+        pass
+
+    @abstractmethod
+    def query_cache_generation(self) -> int:
+        pass
+
+    @abstractmethod
+    def database_name(self) -> str:
+        pass
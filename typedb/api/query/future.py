@@ -19,7 +19,10 @@
 # under the License.
 #
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Callable
+from concurrent import futures
+from concurrent.futures import Future
+from threading import Lock
+from typing import TypeVar, Generic, Callable, Iterable, Iterator, Optional, Set, Tuple
 
 T = TypeVar('T')
 U = TypeVar('U')
@@ -34,12 +37,59 @@ class QueryFuture(Generic[T], ABC):
     def map(self, function: Callable[[T], U]) -> "QueryFuture[U]":
         return _MappedQueryFuture(self, function)
 
+    @abstractmethod
+    def as_future(self) -> "Future[T]":
+        """
+        Returns the concurrent.futures.Future that completes with the answer of this query, so that it can be waited
+        on with a timeout, combined with other futures or given callbacks. Repeated calls return the same future.
+        """
+        pass
+
+    def done(self) -> bool:
+        return self.as_future().done()
+
+    def add_done_callback(self, callback: Callable[["QueryFuture[T]"], None]) -> None:
+        self.as_future().add_done_callback(lambda _: callback(self))
+
+    @staticmethod
+    def wait(query_futures: Iterable["QueryFuture"], timeout: Optional[float] = None,
+             return_when: str = futures.ALL_COMPLETED) -> Tuple[Set["QueryFuture"], Set["QueryFuture"]]:
+        by_future = {query_future.as_future(): query_future for query_future in query_futures}
+        done, not_done = futures.wait(by_future, timeout, return_when)
+        return {by_future[future] for future in done}, {by_future[future] for future in not_done}
+
+    @staticmethod
+    def as_completed(query_futures: Iterable["QueryFuture"], timeout: Optional[float] = None) -> Iterator["QueryFuture"]:
+        by_future = {query_future.as_future(): query_future for query_future in query_futures}
+        return (by_future[future] for future in futures.as_completed(by_future, timeout))
+
 
 class _MappedQueryFuture(Generic[T, U], QueryFuture[U]):
 
     def __init__(self, query_future: QueryFuture[T], function: Callable[[T], U]):
         self._query_future = query_future
         self._function = function
+        self._future: Optional[Future] = None
+        self._future_lock = Lock()
 
     def get(self) -> U:
+        if self._future is not None:
+            return self._future.result()
         return self._function(self._query_future.get())
+
+    def as_future(self) -> "Future[U]":
+        with self._future_lock:
+            if self._future is None:
+                future = Future()
+                future.set_running_or_notify_cancel()
+                self._query_future.as_future().add_done_callback(
+                    lambda inner: _resolve(future, lambda: self._function(inner.result())))
+                self._future = future
+            return self._future
+
+
+def _resolve(future: Future, get: Callable[[], T]) -> None:
+    try:
+        future.set_result(get())
+    except BaseException as e:
+        future.set_exception(e)
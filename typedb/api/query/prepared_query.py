@@ -0,0 +1,75 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from abc import ABC, abstractmethod
+from typing import Iterator, Tuple
+
+from typedb.api.answer.concept_map import ConceptMap
+from typedb.api.answer.concept_map_group import ConceptMapGroup
+from typedb.api.answer.numeric import Numeric
+from typedb.api.answer.numeric_group import NumericGroup
+from typedb.api.query.future import QueryFuture
+
+
+class PreparedQuery(ABC):
+    """
+    A query template whose parameters, written as ~name, are bound to values on each run. Strings, booleans, integers,
+    floats, dates and naive datetimes are written into the query as TypeQL literals.
+    """
+
+    @abstractmethod
+    def template(self) -> str:
+        pass
+
+    @abstractmethod
+    def parameters(self) -> Tuple[str, ...]:
+        pass
+
+    @abstractmethod
+    def match(self, **parameters) -> Iterator[ConceptMap]:
+        pass
+
+    @abstractmethod
+    def match_aggregate(self, **parameters) -> QueryFuture[Numeric]:
+        pass
+
+    @abstractmethod
+    def match_group(self, **parameters) -> Iterator[ConceptMapGroup]:
+        pass
+
+    @abstractmethod
+    def match_group_aggregate(self, **parameters) -> Iterator[NumericGroup]:
+        pass
+
+    @abstractmethod
+    def insert(self, **parameters) -> Iterator[ConceptMap]:
+        pass
+
+    @abstractmethod
+    def insert_void(self, **parameters) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, **parameters) -> QueryFuture:
+        pass
+
+    @abstractmethod
+    def update(self, **parameters) -> Iterator[ConceptMap]:
+        pass
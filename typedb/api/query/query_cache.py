@@ -0,0 +1,57 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class QueryCache(ABC):
+
+    @abstractmethod
+    def hits(self) -> int:
+        pass
+
+    @abstractmethod
+    def misses(self) -> int:
+        pass
+
+    @abstractmethod
+    def evictions(self) -> int:
+        pass
+
+    @abstractmethod
+    def size_bytes(self) -> int:
+        pass
+
+    @abstractmethod
+    def max_bytes(self) -> int:
+        pass
+
+    @abstractmethod
+    def ttl_seconds(self) -> float:
+        pass
+
+    @abstractmethod
+    def invalidate(self, database: Optional[str] = None) -> None:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
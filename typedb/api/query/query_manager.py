@@ -19,8 +19,9 @@
 # under the License.
 #
 from abc import ABC, abstractmethod
-from typing import Iterator
+from typing import Iterable, Iterator, Mapping
 
+from typedb.api.answer.concept_column import ConceptColumn
 from typedb.api.answer.concept_map import ConceptMap
 from typedb.api.answer.concept_map_group import ConceptMapGroup
 from typedb.api.answer.numeric import Numeric
@@ -28,6 +29,7 @@ from typedb.api.answer.numeric_group import NumericGroup
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.logic.explanation import Explanation
 from typedb.api.query.future import QueryFuture
+from typedb.api.query.prepared_query import PreparedQuery
 
 
 class QueryManager(ABC):
@@ -36,6 +38,15 @@ class QueryManager(ABC):
     def match(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMap]:
         pass
 
+    @abstractmethod
+    def match_columnar(self, query: str, columns: Iterable[str] = None,
+                       options: TypeDBOptions = None) -> Mapping[str, ConceptColumn]:
+        """
+        Runs a match query and decodes all of its answers into one NumPy-backed column per variable, without creating
+        a Concept for each row. If no columns are given, every variable of the answers is returned.
+        """
+        pass
+
     @abstractmethod
     def match_aggregate(self, query: str, options: TypeDBOptions = None) -> QueryFuture[Numeric]:
         pass
@@ -52,6 +63,14 @@ class QueryManager(ABC):
     def insert(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMap]:
         pass
 
+    @abstractmethod
+    def insert_void(self, query: str, options: TypeDBOptions = None) -> None:
+        """
+        Sends an insert query without waiting for, or keeping, its answers. Many such inserts can be in flight at once;
+        if one fails, the transaction is closed and the error is raised by the commit.
+        """
+        pass
+
     @abstractmethod
     def delete(self, query: str, options: TypeDBOptions = None) -> QueryFuture:
         pass
@@ -71,3 +90,11 @@ class QueryManager(ABC):
     @abstractmethod
     def undefine(self, query: str, options: TypeDBOptions = None) -> QueryFuture:
         pass
+
+    @abstractmethod
+    def prepare(self, template: str, options: TypeDBOptions = None) -> PreparedQuery:
+        """
+        Parses a query template once, so that running it with different parameter values only substitutes them into
+        the template and copies a request built ahead of time.
+        """
+        pass
@@ -0,0 +1,183 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from threading import Lock
+from typing import Callable, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Union
+
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import TypeDBSession
+from typedb.api.connection.transaction import TransactionType
+from typedb.common.exception import TypeDBClientException, BULK_LOAD_BATCH_FAILED, NEGATIVE_VALUE_NOT_ALLOWED, \
+    UNABLE_TO_CONNECT, CLUSTER_REPLICA_NOT_PRIMARY, UNKNOWN_QUERY_PARAMETER
+from typedb.query.prepared_query import _QueryTemplate
+
+
+class LoadReport:
+
+    def __init__(self):
+        self._lock = Lock()
+        self._queries = 0
+        self._batches = 0
+        self._retries = 0
+        self._start = time.monotonic()
+        self._end: Optional[float] = None
+
+    def queries(self) -> int:
+        return self._queries
+
+    def batches(self) -> int:
+        return self._batches
+
+    def retries(self) -> int:
+        return self._retries
+
+    def elapsed_seconds(self) -> float:
+        return (self._end if self._end is not None else time.monotonic()) - self._start
+
+    def queries_per_second(self) -> float:
+        elapsed = self.elapsed_seconds()
+        return self._queries / elapsed if elapsed > 0 else 0.0
+
+    def _record_batch(self, queries: int):
+        with self._lock:
+            self._queries += queries
+            self._batches += 1
+
+    def _record_retry(self):
+        with self._lock:
+            self._retries += 1
+
+    def _finish(self):
+        self._end = time.monotonic()
+
+    def __str__(self):
+        return "LoadReport[queries: %d, batches: %d, retries: %d, elapsed: %.3fs, throughput: %.1f queries/s]" % (
+            self._queries, self._batches, self._retries, self.elapsed_seconds(), self.queries_per_second())
+
+
+class BulkLoader:
+    """
+    Loads a stream of insert queries through a data session. Queries are grouped into batches, each committed in its
+    own write transaction, and several batches are loaded concurrently. Inserts are sent as void inserts, so the
+    client's RequestTransmitter ships them together and their answers are never waited on.
+
+    A batch that fails because the server could not be reached, or was not the primary replica, is retried from
+    scratch in a new transaction; any other error fails the load. Retries are at-least-once: a commit whose response
+    was lost may already have been applied, so a retried batch can insert its data twice unless its queries are
+    idempotent.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    DEFAULT_PARALLELISM = 4
+    DEFAULT_MAX_RETRIES = 3
+    RETRY_BACKOFF_SECONDS = 0.1
+    RETRYABLE_ERRORS = (UNABLE_TO_CONNECT, CLUSTER_REPLICA_NOT_PRIMARY)
+
+    def __init__(self, session: TypeDBSession, batch_size: int = DEFAULT_BATCH_SIZE,
+                 parallelism: int = DEFAULT_PARALLELISM, max_retries: int = DEFAULT_MAX_RETRIES,
+                 options: TypeDBOptions = None, on_batch: Callable[[LoadReport], None] = None):
+        if batch_size < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, batch_size)
+        if parallelism < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, parallelism)
+        self._session = session
+        self._batch_size = batch_size
+        self._parallelism = parallelism
+        self._max_retries = max(max_retries, 0)
+        self._options = options
+        self._on_batch = on_batch
+
+    def load(self, queries: Iterable[str]) -> LoadReport:
+        report = LoadReport()
+        batches = self._batches(queries)
+        in_flight: Set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self._parallelism) as executor:
+            try:
+                for index, batch in enumerate(batches):
+                    # Only read ahead as many batches as can run, so arbitrarily large inputs are never materialised
+                    if len(in_flight) >= self._parallelism:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+                    in_flight.add(executor.submit(self._load_batch, index, batch, report))
+                for future in in_flight:
+                    future.result()
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+            finally:
+                report._finish()
+        return report
+
+    def load_rows(self, template: str, rows: Iterable[Union[Mapping[str, object], Sequence[object]]]) -> LoadReport:
+        """
+        Loads one insert query per row, built from a template with ``~name`` parameters as in
+        ``QueryManager.prepare``. A mapping row binds its values by name; a sequence row binds its values to the
+        parameters in the order they first appear in the template. Values are written as quoted and escaped TypeQL
+        literals.
+        """
+        query_template = _QueryTemplate(template)
+        return self.load(query_template.format(self._bind(query_template, row)) for row in rows)
+
+    @staticmethod
+    def _bind(query_template: _QueryTemplate, row: Union[Mapping[str, object], Sequence[object]]) -> Mapping[str, object]:
+        if isinstance(row, Mapping):
+            return row
+        parameters = query_template.parameters()
+        if len(row) > len(parameters):
+            raise TypeDBClientException.of(UNKNOWN_QUERY_PARAMETER, "#%d" % len(parameters))
+        return dict(zip(parameters, row))
+
+    def _batches(self, queries: Iterable[str]) -> Iterator[List[str]]:
+        iterator = iter(queries)
+        while True:
+            batch = list(islice(iterator, self._batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _load_batch(self, index: int, batch: List[str], report: LoadReport) -> None:
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._write(batch)
+                break
+            except TypeDBClientException as e:
+                if not any(e.error_message is message for message in self.RETRYABLE_ERRORS):
+                    raise TypeDBClientException.of(BULK_LOAD_BATCH_FAILED, (index, attempt, e))
+                if attempt > self._max_retries:
+                    raise TypeDBClientException.of(BULK_LOAD_BATCH_FAILED, (index, attempt, e))
+                report._record_retry()
+                time.sleep(self.RETRY_BACKOFF_SECONDS * attempt)
+        report._record_batch(len(batch))
+        if self._on_batch:
+            self._on_batch(report)
+
+    def _write(self, batch: List[str]) -> None:
+        with self._session.transaction(TransactionType.WRITE, self._options) as tx:
+            for query in batch:
+                tx.query().insert_void(query)
+            tx.commit()
@@ -21,9 +21,12 @@
 
 from typedb.connection.cluster.client import _ClusterClient
 from typedb.connection.core.client import _CoreClient
+from typedb.query.query_cache import _QueryCache
+from typedb.stream.request_transmitter import EVENT_DRIVEN_MAX_BATCH_SIZE, EVENT_DRIVEN_MAX_DELAY_SECS
 
 # Repackaging these symbols allows them to be imported from "typedb.client"
 
+from typedb.api.answer.concept_column import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.concept_map import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.concept_map_group import *  # noqa # pylint: disable=unused-import
 from typedb.api.answer.numeric import *  # noqa # pylint: disable=unused-import
@@ -48,6 +51,7 @@ from typedb.api.connection.client import *
 from typedb.api.connection.credential import *
 from typedb.api.connection.database import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.options import *  # noqa # pylint: disable=unused-import
+from typedb.api.connection.retry_policy import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.session import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.transaction import *  # noqa # pylint: disable=unused-import
 from typedb.api.connection.user import *  # noqa # pylint: disable=unused-import
@@ -56,6 +60,8 @@ from typedb.api.logic.explanation import *  # noqa # pylint: disable=unused-impo
 from typedb.api.logic.logic_manager import *  # noqa # pylint: disable=unused-import
 from typedb.api.logic.rule import *  # noqa # pylint: disable=unused-import
 
+from typedb.api.query.query_cache import *  # noqa # pylint: disable=unused-import
+from typedb.api.query.prepared_query import *  # noqa # pylint: disable=unused-import
 from typedb.api.query.query_manager import *  # noqa # pylint: disable=unused-import
 
 from typedb.common.exception import *  # noqa # pylint: disable=unused-import
@@ -66,13 +72,30 @@ class TypeDB:
     DEFAULT_ADDRESS = "localhost:1729"
 
     @staticmethod
-    def core_client(address: str, parallelisation: int = 2) -> TypeDBClient:
-        return _CoreClient(address, parallelisation)
+    def core_client(address: str, parallelisation: int = 2,
+                    transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW,
+                    reader_thread: bool = False, query_cache_max_bytes: int = 0,
+                    query_cache_ttl_seconds: float = 60.0, max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE,
+                    max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS) -> TypeDBClient:
+        return _CoreClient(address, parallelisation, transmitter_mode, reader_thread,
+                           TypeDB._query_cache(query_cache_max_bytes, query_cache_ttl_seconds), max_batch, max_delay_seconds)
 
     @staticmethod
     def cluster_client(addresses: Union[Iterable[str], str], credential: TypeDBCredential,
-                       parallelisation: int = 2) -> TypeDBClusterClient:
+                       parallelisation: int = 2,
+                       transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW,
+                       reader_thread: bool = False, query_cache_max_bytes: int = 0,
+                       query_cache_ttl_seconds: float = 60.0, retry_policy: RetryPolicy = None,
+                       max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE,
+                       max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS) -> TypeDBClusterClient:
+        query_cache = TypeDB._query_cache(query_cache_max_bytes, query_cache_ttl_seconds)
         if isinstance(addresses, str):
-            return _ClusterClient([addresses], credential, parallelisation)
+            return _ClusterClient([addresses], credential, parallelisation, transmitter_mode, reader_thread, query_cache, retry_policy,
+                                  max_batch, max_delay_seconds)
         else:
-            return _ClusterClient(addresses, credential, parallelisation)
+            return _ClusterClient(addresses, credential, parallelisation, transmitter_mode, reader_thread, query_cache, retry_policy,
+                                  max_batch, max_delay_seconds)
+
+    @staticmethod
+    def _query_cache(max_bytes: int, ttl_seconds: float) -> Optional[_QueryCache]:
+        return _QueryCache(max_bytes, ttl_seconds) if max_bytes > 0 else None
@@ -0,0 +1,103 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import time
+from threading import Condition, Thread
+from typing import Callable, Dict, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class FanOut(Generic[T]):
+    """
+    Makes the same call to several servers at once, each on its own daemon thread, so that an unreachable server costs
+    at most deadline_seconds instead of a full connection timeout. Calls still running when the deadline passes are
+    abandoned, and are reported in errors() as timed out.
+    """
+
+    def __init__(self, call: Callable[[str], T], addresses: Iterable[str], deadline_seconds: Optional[float] = None):
+        self._addresses = list(addresses)
+        self._deadline = time.monotonic() + deadline_seconds if deadline_seconds is not None else None
+        self._deadline_seconds = deadline_seconds
+        self._results: Dict[str, T] = {}
+        self._errors: Dict[str, Exception] = {}
+        self._arrivals = []
+        self._condition = Condition()
+        for address in self._addresses:
+            Thread(target=self._call, args=(call, address), name="typedb-fan-out", daemon=True).start()
+
+    def first(self, accept: Callable[[T], bool] = lambda result: True) -> Optional[T]:
+        """
+        Returns the first result that ``accept`` approves as soon as it arrives. If none does, returns the last
+        result to arrive, or None if every call failed.
+        """
+        seen = 0
+        while True:
+            with self._condition:
+                while seen == len(self._arrivals) and self._wait():
+                    pass
+                arrivals = self._arrivals[seen:]
+                finished = self._is_finished()
+            for address in arrivals:
+                if address in self._results and accept(self._results[address]):
+                    return self._results[address]
+            seen += len(arrivals)
+            if finished:
+                return next((self._results[address] for address in reversed(self._arrivals) if address in self._results), None)
+
+    def all(self) -> Dict[str, T]:
+        with self._condition:
+            while self._wait():
+                pass
+            return dict(self._results)
+
+    def errors(self) -> Dict[str, Exception]:
+        with self._condition:
+            errors = dict(self._errors)
+            for address in self._addresses:
+                if address not in self._results and address not in errors and self._deadline is not None:
+                    errors[address] = TimeoutError("No response within %.3fs" % self._deadline_seconds)
+            return errors
+
+    def _call(self, call: Callable[[str], T], address: str) -> None:
+        try:
+            result = call(address)
+            with self._condition:
+                self._results[address] = result
+        except Exception as e:
+            with self._condition:
+                self._errors[address] = e
+        with self._condition:
+            self._arrivals.append(address)
+            self._condition.notify_all()
+
+    def _wait(self) -> bool:
+        # Waits for the next call to finish; returns False once all have finished or the deadline has passed.
+        if self._is_finished():
+            return False
+        remaining = self._deadline - time.monotonic() if self._deadline is not None else None
+        if remaining is not None and remaining <= 0:
+            return False
+        self._condition.wait(remaining)
+        return not self._is_finished()
+
+    def _is_finished(self) -> bool:
+        return len(self._arrivals) == len(self._addresses) or \
+            (self._deadline is not None and time.monotonic() >= self._deadline)
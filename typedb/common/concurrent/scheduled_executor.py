@@ -18,53 +18,23 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-import sched
-import time
-from threading import Thread
 from typing import Callable, List
 
+from typedb.common.concurrent.timer_service import TimerService
+
 
 class ScheduledExecutor:
 
-    def __init__(self):
-        self._tasks: List[ScheduledExecutor.FixedRateTask] = []
+    def __init__(self, timer_service: TimerService = None):
+        self._timer_service = timer_service or TimerService.shared()
+        self._tasks: List[TimerService.Task] = []
+
+    def schedule_at_fixed_rate(self, interval: float, action: Callable):
+        self._tasks.append(self._timer_service.schedule_at_fixed_rate(interval, action))
 
-    def schedule_at_fixed_rate(self, interval: float, action: Callable, thread_name: str = None):
-        task = ScheduledExecutor.FixedRateTask(interval, action, thread_name)
-        self._tasks.append(task)
-        task.start()
+    def execute(self, action: Callable, *args):
+        return self._timer_service.execute(action, *args)
 
     def shutdown(self):
         for task in self._tasks:
             task.cancel()
-
-    class FixedRateTask:
-
-        def __init__(self, interval: float, action: Callable, thread_name: str):
-            self._scheduler = sched.scheduler(time.time, time.sleep)
-            self._interval = interval
-            self._action = action
-            self._thread_name = thread_name
-            self._scheduled_activity = None
-            self._cancelled = False
-
-        def start(self):
-            self._schedule_run()
-            Thread(target=self._scheduler.run, name=self._thread_name, daemon=True).start()
-
-        def _schedule_run(self):
-            self._scheduled_activity = self._scheduler.enter(delay=self._interval, priority=1, action=self._on_tick)
-
-        def _on_tick(self):
-            if self._cancelled:
-                return
-            self._schedule_run()
-            try:
-                self._action()
-            except Exception as e:
-                print(e)
-
-        def cancel(self):
-            self._cancelled = True
-            if self._scheduled_activity:
-                self._scheduler.cancel(self._scheduled_activity)
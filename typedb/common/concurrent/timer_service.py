@@ -0,0 +1,133 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import heapq
+import itertools
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Condition, Lock, Thread
+from typing import Callable, List, Optional, Tuple
+
+
+class TimerService:
+    """
+    Runs delayed and fixed-rate actions for every client in the process. One thread keeps the pending deadlines in a
+    heap and hands due actions to a small worker pool, so a slow action delays neither the timer nor other actions.
+    """
+
+    _SHARED_WORKERS = 8
+    _shared: Optional["TimerService"] = None
+    _shared_lock = Lock()
+
+    @staticmethod
+    def shared() -> "TimerService":
+        with TimerService._shared_lock:
+            if TimerService._shared is None:
+                TimerService._shared = TimerService(TimerService._SHARED_WORKERS)
+            return TimerService._shared
+
+    def __init__(self, workers: int, thread_name: str = "typedb-timer"):
+        self._workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name + "-worker")
+        self._thread_name = thread_name
+        self._heap: List[Tuple[float, int, TimerService.Task]] = []
+        self._sequence = itertools.count()
+        self._condition = Condition()
+        self._thread: Optional[Thread] = None
+        self._is_open = True
+
+    def schedule(self, delay: float, action: Callable[[], None]) -> "TimerService.Task":
+        task = TimerService.Task(self, action, interval=None)
+        self._enqueue(time.monotonic() + delay, task)
+        return task
+
+    def schedule_at_fixed_rate(self, interval: float, action: Callable[[], None]) -> "TimerService.Task":
+        task = TimerService.Task(self, action, interval)
+        self._enqueue(time.monotonic() + interval, task)
+        return task
+
+    def execute(self, action: Callable, *args) -> Future:
+        return self._workers.submit(action, *args)
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._is_open = False
+            self._heap.clear()
+            self._condition.notify_all()
+        self._workers.shutdown(wait=False)
+
+    def _enqueue(self, deadline: float, task: "TimerService.Task") -> None:
+        with self._condition:
+            if not self._is_open:
+                return
+            heapq.heappush(self._heap, (deadline, next(self._sequence), task))
+            if self._thread is None:
+                self._thread = Thread(target=self._run, name=self._thread_name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while self._is_open and (not self._heap or self._heap[0][0] > time.monotonic()):
+                    self._condition.wait(self._heap[0][0] - time.monotonic() if self._heap else None)
+                if not self._is_open:
+                    return
+                deadline, _, task = heapq.heappop(self._heap)
+            if task.is_cancelled():
+                continue
+            if task.interval is not None:
+                self._enqueue(max(deadline + task.interval, time.monotonic()), task)
+            task.fire()
+
+    class Task:
+
+        def __init__(self, service: "TimerService", action: Callable[[], None], interval: Optional[float]):
+            self._service = service
+            self._action = action
+            self.interval = interval
+            self._cancelled = False
+            self._running = False
+            self._lock = Lock()
+
+        def fire(self) -> None:
+            with self._lock:
+                # A fixed-rate action still running from its previous tick skips this one rather than piling up.
+                if self._running or self._cancelled:
+                    return
+                self._running = True
+            try:
+                self._service.execute(self._run)
+            except RuntimeError:  # The worker pool has been shut down.
+                self._running = False
+
+        def _run(self) -> None:
+            try:
+                self._action()
+            except Exception as e:
+                print(e)
+            finally:
+                with self._lock:
+                    self._running = False
+
+        def cancel(self) -> None:
+            self._cancelled = True
+
+        def is_cancelled(self) -> bool:
+            return self._cancelled
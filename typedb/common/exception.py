@@ -96,6 +96,15 @@ CLUSTER_USER_DOES_NOT_EXIST = ClientErrorMessage(16, "The user '%s' does not exi
 CLUSTER_TOKEN_CREDENTIAL_INVALID = ClientErrorMessage(17, "Invalid token credential.")
 CLUSTER_INVALID_ROOT_CA_PATH = ClientErrorMessage(18, "The provided Root CA path '%s' does not exist.")
 CLUSTER_CLIENT_CALLED_WITH_STRING = ClientErrorMessage(19, "The first argument of TypeDBClient.cluster() must be a List of server addresses to connect to. It was called with a string, not a List, which is not allowed.")
+MISSING_OPTIONAL_DEPENDENCY = ClientErrorMessage(20, "The optional dependency '%s' is required for this operation, but it is not installed.")
+BULK_LOAD_BATCH_FAILED = ClientErrorMessage(21, "Bulk load batch %d failed after %d attempt(s):\n%s")
+MISSING_QUERY_PARAMETER = ClientErrorMessage(22, "The query parameter '%s' has no value.")
+UNKNOWN_QUERY_PARAMETER = ClientErrorMessage(23, "The query template has no parameter named '%s'.")
+INVALID_QUERY_PARAMETER = ClientErrorMessage(24, "The value '%s' of the query parameter '%s' cannot be written as a TypeQL literal.")
+SESSION_POOL_CLOSED = ClientErrorMessage(25, "The session pool has been closed and no further sessions can be borrowed.")
+SESSION_POOL_TIMEOUT = ClientErrorMessage(26, "Timed out after %.3fs waiting for a pooled %s session to the database '%s'.")
+CHANNEL_POOL_TIMEOUT = ClientErrorMessage(27, "Timed out after %.3fs waiting for a channel: all %d channels are in use by open transactions.")
+NON_POSITIVE_DURATION_NOT_ALLOWED = ClientErrorMessage(28, "Duration must be greater than 0 seconds, was: '%s'.")
 
 
 class ConceptErrorMessage(ErrorMessage):
@@ -23,6 +23,8 @@ from typing import Optional
 
 class Label:
 
+    __slots__ = ("_scope", "_name")
+
     def __init__(self, scope: Optional[str], name: str):
         self._scope = scope
         self._name = name
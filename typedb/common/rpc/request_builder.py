@@ -19,7 +19,6 @@
 # under the License.
 #
 from typing import List
-from uuid import UUID
 
 import typedb_protocol.cluster.cluster_database_pb2 as cluster_database_proto
 import typedb_protocol.cluster.cluster_server_pb2 as cluster_server_proto
@@ -179,9 +178,9 @@ def transaction_client_msg(reqs: List[transaction_proto.Transaction.Req]):
     return req
 
 
-def transaction_stream_req(req_id: UUID):
+def transaction_stream_req(req_id: bytes):
     req = transaction_proto.Transaction.Req()
-    req.req_id = req_id.bytes
+    req.req_id = req_id
     stream_req = transaction_proto.Transaction.Stream.Req()
     req.stream_req.CopyFrom(stream_req)
     return req
@@ -20,7 +20,7 @@
 #
 
 from abc import ABC
-from typing import Iterator
+from typing import Iterator, Optional
 from typing import TypeVar, Callable
 
 import typedb_protocol.common.connection_pb2 as connection_proto
@@ -58,8 +58,9 @@ class TypeDBStub(ABC):
     def session_close(self, req: session_proto.Session.Close.Req) -> session_proto.Session.Close.Res:
         return self.resilient_call(lambda: self.stub().session_close(req))
 
-    def session_pulse(self, req: session_proto.Session.Pulse.Req) -> session_proto.Session.Pulse.Res:
-        return self.resilient_call(lambda: self.stub().session_pulse(req))
+    def session_pulse(self, req: session_proto.Session.Pulse.Req,
+                      timeout: Optional[float] = None) -> session_proto.Session.Pulse.Res:
+        return self.resilient_call(lambda: self.stub().session_pulse(req, timeout=timeout))
 
     def transaction(self, request_iterator: Iterator[transaction_proto.Transaction.Client]) -> Iterator[transaction_proto.Transaction.Server]:
         return self.resilient_call(lambda: self.stub().transaction(request_iterator))
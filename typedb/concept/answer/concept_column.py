@@ -0,0 +1,181 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import typedb_protocol.common.answer_pb2 as answer_proto
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+from typedb.api.answer.concept_column import ConceptColumn
+from typedb.common.exception import TypeDBClientException, MISSING_OPTIONAL_DEPENDENCY, VARIABLE_DOES_NOT_EXIST
+from typedb.common.label import Label
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise TypeDBClientException.of(MISSING_OPTIONAL_DEPENDENCY, "numpy")
+    return numpy
+
+
+_ATTRIBUTE_TYPE = concept_proto.Type.Encoding.Value("ATTRIBUTE_TYPE")
+_DATETIME = concept_proto.ValueType.Value("DATETIME")
+
+_VALUE_READERS = {
+    concept_proto.ValueType.Value("BOOLEAN"): lambda value: value.boolean,
+    concept_proto.ValueType.Value("LONG"): lambda value: value.long,
+    concept_proto.ValueType.Value("DOUBLE"): lambda value: value.double,
+    concept_proto.ValueType.Value("STRING"): lambda value: value.string,
+    _DATETIME: lambda value: value.date_time,
+}
+
+_VALUE_DTYPES = {
+    concept_proto.ValueType.Value("BOOLEAN"): "bool",
+    concept_proto.ValueType.Value("LONG"): "int64",
+    concept_proto.ValueType.Value("DOUBLE"): "float64",
+    concept_proto.ValueType.Value("STRING"): "object",
+    _DATETIME: "datetime64[ms]",
+}
+
+
+class _ConceptColumn(ConceptColumn):
+
+    __slots__ = ("_variable", "_iids", "_type_codes", "_labels", "_values")
+
+    def __init__(self, variable: str, iids, type_codes, labels: List[Label], values):
+        self._variable = variable
+        self._iids = iids
+        self._type_codes = type_codes
+        self._labels = labels
+        self._values = values
+
+    def variable(self) -> str:
+        return self._variable
+
+    def iids(self):
+        return self._iids
+
+    def type_codes(self):
+        return self._type_codes
+
+    def labels(self) -> List[Label]:
+        return self._labels
+
+    def values(self):
+        return self._values
+
+    def __len__(self) -> int:
+        return len(self._iids)
+
+    def __str__(self):
+        return "%s[%s: %d rows]" % (type(self).__name__, self._variable, len(self))
+
+
+class _ColumnBuilder:
+
+    __slots__ = ("_variable", "_iids", "_type_codes", "_codes_by_label", "_labels", "_values", "_value_types")
+
+    def __init__(self, variable: str):
+        self._variable = variable
+        self._iids: List[bytes] = []
+        self._type_codes: List[int] = []
+        self._codes_by_label: Dict[Tuple[str, str], int] = {}
+        self._labels: List[Label] = []
+        self._values: list = []
+        self._value_types: List[Optional[int]] = []
+
+    def add(self, proto_concept: concept_proto.Concept) -> None:
+        concept_case = proto_concept.WhichOneof("concept")
+        if concept_case == "thing":
+            proto_thing = proto_concept.thing
+            proto_type = proto_thing.type
+            self._iids.append(proto_thing.iid)
+            self._type_codes.append(self._code(proto_type))
+            if proto_type.encoding == _ATTRIBUTE_TYPE:
+                self._add_value(proto_type.value_type, proto_thing.value)
+            else:
+                self._add_value(None, None)
+        elif concept_case == "type":
+            self._iids.append(b"")
+            self._type_codes.append(self._code(proto_concept.type))
+            self._add_value(None, None)
+        else:
+            proto_value = proto_concept.value
+            self._iids.append(b"")
+            self._type_codes.append(-1)
+            self._add_value(proto_value.value_type, proto_value.value)
+
+    def _code(self, proto_type: concept_proto.Type) -> int:
+        key = (proto_type.scope, proto_type.label)
+        code = self._codes_by_label.get(key)
+        if code is None:
+            code = len(self._labels)
+            self._codes_by_label[key] = code
+            self._labels.append(Label.of(*key) if proto_type.scope else Label.of(proto_type.label))
+        return code
+
+    def _add_value(self, value_type: Optional[int], proto_value: Optional[concept_proto.ConceptValue]) -> None:
+        self._value_types.append(value_type)
+        self._values.append(None if value_type is None else _VALUE_READERS[value_type](proto_value))
+
+    def build(self, numpy) -> _ConceptColumn:
+        # A void dtype keeps IIDs intact: the "S" dtype drops trailing zero bytes when reading an element
+        width = max((len(iid) for iid in self._iids), default=0)
+        iids = numpy.array(self._iids, dtype="V%d" % max(width, 1))
+        type_codes = numpy.array(self._type_codes, dtype="int32")
+        value_types = set(self._value_types)
+        if len(value_types) == 1 and None not in value_types:
+            values = numpy.array(self._values, dtype=_VALUE_DTYPES[value_types.pop()])
+        else:
+            values = numpy.empty(len(self._values), dtype=object)
+            values[:] = [datetime.utcfromtimestamp(float(value) / 1000.0) if value_type == _DATETIME else value
+                         for value_type, value in zip(self._value_types, self._values)]
+        return _ConceptColumn(self._variable, iids, type_codes, self._labels, values)
+
+
+class _ConceptColumnsCollector:
+    """
+    Decodes the answers of a match query straight into per-variable columns, without building a Concept per row.
+    """
+
+    def __init__(self, variables: Optional[Iterable[str]] = None):
+        self._numpy = _numpy()
+        self._variables: Optional[List[str]] = list(variables) if variables is not None else None
+        self._builders: Dict[str, _ColumnBuilder] = {}
+
+    def add_all(self, answers: Iterable[answer_proto.ConceptMap]) -> None:
+        for answer in answers:
+            if self._variables is None:
+                self._variables = sorted(answer.map)
+            if not self._builders:
+                self._builders = {variable: _ColumnBuilder(variable) for variable in self._variables}
+            proto_map = answer.map
+            for variable, builder in self._builders.items():
+                if variable not in proto_map:
+                    raise TypeDBClientException.of(VARIABLE_DOES_NOT_EXIST, variable)
+                builder.add(proto_map[variable])
+
+    def columns(self) -> Dict[str, ConceptColumn]:
+        if not self._builders:
+            self._builders = {variable: _ColumnBuilder(variable) for variable in self._variables or []}
+        return {variable: builder.build(self._numpy) for variable, builder in self._builders.items()}
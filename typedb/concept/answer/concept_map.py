@@ -19,29 +19,33 @@
 # under the License.
 #
 
-from typing import Mapping, Dict, Tuple
+from typing import Iterator, Mapping, Dict, Tuple
 
 import typedb_protocol.common.answer_pb2 as answer_proto
+import typedb_protocol.common.concept_pb2 as concept_proto
 
 from typedb.api.answer.concept_map import ConceptMap
 from typedb.api.concept.concept import Concept
 from typedb.common.exception import TypeDBClientException, VARIABLE_DOES_NOT_EXIST, NONEXISTENT_EXPLAINABLE_CONCEPT, \
     NONEXISTENT_EXPLAINABLE_OWNERSHIP
 from typedb.concept.proto import concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 
 
 class _ConceptMap(ConceptMap):
 
-    def __init__(self, mapping: Mapping[str, Concept], explainables: ConceptMap.Explainables = None):
+    __slots__ = ("_map", "_explainables", "_explainables_proto")
+
+    def __init__(self, mapping: Mapping[str, Concept], explainables: ConceptMap.Explainables = None,
+                 explainables_proto: answer_proto.Explainables = None):
         self._map = mapping
         self._explainables = explainables
+        self._explainables_proto = explainables_proto
 
     @staticmethod
-    def of(res: answer_proto.ConceptMap) -> "_ConceptMap":
-        variable_map = {}
-        for res_var in res.map:
-            variable_map[res_var] = concept_proto_reader.concept(res.map[res_var])
-        return _ConceptMap(variable_map, _ConceptMap.Explainables.of(res.explainables))
+    def of(res: answer_proto.ConceptMap, type_cache: _TypeCache = None) -> "_ConceptMap":
+        # Concepts and explainables are decoded on first access, as most callers only read a few variables
+        return _ConceptMap(_ConceptMap.LazyMapping(res.map, type_cache), explainables_proto=res.explainables)
 
     def map(self):
         return self._map
@@ -50,12 +54,15 @@ class _ConceptMap(ConceptMap):
         return self._map.values()
 
     def get(self, variable: str):
-        concept = self._map[variable]
+        concept = self._map.get(variable)
         if not concept:
             raise TypeDBClientException.of(VARIABLE_DOES_NOT_EXIST, variable)
         return concept
 
     def explainables(self) -> ConceptMap.Explainables:
+        if self._explainables is None and self._explainables_proto is not None:
+            self._explainables = _ConceptMap.Explainables.of(self._explainables_proto)
+            self._explainables_proto = None
         return self._explainables
 
     def __str__(self):
@@ -71,8 +78,37 @@ class _ConceptMap(ConceptMap):
     def __hash__(self):
         return hash(self._map)
 
+    class LazyMapping(Mapping[str, Concept]):
+
+        __slots__ = ("_proto_map", "_type_cache", "_concepts")
+
+        def __init__(self, proto_map: Mapping[str, concept_proto.Concept], type_cache: _TypeCache = None):
+            self._proto_map = proto_map
+            self._type_cache = type_cache
+            self._concepts: Dict[str, Concept] = {}
+
+        def __getitem__(self, variable: str) -> Concept:
+            concept = self._concepts.get(variable)
+            if concept is None:
+                if variable not in self._proto_map:
+                    raise KeyError(variable)
+                concept = concept_proto_reader.concept(self._proto_map[variable], self._type_cache)
+                self._concepts[variable] = concept
+            return concept
+
+        def __contains__(self, variable) -> bool:
+            return variable in self._proto_map
+
+        def __iter__(self) -> Iterator[str]:
+            return iter(self._proto_map)
+
+        def __len__(self) -> int:
+            return len(self._proto_map)
+
     class Explainables(ConceptMap.Explainables):
 
+        __slots__ = ("_relations", "_attributes", "_ownerships")
+
         def __init__(self, relations: Mapping[str, ConceptMap.Explainable] = None, attributes: Mapping[str, ConceptMap.Explainable] = None, ownerships: Mapping[Tuple[str, str], ConceptMap.Explainable] = None):
             self._relations = relations
             self._attributes = attributes
@@ -131,6 +167,8 @@ class _ConceptMap(ConceptMap):
 
     class Explainable(ConceptMap.Explainable):
 
+        __slots__ = ("_conjunction", "_explainable_id")
+
         def __init__(self, conjunction: str, explainable_id: int):
             self._conjunction = conjunction
             self._explainable_id = explainable_id
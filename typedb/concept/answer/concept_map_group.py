@@ -24,18 +24,21 @@ import typedb_protocol.common.answer_pb2 as answer_proto
 from typedb.api.answer.concept_map_group import ConceptMapGroup
 from typedb.concept.answer.concept_map import _ConceptMap
 from typedb.concept.proto import concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 
 
 class _ConceptMapGroup(ConceptMapGroup):
 
+    __slots__ = ("_owner", "_concept_maps")
+
     def __init__(self, owner, concept_maps):
         self._owner = owner
         self._concept_maps = concept_maps
 
     @staticmethod
-    def of(cm_group: answer_proto.ConceptMapGroup) -> "_ConceptMapGroup":
-        owner = concept_proto_reader.concept(cm_group.owner)
-        concept_maps = list(map(lambda cm: _ConceptMap.of(cm), cm_group.concept_maps))
+    def of(cm_group: answer_proto.ConceptMapGroup, type_cache: _TypeCache = None) -> "_ConceptMapGroup":
+        owner = concept_proto_reader.concept(cm_group.owner, type_cache)
+        concept_maps = list(map(lambda cm: _ConceptMap.of(cm, type_cache), cm_group.concept_maps))
         return _ConceptMapGroup(owner, concept_maps)
 
     def owner(self):
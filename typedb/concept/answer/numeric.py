@@ -27,6 +27,8 @@ from typedb.common.exception import TypeDBClientException, BAD_ANSWER_TYPE, ILLE
 
 class _Numeric(Numeric):
 
+    __slots__ = ("_int_value", "_float_value")
+
     def __init__(self, int_value, float_value):
         self._int_value = int_value
         self._float_value = float_value
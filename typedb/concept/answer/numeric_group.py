@@ -24,17 +24,20 @@ import typedb_protocol.common.answer_pb2 as answer_proto
 from typedb.api.answer.numeric_group import NumericGroup
 from typedb.concept.answer.numeric import _Numeric
 from typedb.concept.proto import concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 
 
 class _NumericGroup(NumericGroup):
 
+    __slots__ = ("_owner", "_numeric")
+
     def __init__(self, owner, numeric):
         self._owner = owner
         self._numeric = numeric
 
     @staticmethod
-    def of(numeric_group_proto: answer_proto.NumericGroup):
-        return _NumericGroup(concept_proto_reader.concept(numeric_group_proto.owner), _Numeric.of(numeric_group_proto.number))
+    def of(numeric_group_proto: answer_proto.NumericGroup, type_cache: _TypeCache = None):
+        return _NumericGroup(concept_proto_reader.concept(numeric_group_proto.owner, type_cache), _Numeric.of(numeric_group_proto.number))
 
     def owner(self):
         return self._owner
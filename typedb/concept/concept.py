@@ -25,6 +25,8 @@ from typedb.api.concept.concept import Concept, RemoteConcept
 
 class _Concept(Concept, ABC):
 
+    __slots__ = ()
+
     def is_remote(self):
         return False
 
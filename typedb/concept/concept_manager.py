@@ -24,9 +24,11 @@ import typedb_protocol.common.transaction_pb2 as transaction_proto
 from typedb.api.concept.concept import ValueType
 from typedb.api.concept.concept_manager import ConceptManager
 from typedb.api.connection.transaction import _TypeDBTransactionExtended
+from typedb.common.label import Label
 from typedb.common.rpc.request_builder import concept_manager_put_entity_type_req, \
     concept_manager_put_relation_type_req, \
-    concept_manager_put_attribute_type_req, concept_manager_get_thing_type_req, concept_manager_get_thing_req
+    concept_manager_put_attribute_type_req, concept_manager_get_thing_type_req, concept_manager_get_thing_req, \
+    type_get_subtypes_req
 from typedb.concept.proto import concept_proto_reader
 from typedb.concept.type.entity_type import _EntityType
 from typedb.concept.type.relation_type import _RelationType
@@ -73,12 +75,27 @@ class _ConceptManager(ConceptManager):
         return _type if _type and _type.is_attribute_type() else None
 
     def get_thing_type(self, label: str):
+        schema_cache = self._transaction_ext.schema_cache()
+        if schema_cache is not None:
+            proto_thing_type = schema_cache.thing_type(label, self._transaction_ext.schema_cache_generation(),
+                                                       self._load_thing_types)
+            return concept_proto_reader.thing_type(proto_thing_type, self._transaction_ext.type_cache()) \
+                if proto_thing_type is not None else None
+        return self._get_thing_type(label)
+
+    def _load_thing_types(self):
+        res = self.execute(concept_manager_get_thing_type_req("thing"))
+        return [res.get_thing_type_res.thing_type] + [
+            t for rp in self._transaction_ext.stream(type_get_subtypes_req(Label.of("thing")))
+            for t in rp.type_res_part.type_get_subtypes_res_part.types]
+
+    def _get_thing_type(self, label: str):
         res = self.execute(concept_manager_get_thing_type_req(label))
-        return concept_proto_reader.thing_type(res.get_thing_type_res.thing_type) if res.get_thing_type_res.WhichOneof("res") == "thing_type" else None
+        return concept_proto_reader.thing_type(res.get_thing_type_res.thing_type, self._transaction_ext.type_cache()) if res.get_thing_type_res.WhichOneof("res") == "thing_type" else None
 
     def get_thing(self, iid: str):
         res = self.execute(concept_manager_get_thing_req(iid))
-        return concept_proto_reader.thing(res.get_thing_res.thing) if res.get_thing_res.WhichOneof("res") == "thing" else None
+        return concept_proto_reader.thing(res.get_thing_res.thing, self._transaction_ext.type_cache()) if res.get_thing_res.WhichOneof("res") == "thing" else None
 
     def execute(self, req: transaction_proto.Transaction.Req):
         return self._transaction_ext.execute(req).concept_manager_res
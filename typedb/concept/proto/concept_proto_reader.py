@@ -33,6 +33,7 @@ from typedb.concept.type.entity_type import _EntityType
 from typedb.concept.type.relation_type import _RelationType
 from typedb.concept.type.role_type import _RoleType
 from typedb.concept.type.thing_type import _ThingType
+from typedb.concept.proto.type_cache import _TypeCache
 from typedb.concept.value.value import _BooleanValue, _LongValue, _DoubleValue, _StringValue, _DateTimeValue
 
 
@@ -40,88 +41,104 @@ def iid(proto_iid: bytes):
     return "0x" + proto_iid.hex()
 
 
-def concept(proto_concept: concept_proto.Concept):
-    if proto_concept.HasField("thing"):
-        return thing(proto_concept.thing)
-    elif proto_concept.HasField("type"):
-        return type_(proto_concept.type)
+def concept(proto_concept: concept_proto.Concept, type_cache: _TypeCache = None):
+    concept_case = proto_concept.WhichOneof("concept")
+    if concept_case == "thing":
+        return thing(proto_concept.thing, type_cache)
+    elif concept_case == "type":
+        return type_(proto_concept.type, type_cache)
     else:
         return value(proto_concept.value)
 
 
-def thing(proto_thing: concept_proto.Thing):
-    if proto_thing.type.encoding == concept_proto.Type.Encoding.Value("ENTITY_TYPE"):
-        return _Entity.of(proto_thing)
-    elif proto_thing.type.encoding == concept_proto.Type.Encoding.Value("RELATION_TYPE"):
-        return _Relation.of(proto_thing)
-    elif proto_thing.type.encoding == concept_proto.Type.Encoding.Value("ATTRIBUTE_TYPE"):
-        return attribute(proto_thing)
-    else:
+def thing(proto_thing: concept_proto.Thing, type_cache: _TypeCache = None):
+    decoder = _THING_DECODERS.get(proto_thing.type.encoding)
+    if decoder is None:
         raise TypeDBClientException.of(BAD_ENCODING, proto_thing.type.encoding)
+    return decoder(proto_thing, type_cache)
 
 
-def attribute(proto_thing: concept_proto.Thing):
-    if proto_thing.type.value_type == concept_proto.ValueType.Value("BOOLEAN"):
-        return _BooleanAttribute.of(proto_thing)
-    elif proto_thing.type.value_type == concept_proto.ValueType.Value("LONG"):
-        return _LongAttribute.of(proto_thing)
-    elif proto_thing.type.value_type == concept_proto.ValueType.Value("DOUBLE"):
-        return _DoubleAttribute.of(proto_thing)
-    elif proto_thing.type.value_type == concept_proto.ValueType.Value("STRING"):
-        return _StringAttribute.of(proto_thing)
-    elif proto_thing.type.value_type == concept_proto.ValueType.Value("DATETIME"):
-        return _DateTimeAttribute.of(proto_thing)
-    else:
+def attribute(proto_thing: concept_proto.Thing, type_cache: _TypeCache = None):
+    decoder = _ATTRIBUTE_DECODERS.get(proto_thing.type.value_type)
+    if decoder is None:
         raise TypeDBClientException.of(BAD_VALUE_TYPE, proto_thing.type.value_type)
+    return decoder(proto_thing, type_cache)
 
 
 def value(proto_value: concept_proto.Value):
-    if proto_value.value_type == concept_proto.ValueType.Value("BOOLEAN"):
-        return _BooleanValue.of(proto_value)
-    elif proto_value.value_type == concept_proto.ValueType.Value("LONG"):
-        return _LongValue.of(proto_value)
-    elif proto_value.value_type == concept_proto.ValueType.Value("DOUBLE"):
-        return _DoubleValue.of(proto_value)
-    elif proto_value.value_type == concept_proto.ValueType.Value("STRING"):
-        return _StringValue.of(proto_value)
-    elif proto_value.value_type == concept_proto.ValueType.Value("DATETIME"):
-        return _DateTimeValue.of(proto_value)
-    else:
-        raise TypeDBClientException.of(BAD_VALUE_TYPE, proto_value.type.value_type)
+    decoder = _VALUE_DECODERS.get(proto_value.value_type)
+    if decoder is None:
+        raise TypeDBClientException.of(BAD_VALUE_TYPE, proto_value.value_type)
+    return decoder(proto_value)
 
 
-def type_(proto_type: concept_proto.Type):
-    if proto_type.encoding == concept_proto.Type.Encoding.Value("ROLE_TYPE"):
+def type_(proto_type: concept_proto.Type, type_cache: _TypeCache = None):
+    if type_cache is not None:
+        return type_cache.get(proto_type, type_)
+    if proto_type.encoding == _ROLE_TYPE:
         return _RoleType.of(proto_type)
     else:
         return thing_type(proto_type)
 
 
-def thing_type(proto_type: concept_proto.Type):
-    if proto_type.encoding == concept_proto.Type.Encoding.Value("ENTITY_TYPE"):
-        return _EntityType.of(proto_type)
-    elif proto_type.encoding == concept_proto.Type.Encoding.Value("RELATION_TYPE"):
-        return _RelationType.of(proto_type)
-    elif proto_type.encoding == concept_proto.Type.Encoding.Value("ATTRIBUTE_TYPE"):
-        return attribute_type(proto_type)
-    elif proto_type.encoding == concept_proto.Type.Encoding.Value("THING_TYPE"):
-        return _ThingType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract)
-    else:
+def thing_type(proto_type: concept_proto.Type, type_cache: _TypeCache = None):
+    if type_cache is not None:
+        return type_cache.get(proto_type, thing_type)
+    decoder = _THING_TYPE_DECODERS.get(proto_type.encoding)
+    if decoder is None:
         raise TypeDBClientException.of(BAD_ENCODING, proto_type.encoding)
+    return decoder(proto_type)
 
 
-def attribute_type(proto_type: concept_proto.Type):
-    if proto_type.value_type == concept_proto.ValueType.Value("BOOLEAN"):
-        return _BooleanAttributeType.of(proto_type)
-    elif proto_type.value_type == concept_proto.ValueType.Value("LONG"):
-        return _LongAttributeType.of(proto_type)
-    elif proto_type.value_type == concept_proto.ValueType.Value("DOUBLE"):
-        return _DoubleAttributeType.of(proto_type)
-    elif proto_type.value_type == concept_proto.ValueType.Value("STRING"):
-        return _StringAttributeType.of(proto_type)
-    elif proto_type.value_type == concept_proto.ValueType.Value("DATETIME"):
-        return _DateTimeAttributeType.of(proto_type)
-    elif proto_type.value_type == concept_proto.ValueType.Value("OBJECT"):
-        return _AttributeType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract)
-    else:
+def attribute_type(proto_type: concept_proto.Type, type_cache: _TypeCache = None):
+    if type_cache is not None:
+        return type_cache.get(proto_type, attribute_type)
+    decoder = _ATTRIBUTE_TYPE_DECODERS.get(proto_type.value_type)
+    if decoder is None:
         raise TypeDBClientException.of(BAD_VALUE_TYPE, proto_type.value_type)
+    return decoder(proto_type)
+
+
+# Decoders keyed by the integer values of the protocol enums, so decoding never looks up an enum by name
+
+_ROLE_TYPE = concept_proto.Type.Encoding.Value("ROLE_TYPE")
+
+_THING_DECODERS = {
+    concept_proto.Type.Encoding.Value("ENTITY_TYPE"): _Entity.of,
+    concept_proto.Type.Encoding.Value("RELATION_TYPE"): _Relation.of,
+    concept_proto.Type.Encoding.Value("ATTRIBUTE_TYPE"): attribute,
+}
+
+_ATTRIBUTE_DECODERS = {
+    concept_proto.ValueType.Value("BOOLEAN"): _BooleanAttribute.of,
+    concept_proto.ValueType.Value("LONG"): _LongAttribute.of,
+    concept_proto.ValueType.Value("DOUBLE"): _DoubleAttribute.of,
+    concept_proto.ValueType.Value("STRING"): _StringAttribute.of,
+    concept_proto.ValueType.Value("DATETIME"): _DateTimeAttribute.of,
+}
+
+_VALUE_DECODERS = {
+    concept_proto.ValueType.Value("BOOLEAN"): _BooleanValue.of,
+    concept_proto.ValueType.Value("LONG"): _LongValue.of,
+    concept_proto.ValueType.Value("DOUBLE"): _DoubleValue.of,
+    concept_proto.ValueType.Value("STRING"): _StringValue.of,
+    concept_proto.ValueType.Value("DATETIME"): _DateTimeValue.of,
+}
+
+_THING_TYPE_DECODERS = {
+    concept_proto.Type.Encoding.Value("ENTITY_TYPE"): _EntityType.of,
+    concept_proto.Type.Encoding.Value("RELATION_TYPE"): _RelationType.of,
+    concept_proto.Type.Encoding.Value("ATTRIBUTE_TYPE"): attribute_type,
+    concept_proto.Type.Encoding.Value("THING_TYPE"):
+        lambda proto_type: _ThingType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract),
+}
+
+_ATTRIBUTE_TYPE_DECODERS = {
+    concept_proto.ValueType.Value("BOOLEAN"): _BooleanAttributeType.of,
+    concept_proto.ValueType.Value("LONG"): _LongAttributeType.of,
+    concept_proto.ValueType.Value("DOUBLE"): _DoubleAttributeType.of,
+    concept_proto.ValueType.Value("STRING"): _StringAttributeType.of,
+    concept_proto.ValueType.Value("DATETIME"): _DateTimeAttributeType.of,
+    concept_proto.ValueType.Value("OBJECT"):
+        lambda proto_type: _AttributeType(Label.of(proto_type.label), proto_type.is_root, proto_type.is_abstract),
+}
@@ -0,0 +1,50 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from typing import Callable, Dict, Tuple
+
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+from typedb.api.concept.type.type import Type
+
+
+class _TypeCache:
+    """
+    Interns the types decoded from the answers of one transaction, so that every concept of a given type shares one
+    immutable type instance instead of each decoding its own copy.
+    """
+
+    def __init__(self):
+        self._types: Dict[Tuple[int, str, str, int, bool, bool], Type] = {}
+
+    def get(self, proto_type: concept_proto.Type, decode: Callable[[concept_proto.Type], Type]) -> Type:
+        key = (proto_type.encoding, proto_type.scope, proto_type.label, proto_type.value_type, proto_type.is_root,
+               proto_type.is_abstract)
+        type_ = self._types.get(key)
+        if type_ is None:
+            type_ = self._types.setdefault(key, decode(proto_type))
+        return type_
+
+    def size(self) -> int:
+        return len(self._types)
+
+    def clear(self) -> None:
+        self._types.clear()
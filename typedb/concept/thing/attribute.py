@@ -31,11 +31,14 @@ from typedb.api.concept.type.attribute_type import BooleanAttributeType, LongAtt
 from typedb.api.concept.type.thing_type import ThingType
 from typedb.common.rpc.request_builder import attribute_get_owners_req
 from typedb.concept.proto import concept_proto_builder, concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 from typedb.concept.thing.thing import _Thing, _RemoteThing
 
 
 class _Attribute(Attribute, _Thing, ABC):
 
+    __slots__ = ()
+
     def as_attribute(self) -> "Attribute":
         return self
 
@@ -52,14 +55,16 @@ class _RemoteAttribute(RemoteAttribute, _RemoteThing, ABC):
 
 class _BooleanAttribute(BooleanAttribute, _Attribute):
 
+    __slots__ = ("_type", "_value")
+
     def __init__(self, iid: str, is_inferred: bool, type_: BooleanAttributeType, value: bool):
         super(_BooleanAttribute, self).__init__(iid, is_inferred)
         self._type = type_
         self._value = value
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _BooleanAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type), thing_proto.value.boolean)
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _BooleanAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type, type_cache), thing_proto.value.boolean)
 
     def get_type(self) -> "BooleanAttributeType":
         return self._type
@@ -90,14 +95,16 @@ class _RemoteBooleanAttribute(RemoteBooleanAttribute, _RemoteAttribute):
 
 class _LongAttribute(LongAttribute, _Attribute):
 
+    __slots__ = ("_type", "_value")
+
     def __init__(self, iid: str, is_inferred: bool, type_: LongAttributeType, value: int):
         super(_LongAttribute, self).__init__(iid, is_inferred)
         self._type = type_
         self._value = value
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _LongAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type), thing_proto.value.long)
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _LongAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type, type_cache), thing_proto.value.long)
 
     def get_type(self) -> "LongAttributeType":
         return self._type
@@ -128,14 +135,16 @@ class _RemoteLongAttribute(RemoteLongAttribute, _RemoteAttribute):
 
 class _DoubleAttribute(DoubleAttribute, _Attribute):
 
+    __slots__ = ("_type", "_value")
+
     def __init__(self, iid: str, is_inferred: bool, type_: DoubleAttributeType, value: float):
         super(_DoubleAttribute, self).__init__(iid, is_inferred)
         self._type = type_
         self._value = value
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _DoubleAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type), thing_proto.value.double)
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _DoubleAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type, type_cache), thing_proto.value.double)
 
     def get_type(self) -> "DoubleAttributeType":
         return self._type
@@ -166,14 +175,16 @@ class _RemoteDoubleAttribute(RemoteDoubleAttribute, _RemoteAttribute):
 
 class _StringAttribute(StringAttribute, _Attribute):
 
+    __slots__ = ("_type", "_value")
+
     def __init__(self, iid: str, is_inferred: bool, type_: StringAttributeType, value: str):
         super(_StringAttribute, self).__init__(iid, is_inferred)
         self._type = type_
         self._value = value
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _StringAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type), thing_proto.value.string)
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _StringAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type, type_cache), thing_proto.value.string)
 
     def get_type(self) -> "StringAttributeType":
         return self._type
@@ -204,14 +215,16 @@ class _RemoteStringAttribute(RemoteStringAttribute, _RemoteAttribute):
 
 class _DateTimeAttribute(DateTimeAttribute, _Attribute):
 
+    __slots__ = ("_type", "_value")
+
     def __init__(self, iid: str, is_inferred: bool, type_: DateTimeAttributeType, value: datetime):
         super(_DateTimeAttribute, self).__init__(iid, is_inferred)
         self._type = type_
         self._value = value
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _DateTimeAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type), datetime.utcfromtimestamp(float(thing_proto.value.date_time) / 1000.0))
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _DateTimeAttribute(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.attribute_type(thing_proto.type, type_cache), datetime.utcfromtimestamp(float(thing_proto.value.date_time) / 1000.0))
 
     def get_type(self) -> "DateTimeAttributeType":
         return self._type
@@ -24,18 +24,21 @@ import typedb_protocol.common.concept_pb2 as concept_proto
 from typedb.api.concept.thing.entity import Entity, RemoteEntity
 from typedb.api.concept.type.entity_type import EntityType
 from typedb.concept.proto import concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 from typedb.concept.thing.thing import _Thing, _RemoteThing
 
 
 class _Entity(Entity, _Thing):
 
+    __slots__ = ("_type",)
+
     def __init__(self, iid: str, is_inferred: bool, entity_type: EntityType):
         super(_Entity, self).__init__(iid, is_inferred)
         self._type = entity_type
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _Entity(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.type_(thing_proto.type))
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _Entity(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.type_(thing_proto.type, type_cache))
 
     def get_type(self) -> "EntityType":
         return self._type
@@ -28,19 +28,22 @@ from typedb.api.concept.type.role_type import RoleType
 from typedb.common.rpc.request_builder import relation_add_player_req, relation_remove_player_req, \
     relation_get_players_req, relation_get_players_by_role_type_req, relation_get_relating_req
 from typedb.concept.proto import concept_proto_builder, concept_proto_reader
+from typedb.concept.proto.type_cache import _TypeCache
 from typedb.concept.thing.thing import _Thing, _RemoteThing
 from typedb.concept.type.role_type import _RoleType
 
 
 class _Relation(Relation, _Thing):
 
+    __slots__ = ("_type",)
+
     def __init__(self, iid: str, is_inferred: bool, relation_type: RelationType):
         super(_Relation, self).__init__(iid, is_inferred)
         self._type = relation_type
 
     @staticmethod
-    def of(thing_proto: concept_proto.Thing):
-        return _Relation(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.type_(thing_proto.type))
+    def of(thing_proto: concept_proto.Thing, type_cache: _TypeCache = None):
+        return _Relation(concept_proto_reader.iid(thing_proto.iid), thing_proto.inferred, concept_proto_reader.type_(thing_proto.type, type_cache))
 
     def as_remote(self, transaction):
         return _RemoteRelation(transaction, self.get_iid(), self.is_inferred(), self.get_type())
@@ -40,6 +40,8 @@ if TYPE_CHECKING:
 
 class _Thing(Thing, _Concept, ABC):
 
+    __slots__ = ("_iid", "_is_inferred")
+
     def __init__(self, iid: str, is_inferred: bool):
         if not iid:
             raise TypeDBClientException.of(MISSING_IID)
@@ -41,6 +41,8 @@ from typedb.concept.type.thing_type import _ThingType, _RemoteThingType
 
 class _AttributeType(AttributeType, _ThingType):
 
+    __slots__ = ()
+
     ROOT_LABEL = Label.of("attribute")
 
     def as_remote(self, transaction):
@@ -162,6 +164,8 @@ class _RemoteAttributeType(_RemoteThingType, RemoteAttributeType):
 
 class _BooleanAttributeType(BooleanAttributeType, _AttributeType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _BooleanAttributeType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
@@ -190,6 +194,8 @@ class _RemoteBooleanAttributeType(_RemoteAttributeType, RemoteBooleanAttributeTy
 
 class _LongAttributeType(LongAttributeType, _AttributeType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _LongAttributeType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
@@ -218,6 +224,8 @@ class _RemoteLongAttributeType(_RemoteAttributeType, RemoteLongAttributeType):
 
 class _DoubleAttributeType(DoubleAttributeType, _AttributeType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _DoubleAttributeType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
@@ -246,6 +254,8 @@ class _RemoteDoubleAttributeType(_RemoteAttributeType, RemoteDoubleAttributeType
 
 class _StringAttributeType(StringAttributeType, _AttributeType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _StringAttributeType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
@@ -284,6 +294,8 @@ class _RemoteStringAttributeType(_RemoteAttributeType, RemoteStringAttributeType
 
 class _DateTimeAttributeType(DateTimeAttributeType, _AttributeType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _DateTimeAttributeType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
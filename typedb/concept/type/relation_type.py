@@ -33,6 +33,8 @@ from typedb.concept.type.thing_type import _ThingType, _RemoteThingType
 
 class _RelationType(RelationType, _ThingType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _RelationType(Label.of(type_proto.label), type_proto.is_root, type_proto.is_abstract)
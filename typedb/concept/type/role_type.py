@@ -33,6 +33,8 @@ from typedb.concept.type.type import _Type, _RemoteType
 
 class _RoleType(_Type, RoleType):
 
+    __slots__ = ()
+
     @staticmethod
     def of(type_proto: concept_proto.Type):
         return _RoleType(Label.of(type_proto.scope, type_proto.label), type_proto.is_root, type_proto.is_abstract)
@@ -35,6 +35,8 @@ from typedb.concept.type.type import _Type, _RemoteType
 
 class _ThingType(ThingType, _Type):
 
+    __slots__ = ()
+
     def as_remote(self, transaction):
         return _RemoteThingType(transaction, self.get_label(), self.is_root(), self.is_abstract())
 
@@ -74,8 +76,9 @@ class _RemoteThingType(_RemoteType, RemoteThingType):
         self.execute(thing_type_unset_plays_req(self.get_label(), concept_proto_builder.role_type(role_type)))
 
     def get_plays(self):
-        return (concept_proto_reader.type_(t) for rp in self.stream(thing_type_get_plays_req(self.get_label()))
-                for t in rp.thing_type_get_plays_res_part.role_types)
+        return self.schema_traversal(("plays", self.get_label()), lambda: (
+            t for rp in self.stream(thing_type_get_plays_req(self.get_label()))
+            for t in rp.thing_type_get_plays_res_part.role_types))
 
     def get_plays_explicit(self):
         return (concept_proto_reader.type_(t) for rp in self.stream(thing_type_get_plays_explicit_req(self.get_label()))
@@ -97,11 +100,11 @@ class _RemoteThingType(_RemoteType, RemoteThingType):
         self.execute(thing_type_unset_owns_req(self.get_label(), concept_proto_builder.thing_type(attribute_type)))
 
     def get_owns(self, value_type: ValueType = None, annotations: Set["Annotation"] = frozenset()):
-        return (concept_proto_reader.type_(t)
-                for rp in self.stream(thing_type_get_owns_req(self.get_label(),
-                                                              value_type.proto() if value_type else None,
-                                                              [concept_proto_builder.annotation(a) for a in annotations]))
-                for t in rp.thing_type_get_owns_res_part.attribute_types)
+        return self.schema_traversal(("owns", self.get_label(), value_type, frozenset(annotations)), lambda: (
+            t for rp in self.stream(thing_type_get_owns_req(self.get_label(),
+                                                          value_type.proto() if value_type else None,
+                                                          [concept_proto_builder.annotation(a) for a in annotations]))
+            for t in rp.thing_type_get_owns_res_part.attribute_types))
 
     def get_owns_explicit(self, value_type: ValueType = None, annotations: Set["Annotation"] = frozenset()):
         return (concept_proto_reader.type_(t)
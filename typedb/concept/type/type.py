@@ -19,8 +19,9 @@
 # under the License.
 #
 from abc import ABC
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Callable, Hashable, Iterator, Union
 
+import typedb_protocol.common.concept_pb2 as concept_proto
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 
 from typedb.api.concept.type.type import Type, RemoteType
@@ -37,6 +38,8 @@ if TYPE_CHECKING:
 
 class _Type(Type, _Concept, ABC):
 
+    __slots__ = ("_label", "_is_root", "_is_abstract", "_hash")
+
     def __init__(self, label: Label, is_root: bool, is_abstract: bool):
         if not label:
             raise TypeDBClientException.of(MISSING_LABEL)
@@ -107,10 +110,12 @@ class _RemoteType(RemoteType, _RemoteConcept, ABC):
         return concept_proto_reader.type_(res.type) if res.WhichOneof("res") == "type" else None
 
     def get_supertypes(self):
-        return (concept_proto_reader.type_(t) for rp in self.stream(type_get_supertypes_req(self.get_label())) for t in rp.type_get_supertypes_res_part.types)
+        return self.schema_traversal(("supertypes", self.get_label()), lambda: (
+            t for rp in self.stream(type_get_supertypes_req(self.get_label())) for t in rp.type_get_supertypes_res_part.types))
 
     def get_subtypes(self):
-        return (concept_proto_reader.type_(t) for rp in self.stream(type_get_subtypes_req(self.get_label())) for t in rp.type_get_subtypes_res_part.types)
+        return self.schema_traversal(("subtypes", self.get_label()), lambda: (
+            t for rp in self.stream(type_get_subtypes_req(self.get_label())) for t in rp.type_get_subtypes_res_part.types))
 
     def delete(self):
         self.execute(type_delete_req(self.get_label()))
@@ -121,6 +126,13 @@ class _RemoteType(RemoteType, _RemoteConcept, ABC):
     def stream(self, request: transaction_proto.Transaction.Req):
         return (rp.type_res_part for rp in self._transaction_ext.stream(request))
 
+    def schema_traversal(self, key: Hashable, load: Callable[[], Iterator[concept_proto.Type]]) -> Iterator[Type]:
+        schema_cache = self._transaction_ext.schema_cache()
+        proto_types = schema_cache.traversal(key, self._transaction_ext.schema_cache_generation(), load) \
+            if schema_cache is not None else load()
+        type_cache = self._transaction_ext.type_cache()
+        return (concept_proto_reader.type_(t, type_cache) for t in proto_types)
+
     def __str__(self):
         return type(self).__name__ + "[label: %s]" % self.get_label()
 
@@ -31,12 +31,16 @@ from typedb.concept.proto import concept_proto_reader
 
 class _Value(Value, _Concept, ABC):
 
+    __slots__ = ()
+
     def as_value(self) -> "Value":
         return self
 
 
 class _BooleanValue(BooleanValue, _Value):
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: bool):
         super(_BooleanValue, self).__init__()
         self._value = value
@@ -54,6 +58,8 @@ class _BooleanValue(BooleanValue, _Value):
 
 class _LongValue(LongValue, _Value):
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: int):
         super(_LongValue, self).__init__()
         self._value = value
@@ -71,6 +77,8 @@ class _LongValue(LongValue, _Value):
 
 class _DoubleValue(DoubleValue, _Value):
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: float):
         super(_DoubleValue, self).__init__()
         self._value = value
@@ -88,6 +96,8 @@ class _DoubleValue(DoubleValue, _Value):
 
 class _StringValue(StringValue, _Value):
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: str):
         super(_StringValue, self).__init__()
         self._value = value
@@ -105,6 +115,8 @@ class _StringValue(StringValue, _Value):
 
 class _DateTimeValue(DateTimeValue, _Value):
 
+    __slots__ = ("_value",)
+
     def __init__(self, value: datetime):
         super(_DateTimeValue, self).__init__()
         self._value = value
@@ -0,0 +1,154 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+from threading import Condition
+from typing import Callable, List, Tuple
+
+from grpc import Channel, ChannelConnectivity
+
+from typedb.common.exception import TypeDBClientException, CLIENT_NOT_OPEN, CHANNEL_POOL_TIMEOUT
+from typedb.common.rpc.stub import TypeDBStub
+
+
+class _ChannelPool:
+    """
+    Channels (with their already-opened stubs) that transactions borrow for the lifetime of their stream, so that
+    opening a transaction does not pay for a new connection handshake. Channels in a failed connectivity state are
+    discarded, and channels idle for longer than ``idle_timeout_seconds`` are closed by ``evict_idle``.
+
+    At most ``max_channels`` channels, idle or borrowed, are open at once. Once they are all borrowed, ``borrow``
+    waits up to ``borrow_timeout_seconds`` for one to be given back, then fails.
+    """
+
+    def __init__(self, factory: Callable[[], Tuple[Channel, TypeDBStub]], max_idle: int, idle_timeout_seconds: float,
+                 max_channels: int, borrow_timeout_seconds: float):
+        self._factory = factory
+        self._max_idle = max_idle
+        self._idle_timeout_seconds = idle_timeout_seconds
+        self._max_channels = max_channels
+        self._borrow_timeout_seconds = borrow_timeout_seconds
+        self._idle: List[_ChannelPool.Entry] = []
+        self._size = 0
+        self._condition = Condition()
+        self._is_open = True
+
+    def borrow(self) -> "_ChannelPool.Entry":
+        deadline = time.monotonic() + self._borrow_timeout_seconds
+        with self._condition:
+            while True:
+                if not self._is_open:
+                    raise TypeDBClientException.of(CLIENT_NOT_OPEN)
+                while self._idle:
+                    entry = self._idle.pop()
+                    if entry.is_healthy():
+                        return entry
+                    self._discard(entry)
+                if self._size < self._max_channels:
+                    # Reserve the slot, so that the channel can be opened outside the lock
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TypeDBClientException.of(CHANNEL_POOL_TIMEOUT, (self._borrow_timeout_seconds, self._max_channels))
+                self._condition.wait(remaining)
+        try:
+            return _ChannelPool.Entry(*self._factory())
+        except BaseException:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def give_back(self, entry: "_ChannelPool.Entry") -> None:
+        with self._condition:
+            if self._is_open and entry.is_healthy() and len(self._idle) < self._max_idle:
+                entry.mark_idle()
+                self._idle.append(entry)
+            else:
+                self._discard(entry)
+            self._condition.notify()
+
+    def evict_idle(self) -> None:
+        deadline = time.monotonic() - self._idle_timeout_seconds
+        with self._condition:
+            evicted = [entry for entry in self._idle if entry.idle_since() < deadline or not entry.is_healthy()]
+            self._idle = [entry for entry in self._idle if entry not in evicted]
+            for entry in evicted:
+                self._discard(entry)
+            self._condition.notify_all()
+
+    def idle_count(self) -> int:
+        return len(self._idle)
+
+    def size(self) -> int:
+        return self._size
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_open = False
+            for entry in self._idle:
+                self._discard(entry)
+            self._idle = []
+            self._condition.notify_all()
+
+    def _discard(self, entry: "_ChannelPool.Entry") -> None:
+        # Called under the lock; closing a channel does not block on the network
+        self._size -= 1
+        entry.close()
+
+    class Entry:
+
+        _FAILED_STATES = (ChannelConnectivity.TRANSIENT_FAILURE, ChannelConnectivity.SHUTDOWN)
+
+        def __init__(self, channel: Channel, stub: TypeDBStub):
+            self._channel = channel
+            self._stub = stub
+            self._idle_since = time.monotonic()
+            self._connectivity = ChannelConnectivity.READY
+            self._is_broken = False
+            self._channel.subscribe(self._on_connectivity_change)
+
+        def channel(self) -> Channel:
+            return self._channel
+
+        def stub(self) -> TypeDBStub:
+            return self._stub
+
+        def idle_since(self) -> float:
+            return self._idle_since
+
+        def mark_idle(self) -> None:
+            self._idle_since = time.monotonic()
+
+        def mark_broken(self) -> None:
+            self._is_broken = True
+
+        def is_healthy(self) -> bool:
+            return not self._is_broken and self._connectivity not in self._FAILED_STATES
+
+        def close(self) -> None:
+            self._is_broken = True
+            self._channel.unsubscribe(self._on_connectivity_change)
+            self._channel.close()
+
+        def _on_connectivity_change(self, connectivity: ChannelConnectivity) -> None:
+            self._connectivity = connectivity
@@ -19,30 +19,44 @@
 #   under the License.
 #
 from threading import Lock
-from typing import Dict
+from typing import Dict, Optional
 
 from grpc import Channel
 
-from typedb.api.connection.client import TypeDBClient
+from typedb.api.connection.client import TypeDBClient, TransmitterMode
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.connection.session import SessionType
 from typedb.common.concurrent.scheduled_executor import ScheduledExecutor
 from typedb.common.exception import CLIENT_NOT_OPEN, TypeDBClientException
 from typedb.common.rpc.stub import TypeDBStub
+from typedb.connection.channel_pool import _ChannelPool
 from typedb.connection.database_manager import _TypeDBDatabaseManagerImpl
 from typedb.connection.session import _TypeDBSessionImpl
-from typedb.stream.request_transmitter import RequestTransmitter
+from typedb.query.query_cache import _QueryCache
+from typedb.stream.request_transmitter import RequestTransmitter, EVENT_DRIVEN_MAX_BATCH_SIZE, \
+    EVENT_DRIVEN_MAX_DELAY_SECS
 
 
 class _TypeDBClientImpl(TypeDBClient):
     _PULSE_INTERVAL_SECONDS = 5
+    _PULSE_TIMEOUT_SECONDS = 4
+    _CHANNEL_POOL_MAX_IDLE = 8
+    _CHANNEL_POOL_IDLE_TIMEOUT_SECONDS = 60
+    _CHANNEL_POOL_MAX_CHANNELS = 64
+    _CHANNEL_POOL_BORROW_TIMEOUT_SECONDS = 30
 
     # TODO: Detect number of available CPUs
-    def __init__(self, address: str, parallelisation: int = 2):
+    def __init__(self, address: str, parallelisation: int = 2, transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW,
+                 reader_thread: bool = False, query_cache: Optional[_QueryCache] = None,
+                 max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE, max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS):
         self._address = address
-        self._transmitter = RequestTransmitter(parallelisation)
+        self._transmitter = RequestTransmitter(parallelisation, transmitter_mode, max_batch, max_delay_seconds)
+        self._reader_thread = reader_thread
+        self._query_cache = query_cache
         self._sessions: Dict[bytes, _TypeDBSessionImpl] = {}
         self._sessions_lock = Lock()
+        self._channel_pool = _ChannelPool(self.new_channel_and_stub, self._CHANNEL_POOL_MAX_IDLE, self._CHANNEL_POOL_IDLE_TIMEOUT_SECONDS,
+                                          self._CHANNEL_POOL_MAX_CHANNELS, self._CHANNEL_POOL_BORROW_TIMEOUT_SECONDS)
         self._pulse_executor = ScheduledExecutor()
         self._pulse_executor.schedule_at_fixed_rate(interval=self._PULSE_INTERVAL_SECONDS, action=self._transmit_pulses)
 
@@ -64,6 +78,16 @@ class _TypeDBClientImpl(TypeDBClient):
     def databases(self) -> _TypeDBDatabaseManagerImpl:
         pass
 
+    def invalidate_schema_caches(self, database: str) -> None:
+        self._invalidate_local_schema_caches(database)
+
+    def _invalidate_local_schema_caches(self, database: str) -> None:
+        with self._sessions_lock:
+            sessions = self._sessions.copy()
+        for session in sessions.values():
+            if session.schema_cache() is not None and session.database().name() == database:
+                session.schema_cache().clear()
+
     def is_open(self) -> bool:
         return self._is_open
 
@@ -79,9 +103,18 @@ class _TypeDBClientImpl(TypeDBClient):
     def new_channel_and_stub(self) -> (Channel, TypeDBStub):
         pass
 
+    def channel_pool(self) -> _ChannelPool:
+        return self._channel_pool
+
     def transmitter(self) -> RequestTransmitter:
         return self._transmitter
 
+    def is_reader_thread_enabled(self) -> bool:
+        return self._reader_thread
+
+    def query_cache(self) -> Optional[_QueryCache]:
+        return self._query_cache
+
     def is_cluster(self) -> bool:
         return False
 
@@ -100,6 +133,7 @@ class _TypeDBClientImpl(TypeDBClient):
         for session in sessions.values():
             session.close()
         self._pulse_executor.shutdown()
+        self._channel_pool.close()
 
     def _transmit_pulses(self) -> None:
         if not self.is_open():
@@ -107,4 +141,6 @@ class _TypeDBClientImpl(TypeDBClient):
         with self._sessions_lock:
             sessions = self._sessions.copy()
         for session in sessions.values():
-            session.transmit_pulse()
+            if session.claim_pulse():
+                self._pulse_executor.execute(session.transmit_pulse, self._PULSE_TIMEOUT_SECONDS)
+        self._channel_pool.evict_idle()
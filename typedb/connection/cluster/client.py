@@ -18,48 +18,95 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import Iterable, Dict, Set
+from threading import Lock
+from typing import Iterable, Dict, Optional, Set
 
-from typedb.api.connection.client import TypeDBClusterClient
+from typedb.api.connection.client import TypeDBClusterClient, TransmitterMode
 from typedb.api.connection.credential import TypeDBCredential
 from typedb.api.connection.options import TypeDBOptions, TypeDBClusterOptions
+from typedb.api.connection.retry_policy import RetryPolicy, ExponentialBackoff
 from typedb.api.connection.session import SessionType
 from typedb.api.connection.user import UserManager, User
+from typedb.common.concurrent.fan_out import FanOut
 from typedb.connection.cluster.database import _ClusterDatabase, _FailsafeTask
 from typedb.connection.cluster.database_manager import _ClusterDatabaseManager
 from typedb.connection.cluster.server_client import _ClusterServerClient
 from typedb.connection.cluster.session import _ClusterSession
 from typedb.connection.cluster.stub import _ClusterServerStub
+from typedb.connection.cluster.topology import _ReplicaTopology, _unexpected_error
 from typedb.connection.cluster.user_manager import _ClusterUserManager
+from typedb.query.query_cache import _QueryCache
+from typedb.stream.request_transmitter import EVENT_DRIVEN_MAX_BATCH_SIZE, EVENT_DRIVEN_MAX_DELAY_SECS
 from typedb.common.rpc.request_builder import cluster_server_manager_all_req
-from typedb.common.exception import TypeDBClientException, UNABLE_TO_CONNECT, CLUSTER_UNABLE_TO_CONNECT, CLIENT_NOT_OPEN
+from typedb.common.exception import TypeDBClientException, CLUSTER_UNABLE_TO_CONNECT, CLIENT_NOT_OPEN
 
 
 class _ClusterClient(TypeDBClusterClient):
+    _TOPOLOGY_TTL_SECONDS = 30
+    _PROBE_DEADLINE_SECONDS = 10
 
-    def __init__(self, addresses: Iterable[str], credential: TypeDBCredential, parallelisation: int = None):
+    def __init__(self, addresses: Iterable[str], credential: TypeDBCredential, parallelisation: int = None,
+                 transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW, reader_thread: bool = False,
+                 query_cache: Optional[_QueryCache] = None, retry_policy: Optional[RetryPolicy] = None,
+                 max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE, max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS):
         self._credential = credential
-        self._server_clients: Dict[str, _ClusterServerClient] = {addr: _ClusterServerClient(addr, credential, parallelisation) for addr in self._fetch_server_addresses(addresses)}
+        self._query_cache = query_cache
+        self._retry_policy = retry_policy or ExponentialBackoff()
+        self._server_clients: Dict[str, _ClusterServerClient] = self._open_server_clients(
+            self._fetch_server_addresses(addresses), parallelisation, transmitter_mode, reader_thread, query_cache,
+            max_batch, max_delay_seconds)
         self._database_managers = _ClusterDatabaseManager(self)
-        self._cluster_databases: Dict[str, _ClusterDatabase] = {}
+        self._topology = _ReplicaTopology(self, self._TOPOLOGY_TTL_SECONDS, self._PROBE_DEADLINE_SECONDS)
         self._user_manager = _ClusterUserManager(self)
         self._is_open = True
 
     def _fetch_server_addresses(self, addresses: Iterable[str]) -> Set[str]:
-        for address in addresses:
-            try:
-                print("Fetching list of cluster servers from %s..." % address)
-                with _ClusterServerClient(address, self._credential) as client:
-                    res = client.stub().servers_all(cluster_server_manager_all_req())
-                    members = {srv.address for srv in res.servers}
-                    print("The cluster servers are %s" % [str(member) for member in members])
-                    return members
-            except TypeDBClientException as e:
-                if e.error_message is UNABLE_TO_CONNECT:
-                    print("Fetching cluster servers from %s failed. %s" % (address, str(e)))
-                else:
-                    raise e
-        raise TypeDBClientException.of(CLUSTER_UNABLE_TO_CONNECT, ",".join(addresses))
+        addresses = list(addresses)
+        print("Fetching list of cluster servers from %s..." % addresses)
+        probes = FanOut(self._fetch_server_addresses_from, addresses, self._PROBE_DEADLINE_SECONDS)
+        members = probes.first()
+        if members is not None:
+            print("The cluster servers are %s" % [str(member) for member in members])
+            return members
+        for address, error in probes.errors().items():
+            print("Fetching cluster servers from %s failed. %s" % (address, str(error)))
+        raise _unexpected_error(probes.errors()) or TypeDBClientException.of(CLUSTER_UNABLE_TO_CONNECT, ",".join(addresses))
+
+    def _fetch_server_addresses_from(self, address: str) -> Set[str]:
+        with _ClusterServerClient(address, self._credential) as client:
+            res = client.stub().servers_all(cluster_server_manager_all_req(), self._PROBE_DEADLINE_SECONDS)
+            return {srv.address for srv in res.servers}
+
+    def _open_server_clients(self, addresses: Set[str], parallelisation: int, transmitter_mode: TransmitterMode,
+                             reader_thread: bool, query_cache: Optional[_QueryCache], max_batch: int,
+                             max_delay_seconds: float) -> Dict[str, _ClusterServerClient]:
+        # Each server client opens its connection while being constructed, so they are all constructed at once. Once
+        # any has failed or missed the deadline, the others are closed, including those that only connect later.
+        opened: Dict[str, _ClusterServerClient] = {}
+        failed = False
+        lock = Lock()
+
+        def open_server_client(address: str) -> _ClusterServerClient:
+            client = _ClusterServerClient(address, self._credential, parallelisation, transmitter_mode, reader_thread,
+                                          query_cache, self, max_batch, max_delay_seconds)
+            with lock:
+                if not failed:
+                    opened[address] = client
+                    return client
+            client.close()
+            return client
+
+        server_clients = FanOut(open_server_client, addresses, self._PROBE_DEADLINE_SECONDS)
+        server_clients.all()
+        errors = server_clients.errors()
+        if errors:
+            with lock:
+                failed = True
+            for client in opened.values():
+                client.close()
+            raise next((error for error in errors.values() if not isinstance(error, TimeoutError)), None) or \
+                TypeDBClientException.of(CLUSTER_UNABLE_TO_CONNECT, ",".join(errors))
+        return opened
 
     def session(self, database: str, session_type: SessionType, options=None) -> _ClusterSession:
         if not self.is_open():
@@ -87,8 +134,8 @@ class _ClusterClient(TypeDBClusterClient):
     def databases(self) -> _ClusterDatabaseManager:
         return self._database_managers
 
-    def database_by_name(self) -> Dict[str, _ClusterDatabase]:
-        return self._cluster_databases
+    def topology(self) -> _ReplicaTopology:
+        return self._topology
 
     def server_addresses(self) -> Set[str]:
         return set(self._server_clients.keys())
@@ -102,6 +149,16 @@ class _ClusterClient(TypeDBClusterClient):
     def _stub(self, address: str) -> _ClusterServerStub:
         return self._server_clients.get(address).stub()
 
+    def query_cache(self) -> Optional[_QueryCache]:
+        return self._query_cache
+
+    def invalidate_schema_caches(self, database: str) -> None:
+        for client in self._server_clients.values():
+            client._invalidate_local_schema_caches(database)
+
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
     def is_cluster(self) -> bool:
         return True
 
@@ -114,6 +171,7 @@ class _ClusterClient(TypeDBClusterClient):
             return False
 
     def close(self) -> None:
+        self._topology.close()
         for client in self._server_clients.values():
             client.close()
         self._is_open = False
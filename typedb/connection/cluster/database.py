@@ -19,15 +19,13 @@
 # under the License.
 #
 from abc import ABC, abstractmethod
-from time import sleep
+from time import monotonic, sleep
 from typing import Dict, Optional, Set, TYPE_CHECKING
 
 import typedb_protocol.cluster.cluster_database_pb2 as cluster_database_proto
 
 from typedb.api.connection.database import ClusterDatabase
-from typedb.common.exception import TypeDBClientException, UNABLE_TO_CONNECT, CLUSTER_REPLICA_NOT_PRIMARY, \
-    CLUSTER_UNABLE_TO_CONNECT
-from typedb.common.rpc.request_builder import cluster_database_manager_get_req
+from typedb.common.exception import TypeDBClientException, CLUSTER_UNABLE_TO_CONNECT
 from typedb.connection.database import _TypeDBDatabaseImpl
 
 if TYPE_CHECKING:
@@ -51,11 +49,13 @@ class _ClusterDatabase(ClusterDatabase):
         assert proto_db.replicas
         database: str = proto_db.name
         database_cluster_rpc = _ClusterDatabase(database, client)
-        for proto_replica in proto_db.replicas:
-            database_cluster_rpc.replicas().add(_ClusterDatabase.Replica.of(proto_replica, database_cluster_rpc))
+        database_cluster_rpc.update_replicas(proto_db)
         print("Discovered database cluster: %s" % database_cluster_rpc)
         return database_cluster_rpc
 
+    def update_replicas(self, proto_db: cluster_database_proto.ClusterDatabase) -> None:
+        self._replicas = {_ClusterDatabase.Replica.of(proto_replica, self) for proto_replica in proto_db.replicas}
+
     def name(self) -> str:
         return self._name
 
@@ -65,6 +65,7 @@ class _ClusterDatabase(ClusterDatabase):
     def delete(self) -> None:
         delete_db_task = _DeleteDatabaseFailsafeTask(self._client, self._name, self._databases)
         delete_db_task.run_primary_replica()
+        self._client.topology().remove(self._name)
 
     def replicas(self):
         return self._replicas
@@ -152,13 +153,12 @@ class _ClusterDatabase(ClusterDatabase):
 # This class has to live here because of circular class creation between ClusterDatabase and FailsafeTask
 class _FailsafeTask(ABC):
 
-    PRIMARY_REPLICA_TASK_MAX_RETRIES = 10
-    FETCH_REPLICAS_MAX_RETRIES = 10
-    WAIT_FOR_PRIMARY_REPLICA_SELECTION_SECONDS: float = 2
-
     def __init__(self, client: "_ClusterClient", database: str):
         self.client = client
         self.database = database
+        self._retry_policy = client.retry_policy()
+        self._retries = 0
+        self._started_at = monotonic()
 
     @abstractmethod
     def run(self, replica: "_ClusterDatabase.Replica"):
@@ -168,68 +168,63 @@ class _FailsafeTask(ABC):
         return self.run(replica)
 
     def run_primary_replica(self):
-        if self.database not in self.client.database_by_name() or not self.client.database_by_name()[self.database].primary_replica():
-            self._seek_primary_replica()
-        replica = self.client.database_by_name()[self.database].primary_replica()
-        retries = 0
+        replica = self.client.topology().primary_replica(self.database) or self._seek_primary_replica()
+        is_rerun = False
         while True:
             try:
-                return self.run(replica) if retries == 0 else self.rerun(replica)
+                return self.rerun(replica) if is_rerun else self.run(replica)
             except TypeDBClientException as e:
-                if e.error_message in [CLUSTER_REPLICA_NOT_PRIMARY, UNABLE_TO_CONNECT]:
-                    print("Unable to open a session or transaction, retrying in 2s... %s" % str(e))
-                    sleep(self.WAIT_FOR_PRIMARY_REPLICA_SELECTION_SECONDS)
-                    replica = self._seek_primary_replica()
-                else:
+                if not self._retry_policy.is_retryable(e):
                     raise e
-            retries += 1
-            if retries > self.PRIMARY_REPLICA_TASK_MAX_RETRIES:
-                raise self._cluster_not_available_exception()
+                # The cached primary may just be stale, in which case the servers already know the new one.
+                primary = self.client.topology().fetch(self.database).primary_replica()
+                if primary is not None and primary.address() != replica.address():
+                    self._wait_before_retry("The primary replica has moved to %s" % primary.address(), e, immediate=True)
+                    replica = primary
+                else:
+                    # The lookup just made is still the latest news: retry the primary it names, if any
+                    self._wait_before_retry("Unable to open a session or transaction", e)
+                    replica = primary or self._seek_primary_replica()
+            is_rerun = True
 
     def run_any_replica(self):
-        if self.database in self.client.database_by_name():
-            cluster_database = self.client.database_by_name()[self.database]
-        else:
-            cluster_database = self._fetch_database_replicas()
-
-        replicas = [cluster_database.preferred_replica()] + [replica for replica in cluster_database.replicas() if not replica.is_preferred()]
-        retries = 0
-        for replica in replicas:
-            try:
-                return self.run(replica) if retries == 0 else self.rerun(replica)
-            except TypeDBClientException as e:
-                if e.error_message is UNABLE_TO_CONNECT:
-                    print("Unable to open a session or transaction to %s. Attempting next replica. %s" % (str(replica.replica_id()), str(e)))
-                else:
-                    raise e
-            retries += 1
-        raise self._cluster_not_available_exception()
+        cluster_database = self.client.topology().get(self.database) or self.client.topology().fetch(self.database)
+        is_rerun = False
+        while True:
+            replicas = [cluster_database.preferred_replica()] + [replica for replica in cluster_database.replicas() if not replica.is_preferred()]
+            for i, replica in enumerate(replicas):
+                try:
+                    return self.rerun(replica) if is_rerun else self.run(replica)
+                except TypeDBClientException as e:
+                    if not self._retry_policy.is_retryable(e):
+                        raise e
+                    # The next replica is tried straight away; once none is left, the same ones are tried again later
+                    if i + 1 < len(replicas):
+                        self._wait_before_retry("Unable to open a session or transaction to %s, attempting the next replica" % str(replica.replica_id()), e, immediate=True)
+                    else:
+                        self._wait_before_retry("Unable to open a session or transaction to any replica", e)
+                is_rerun = True
+            cluster_database = self.client.topology().fetch(self.database)
 
     def _seek_primary_replica(self) -> "_ClusterDatabase.Replica":
-        retries = 0
-        while retries < self.FETCH_REPLICAS_MAX_RETRIES:
-            cluster_database = self._fetch_database_replicas()
+        while True:
+            cluster_database = self.client.topology().fetch(self.database)
             if cluster_database.primary_replica():
                 return cluster_database.primary_replica()
-            else:
-                sleep(self.WAIT_FOR_PRIMARY_REPLICA_SELECTION_SECONDS)
-                retries += 1
-        raise self._cluster_not_available_exception()
-
-    def _fetch_database_replicas(self) -> "_ClusterDatabase":
-        for server_address in self.client.server_addresses():
-            try:
-                print("Fetching replica info from %s" % server_address)
-                res = self.client._stub(server_address).databases_get(cluster_database_manager_get_req(self.database))
-                cluster_database = _ClusterDatabase.of(res.database, self.client)
-                self.client.database_by_name()[self.database] = cluster_database
-                return cluster_database
-            except TypeDBClientException as e:
-                if e.error_message is UNABLE_TO_CONNECT:
-                    print("Unable to fetch replica info for database '%s' from %s. Attempting next address. %s" % (self.database, server_address, str(e)))
-                else:
-                    raise e
-        raise self._cluster_not_available_exception()
+            self._wait_before_retry("No primary replica of database '%s' has been elected" % self.database)
+
+    def _wait_before_retry(self, reason: str, error: TypeDBClientException = None, immediate: bool = False) -> None:
+        # Every retry of a task counts towards the same retry budget, whether it follows a failed attempt or a
+        # replica lookup that found no primary, and even when it goes ahead without waiting.
+        delay = self._retry_policy.next_delay(self._retries, monotonic() - self._started_at)
+        if delay is None:
+            raise self._cluster_not_available_exception()
+        self._retries += 1
+        if immediate:
+            print("%s, retrying now... %s" % (reason, str(error) if error else ""))
+        else:
+            print("%s, retrying in %.3fs... %s" % (reason, delay, str(error) if error else ""))
+            sleep(delay)
 
     def _cluster_not_available_exception(self) -> TypeDBClientException:
         return TypeDBClientException.of(CLUSTER_UNABLE_TO_CONNECT, str([str(addr) for addr in self.client.server_addresses()]))
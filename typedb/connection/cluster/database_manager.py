@@ -21,6 +21,7 @@
 from typing import Dict, List, TYPE_CHECKING, Callable, TypeVar
 
 from typedb.api.connection.database import ClusterDatabaseManager
+from typedb.common.concurrent.fan_out import FanOut
 from typedb.connection.cluster.database import _ClusterDatabase, _FailsafeTask
 from typedb.common.exception import TypeDBClientException, CLUSTER_ALL_NODES_FAILED, CLUSTER_REPLICA_NOT_PRIMARY, \
     DB_DOES_NOT_EXIST
@@ -52,17 +53,18 @@ class _ClusterDatabaseManager(ClusterDatabaseManager):
     def _get_database_task(self, name: str, stub: _ClusterServerStub):
         if self.contains(name):
             res = stub.databases_get(cluster_database_manager_get_req(name))
-            return _ClusterDatabase.of(res.database, self._client)
+            return self._client.topology().update(res.database)
         raise TypeDBClientException.of(DB_DOES_NOT_EXIST, name)
 
     def all(self) -> List[_ClusterDatabase]:
-        errors = []
-        for address in self._database_mgrs:
-            try:
-                res = self._client._stub(address).cluster_databases_all(cluster_database_manager_all_req())
-                return [_ClusterDatabase.of(db, self._client) for db in res.databases]
-            except TypeDBClientException as e:
-                errors.append("- %s: %s\n" % (address, e))
+        req = cluster_database_manager_all_req()
+        deadline_seconds = self._client._PROBE_DEADLINE_SECONDS
+        probes = FanOut(lambda address: self._client._stub(address).cluster_databases_all(req, deadline_seconds).databases,
+                        self._database_mgrs, deadline_seconds)
+        databases = probes.first()
+        if databases is not None:
+            return [self._client.topology().update(db) for db in databases]
+        errors = ["- %s: %s\n" % (address, e) for address, e in probes.errors().items()]
         raise TypeDBClientException.of(CLUSTER_ALL_NODES_FAILED, str([str(e) for e in errors]))
 
     def database_mgrs(self) -> Dict[str, _TypeDBDatabaseManagerImpl]:
@@ -18,21 +18,32 @@
 #   specific language governing permissions and limitations
 #   under the License.
 #
-from typing import Callable
+from typing import Callable, Optional, TYPE_CHECKING
 
 import grpc
 
+from typedb.api.connection.client import TransmitterMode
 from typedb.api.connection.credential import TypeDBCredential
 from typedb.connection.client import _TypeDBClientImpl
 from typedb.connection.cluster.stub import _ClusterServerStub
 from typedb.connection.database_manager import _TypeDBDatabaseManagerImpl
+from typedb.query.query_cache import _QueryCache
+from typedb.stream.request_transmitter import EVENT_DRIVEN_MAX_BATCH_SIZE, EVENT_DRIVEN_MAX_DELAY_SECS
+
+if TYPE_CHECKING:
+    from typedb.connection.cluster.client import _ClusterClient
 
 
 class _ClusterServerClient(_TypeDBClientImpl):
 
-    def __init__(self, address: str, credential: TypeDBCredential, parallelisation: int = 2):
-        super(_ClusterServerClient, self).__init__(address, parallelisation)
+    def __init__(self, address: str, credential: TypeDBCredential, parallelisation: int = 2,
+                 transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW, reader_thread: bool = False,
+                 query_cache: Optional[_QueryCache] = None, cluster_client: Optional["_ClusterClient"] = None,
+                 max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE, max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS):
+        super(_ClusterServerClient, self).__init__(address, parallelisation, transmitter_mode, reader_thread, query_cache,
+                                                   max_batch, max_delay_seconds)
         self._credential = credential
+        self._cluster_client = cluster_client
         if self._credential.tls_root_ca_path() is not None:
             with open(self._credential.tls_root_ca_path(), 'rb') as root_ca:
                 self._channel_credentials = grpc.ssl_channel_credentials(root_ca.read())
@@ -51,6 +62,13 @@ class _ClusterServerClient(_TypeDBClientImpl):
     def stub(self) -> _ClusterServerStub:
         return self._stub
 
+    def invalidate_schema_caches(self, database: str) -> None:
+        # A schema commit on one replica also stales the sessions opened on the other replicas
+        if self._cluster_client is not None:
+            self._cluster_client.invalidate_schema_caches(database)
+        else:
+            self._invalidate_local_schema_caches(database)
+
     def new_channel_and_stub(self) -> (grpc.Channel, _ClusterServerStub):
         channel = self._new_channel()
         return channel, _ClusterServerStub(channel, self._credential)
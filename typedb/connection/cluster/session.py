@@ -18,13 +18,14 @@
 # specific language governing permissions and limitations
 # under the License.
 #
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, List
 
 from typedb.api.connection.options import TypeDBClusterOptions, TypeDBOptions
 from typedb.api.connection.session import TypeDBSession, SessionType
 from typedb.api.connection.transaction import TransactionType
 from typedb.connection.cluster.database import _ClusterDatabase, _FailsafeTask
 from typedb.connection.database import _TypeDBDatabaseImpl
+from typedb.connection.session import _TypeDBSessionImpl
 from typedb.connection.transaction import _TypeDBTransactionImpl
 
 if TYPE_CHECKING:
@@ -37,8 +38,31 @@ class _ClusterSession(TypeDBSession):
         self.cluster_client = cluster_client
         self.server_client = cluster_client._cluster_server_client(server_address)
         print("Opening a session to '%s'" % server_address)
-        self.core_session = self.server_client.session(database, session_type, options)
         self._options = options
+        self._on_close: List[Callable[[], None]] = []
+        self._is_reopening = False
+        self.core_session = self._open_core_session(database, session_type)
+
+    def _open_core_session(self, database: str, session_type: SessionType) -> _TypeDBSessionImpl:
+        core_session = self.server_client.session(database, session_type, self._options)
+        core_session.on_close(lambda: self._on_core_session_close(core_session))
+        return core_session
+
+    def _on_core_session_close(self, core_session: _TypeDBSessionImpl) -> None:
+        # A core session closed to fail over to another replica does not close this session
+        if core_session is self.core_session and not self._is_reopening:
+            for function in self._on_close:
+                function()
+
+    def reopen(self, server_address: str) -> None:
+        self._is_reopening = True
+        try:
+            if self.core_session:
+                self.core_session.close()
+            self.server_client = self.cluster_client._cluster_server_client(server_address)
+            self.core_session = self._open_core_session(self.core_session.database().name(), self.session_type())
+        finally:
+            self._is_reopening = False
 
     def transaction(self, transaction_type: TransactionType, options: TypeDBClusterOptions = None) -> _TypeDBTransactionImpl:
         if not options:
@@ -60,6 +84,9 @@ class _ClusterSession(TypeDBSession):
     def is_open(self) -> bool:
         return self.core_session.is_open()
 
+    def on_close(self, function: Callable[[], None]) -> None:
+        self._on_close.append(function)
+
     def close(self) -> None:
         self.core_session.close()
 
@@ -87,8 +114,5 @@ class _TransactionFailsafeTask(_FailsafeTask):
         return self.cluster_session.core_session.transaction(self.transaction_type, self.options)
 
     def rerun(self, replica: _ClusterDatabase.Replica):
-        if self.cluster_session.core_session:
-            self.cluster_session.core_session.close()
-        self.cluster_session.server_client = self.cluster_session.cluster_client._cluster_server_client(replica.address())
-        self.cluster_session.core_session = self.cluster_session.server_client.session(self.database, self.cluster_session.session_type(), self.cluster_session.options())
+        self.cluster_session.reopen(replica.address())
         return self.cluster_session.core_session.transaction(self.transaction_type, self.options)
@@ -18,7 +18,7 @@
 #   specific language governing permissions and limitations
 #   under the License.
 #
-from typing import Iterator
+from typing import Iterator, Optional
 from typing import TypeVar, Callable
 
 import typedb_protocol.cluster.cluster_database_pb2 as cluster_database_proto
@@ -58,8 +58,9 @@ class _ClusterServerStub(TypeDBStub):
             if e2.error_message is not None and e2.error_message is not UNABLE_TO_CONNECT:
                 raise e2
 
-    def servers_all(self, req: cluster_server_proto.ServerManager.All.Req) -> cluster_server_proto.ServerManager.All.Res:
-        return self.may_renew_token(lambda: self._cluster_stub.servers_all(req))
+    def servers_all(self, req: cluster_server_proto.ServerManager.All.Req,
+                    timeout: Optional[float] = None) -> cluster_server_proto.ServerManager.All.Res:
+        return self.may_renew_token(lambda: self._cluster_stub.servers_all(req, timeout=timeout))
 
     def users_all(self, req: cluster_user_proto.ClusterUserManager.All.Req) -> cluster_user_proto.ClusterUserManager.All.Res:
         return self.may_renew_token(lambda: self._cluster_stub.users_all(req))
@@ -82,14 +83,16 @@ class _ClusterServerStub(TypeDBStub):
     def user_password_update(self, req: cluster_user_proto.ClusterUser.PasswordUpdate.Req) -> cluster_user_proto.ClusterUser.PasswordUpdate.Res:
         return self.may_renew_token(lambda: self._cluster_stub.user_password_update(req))
 
-    def cluster_databases_all(self, req: cluster_database_proto.ClusterDatabaseManager.All.Req) -> cluster_database_proto.ClusterDatabaseManager.All.Res:
-        return self.may_renew_token(lambda: self._cluster_stub.databases_all(req))
+    def cluster_databases_all(self, req: cluster_database_proto.ClusterDatabaseManager.All.Req,
+                              timeout: Optional[float] = None) -> cluster_database_proto.ClusterDatabaseManager.All.Res:
+        return self.may_renew_token(lambda: self._cluster_stub.databases_all(req, timeout=timeout))
 
     def databases_all(self, req: core_database_proto.CoreDatabaseManager.All.Req) -> core_database_proto.CoreDatabaseManager.All.Res:
         return self.may_renew_token(self.resilient_call(lambda: self.stub().databases_all(req)))
 
-    def databases_get(self, req: cluster_database_proto.ClusterDatabaseManager.Get.Req) -> cluster_database_proto.ClusterDatabaseManager.Get.Res:
-        return self.may_renew_token(lambda: self._cluster_stub.databases_get(req))
+    def databases_get(self, req: cluster_database_proto.ClusterDatabaseManager.Get.Req,
+                      timeout: Optional[float] = None) -> cluster_database_proto.ClusterDatabaseManager.Get.Res:
+        return self.may_renew_token(lambda: self._cluster_stub.databases_get(req, timeout=timeout))
 
     def databases_contains(self, req: core_database_proto.CoreDatabaseManager.Contains.Req) -> core_database_proto.CoreDatabaseManager.Contains.Res:
         return self.may_renew_token(lambda: super(_ClusterServerStub, self).databases_contains(req))
@@ -109,8 +112,9 @@ class _ClusterServerStub(TypeDBStub):
     def session_close(self, req: session_proto.Session.Close.Req) -> session_proto.Session.Close.Res:
         return self.may_renew_token(lambda: super(_ClusterServerStub, self).session_close(req))
 
-    def session_pulse(self, req: session_proto.Session.Pulse.Req) -> session_proto.Session.Pulse.Res:
-        return self.may_renew_token(lambda: super(_ClusterServerStub, self).session_pulse(req))
+    def session_pulse(self, req: session_proto.Session.Pulse.Req,
+                      timeout: Optional[float] = None) -> session_proto.Session.Pulse.Res:
+        return self.may_renew_token(lambda: super(_ClusterServerStub, self).session_pulse(req, timeout))
 
     def transaction(self, request_iterator: Iterator[transaction_proto.Transaction.Client]) -> Iterator[transaction_proto.Transaction.Server]:
         return self.may_renew_token(lambda: super(_ClusterServerStub, self).transaction(request_iterator))
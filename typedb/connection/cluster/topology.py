@@ -0,0 +1,120 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+from threading import Lock
+from time import monotonic
+from typing import Dict, Optional, TYPE_CHECKING
+
+import typedb_protocol.cluster.cluster_database_pb2 as cluster_database_proto
+
+from typedb.common.concurrent.fan_out import FanOut
+from typedb.common.concurrent.timer_service import TimerService
+from typedb.common.exception import TypeDBClientException, UNABLE_TO_CONNECT, CLUSTER_UNABLE_TO_CONNECT
+from typedb.common.rpc.request_builder import cluster_database_manager_get_req
+from typedb.connection.cluster.database import _ClusterDatabase
+
+if TYPE_CHECKING:
+    from typedb.connection.cluster.client import _ClusterClient
+
+
+class _ReplicaTopology:
+    """
+    Caches the replicas of every database a cluster client has used, so that sessions and transactions go straight to
+    a known primary. Entries not updated for ttl_seconds are refreshed in the background, and a failsafe task fetches
+    an entry again as soon as its primary turns out to be stale.
+    """
+
+    def __init__(self, client: "_ClusterClient", ttl_seconds: float, probe_deadline_seconds: float,
+                 timer_service: TimerService = None):
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._probe_deadline_seconds = probe_deadline_seconds
+        self._databases: Dict[str, _ClusterDatabase] = {}
+        self._updated_at: Dict[str, float] = {}
+        self._lock = Lock()
+        if ttl_seconds > 0:
+            self._refresh_task = (timer_service or TimerService.shared()).schedule_at_fixed_rate(
+                ttl_seconds / 2, self._refresh_expired)
+        else:
+            self._refresh_task = None
+
+    def get(self, database: str) -> Optional[_ClusterDatabase]:
+        return self._databases.get(database)
+
+    def primary_replica(self, database: str) -> Optional[_ClusterDatabase.Replica]:
+        cluster_database = self._databases.get(database)
+        return cluster_database.primary_replica() if cluster_database else None
+
+    def fetch(self, database: str, quiet: bool = False) -> _ClusterDatabase:
+        # The background refresh is quiet, so that a client at rest does not print every ttl_seconds
+        if not quiet:
+            print("Fetching replica info for database '%s'" % database)
+        req = cluster_database_manager_get_req(database)
+        # Each call starts with the fan-out, so the whole deadline is what remains of it
+        deadline_seconds = self._probe_deadline_seconds
+        probes = FanOut(lambda address: self._client._stub(address).databases_get(req, deadline_seconds).database,
+                        self._client.server_addresses(), deadline_seconds)
+        # During an election only some servers may know the new primary, so an answer naming one is preferred.
+        proto_db = probes.first(accept=lambda db: any(replica.primary for replica in db.replicas))
+        if proto_db is not None:
+            return self.update(proto_db)
+        if not quiet:
+            for address, error in probes.errors().items():
+                print("Unable to fetch replica info for database '%s' from %s. %s" % (database, address, str(error)))
+        raise _unexpected_error(probes.errors()) or \
+            TypeDBClientException.of(CLUSTER_UNABLE_TO_CONNECT, str([str(addr) for addr in self._client.server_addresses()]))
+
+    def update(self, proto_db: cluster_database_proto.ClusterDatabase) -> _ClusterDatabase:
+        with self._lock:
+            cluster_database = self._databases.get(proto_db.name)
+            if cluster_database is None:
+                cluster_database = self._databases[proto_db.name] = _ClusterDatabase.of(proto_db, self._client)
+            else:
+                cluster_database.update_replicas(proto_db)
+            self._updated_at[proto_db.name] = monotonic()
+            return cluster_database
+
+    def remove(self, database: str) -> None:
+        with self._lock:
+            self._databases.pop(database, None)
+            self._updated_at.pop(database, None)
+
+    def close(self) -> None:
+        if self._refresh_task:
+            self._refresh_task.cancel()
+
+    def _refresh_expired(self) -> None:
+        with self._lock:
+            expired = [database for database, updated_at in self._updated_at.items()
+                       if monotonic() - updated_at >= self._ttl_seconds]
+        for database in expired:
+            try:
+                self.fetch(database, quiet=True)
+            except TypeDBClientException as e:
+                # While the cluster is unreachable the cached entry is kept, and the next operation on the database
+                # looks its replicas up itself. Any other error, such as the database having been deleted, drops it.
+                if e.error_message is not CLUSTER_UNABLE_TO_CONNECT:
+                    self.remove(database)
+
+
+def _unexpected_error(errors: Dict[str, Exception]) -> Optional[Exception]:
+    # Servers that cannot be reached are expected while probing a cluster; anything else is raised to the caller.
+    return next((error for error in errors.values() if not isinstance(error, TimeoutError)
+                 and not (isinstance(error, TypeDBClientException) and error.error_message is UNABLE_TO_CONNECT)), None)
@@ -19,19 +19,27 @@
 # under the License.
 #
 
+from typing import Optional
+
 from grpc import Channel, insecure_channel
 
+from typedb.api.connection.client import TransmitterMode
 from typedb.common.exception import TypeDBClientException, CLIENT_NOT_OPEN
 from typedb.common.rpc.stub import TypeDBStub
 from typedb.connection.client import _TypeDBClientImpl
 from typedb.connection.core.stub import _CoreStub
 from typedb.connection.database_manager import _TypeDBDatabaseManagerImpl
+from typedb.query.query_cache import _QueryCache
+from typedb.stream.request_transmitter import EVENT_DRIVEN_MAX_BATCH_SIZE, EVENT_DRIVEN_MAX_DELAY_SECS
 
 
 class _CoreClient(_TypeDBClientImpl):
 
-    def __init__(self, address: str, parallelisation: int = 2):
-        super(_CoreClient, self).__init__(address, parallelisation)
+    def __init__(self, address: str, parallelisation: int = 2, transmitter_mode: TransmitterMode = TransmitterMode.BATCH_WINDOW,
+                 reader_thread: bool = False, query_cache: Optional[_QueryCache] = None,
+                 max_batch: int = EVENT_DRIVEN_MAX_BATCH_SIZE, max_delay_seconds: float = EVENT_DRIVEN_MAX_DELAY_SECS):
+        super(_CoreClient, self).__init__(address, parallelisation, transmitter_mode, reader_thread, query_cache,
+                                          max_batch, max_delay_seconds)
         self._channel, self._stub = self.new_channel_and_stub()
         self._databases = _TypeDBDatabaseManagerImpl(self.stub())
         self._is_open = True
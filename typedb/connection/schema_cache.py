@@ -0,0 +1,75 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+from threading import Lock
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+import typedb_protocol.common.concept_pb2 as concept_proto
+
+
+class _SchemaCache:
+    """
+    Answers thing type lookups and type traversals of a data session from memory. Thing types are loaded together
+    by the first lookup, while each traversal is stored on first use. Cleared whenever a schema write transaction
+    on the same database commits through the same client, or through any server client of the same cluster client.
+
+    Each clear advances the cache's generation. A transaction captures it when it opens and passes it with every
+    lookup: a transaction opened before the last clear may still read the old schema, so it neither reads nor stores
+    entries, and loads everything itself.
+
+    Types are held as protos, which each transaction decodes through its own type cache, so that a type from here is
+    the same instance as the one in that transaction's answers.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._generation = 0
+        self._thing_types: Optional[Dict[str, concept_proto.Type]] = None
+        self._traversals: Dict[Hashable, List[concept_proto.Type]] = {}
+
+    def generation(self) -> int:
+        return self._generation
+
+    def thing_type(self, label: str, generation: int,
+                   load_all: Callable[[], Iterable[concept_proto.Type]]) -> Optional[concept_proto.Type]:
+        thing_types = self._thing_types if generation == self._generation else None
+        if thing_types is None:
+            thing_types = {thing_type.label: thing_type for thing_type in load_all()}
+            with self._lock:
+                if generation == self._generation:
+                    self._thing_types = thing_types
+        return thing_types.get(label)
+
+    def traversal(self, key: Hashable, generation: int,
+                  load: Callable[[], Iterable[concept_proto.Type]]) -> Iterator[concept_proto.Type]:
+        types = self._traversals.get(key) if generation == self._generation else None
+        if types is None:
+            types = list(load())
+            with self._lock:
+                if generation == self._generation:
+                    self._traversals[key] = types
+        return iter(types)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._thing_types = None
+            self._traversals = {}
@@ -19,9 +19,10 @@
 # under the License.
 #
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 import typedb_protocol.common.session_pb2 as session_proto
+from grpc import RpcError, StatusCode
 
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.connection.session import TypeDBSession, SessionType
@@ -31,6 +32,7 @@ from typedb.common.concurrent.lock import ReadWriteLock
 from typedb.common.rpc.request_builder import session_open_req
 from typedb.common.rpc.stub import TypeDBStub
 from typedb.connection.database import _TypeDBDatabaseImpl
+from typedb.connection.schema_cache import _SchemaCache
 from typedb.connection.transaction import _TypeDBTransactionImpl
 from typedb.stream.request_transmitter import RequestTransmitter
 
@@ -50,6 +52,7 @@ class _TypeDBSessionImpl(TypeDBSession):
         self._options = options
         self._rw_lock = ReadWriteLock()
         self._database = _TypeDBDatabaseImpl(stub=self._stub(), name=database)
+        self._schema_cache = _SchemaCache() if session_type.is_data() and options.get_schema_cache() else None
 
         start_time = time.time() * 1000.0
         res = self._stub().session_open(session_open_req(database, session_type.proto(), options.proto()))
@@ -57,6 +60,8 @@ class _TypeDBSessionImpl(TypeDBSession):
         self._network_latency_millis = max(int(end_time - start_time - res.server_duration_millis), 1)
         self._session_id = res.session_id
         self._is_open = AtomicBoolean(True)
+        self._pulse_in_flight = AtomicBoolean(False)
+        self._on_close: List[Callable[[], None]] = []
 
     def is_open(self) -> bool:
         return self._is_open.get()
@@ -79,6 +84,9 @@ class _TypeDBSessionImpl(TypeDBSession):
         finally:
             self._rw_lock.release_read()
 
+    def schema_cache(self) -> Optional[_SchemaCache]:
+        return self._schema_cache
+
     def session_id(self) -> bytes:
         return self._session_id
 
@@ -91,10 +99,15 @@ class _TypeDBSessionImpl(TypeDBSession):
     def network_latency_millis(self) -> int:
         return self._network_latency_millis
 
+    def on_close(self, function: Callable[[], None]) -> None:
+        self._on_close.append(function)
+
     def close(self) -> None:
+        closed = False
         try:
             self._rw_lock.acquire_write()
             if self._is_open.compare_and_set(True, False):
+                closed = True
                 self._client.remove_session(self)
                 req = session_proto.Session.Close.Req()
                 req.session_id = self._session_id
@@ -104,21 +117,38 @@ class _TypeDBSessionImpl(TypeDBSession):
                     pass
         finally:
             self._rw_lock.release_write()
+        if closed:
+            self._run_on_close()
 
     def client(self) -> "_TypeDBClientImpl":
         return self._client
 
-    def transmit_pulse(self):
-        if not self.is_open():
-            return
-        pulse_req = session_proto.Session.Pulse.Req()
-        pulse_req.session_id = self._session_id
+    def claim_pulse(self) -> bool:
+        # Claims the next pulse for the caller, unless the previous one is still in flight
+        return self._pulse_in_flight.compare_and_set(False, True)
+
+    def transmit_pulse(self, timeout: Optional[float] = None):
         try:
-            alive = self._stub().session_pulse(pulse_req).alive
-        except TypeDBClientException:
-            alive = False
-        if not alive:
-            self._is_open.set(False)
+            if not self.is_open():
+                return
+            pulse_req = session_proto.Session.Pulse.Req()
+            pulse_req.session_id = self._session_id
+            try:
+                alive = self._stub().session_pulse(pulse_req, timeout).alive
+            except TypeDBClientException as e:
+                # A pulse that timed out says nothing about the session, which the next one may still keep alive
+                if isinstance(e.__cause__, RpcError) and e.__cause__.code() is StatusCode.DEADLINE_EXCEEDED:
+                    return
+                alive = False
+            if not alive and self._is_open.compare_and_set(True, False):
+                self._client.remove_session(self)
+                self._run_on_close()
+        finally:
+            self._pulse_in_flight.set(False)
+
+    def _run_on_close(self) -> None:
+        for function in self._on_close:
+            function()
 
     def _stub(self) -> TypeDBStub:
         return self._client.stub()
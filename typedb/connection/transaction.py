@@ -19,17 +19,22 @@
 # under the License.
 #
 
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterator, Optional
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 from grpc import RpcError
 from typedb.api.connection.options import TypeDBOptions
 from typedb.api.connection.transaction import _TypeDBTransactionExtended, TransactionType
 from typedb.api.query.future import QueryFuture
-from typedb.common.exception import TypeDBClientException, TRANSACTION_CLOSED, TRANSACTION_CLOSED_WITH_ERRORS
+from typedb.common.concurrent.atomic import AtomicBoolean
+from typedb.common.exception import TypeDBClientException, TRANSACTION_CLOSED, TRANSACTION_CLOSED_WITH_ERRORS, \
+    UNABLE_TO_CONNECT
 from typedb.common.rpc.request_builder import transaction_commit_req, transaction_rollback_req, transaction_open_req
 from typedb.concept.concept_manager import _ConceptManager
+from typedb.concept.proto.type_cache import _TypeCache
+from typedb.connection.schema_cache import _SchemaCache
 from typedb.logic.logic_manager import _LogicManager
+from typedb.query.query_cache import _QueryCache
 from typedb.query.query_manager import _QueryManager
 from typedb.stream.bidirectional_stream import BidirectionalStream
 
@@ -42,20 +47,38 @@ class _TypeDBTransactionImpl(_TypeDBTransactionExtended):
     def __init__(self, session: "_TypeDBSessionImpl", transaction_type: TransactionType, options: TypeDBOptions = None):
         if not options:
             options = TypeDBOptions.core()
+        self._session = session
         self._transaction_type = transaction_type
         self._options = options
         self._concept_manager = _ConceptManager(self)
         self._query_manager = _QueryManager(self)
         self._logic_manager = _LogicManager(self)
-
+        self._type_cache = _TypeCache()
+        # Captured before the transaction opens, so that it never records answers read before a later invalidation
+        query_cache = self.query_cache()
+        self._query_cache_generation = query_cache.generation(self.database_name()) if query_cache is not None else 0
+        schema_cache = self.schema_cache()
+        self._schema_cache_generation = schema_cache.generation() if schema_cache is not None else 0
+
+        self._channel_pool = session.client().channel_pool()
+        self._channel_borrowed = AtomicBoolean(False)
         try:
-            self._channel, stub = session.client().new_channel_and_stub()
-            self._bidirectional_stream = BidirectionalStream(stub, session.transmitter())
+            self._channel_entry = self._channel_pool.borrow()
+            self._channel_borrowed.set(True)
+            self._bidirectional_stream = BidirectionalStream(self._channel_entry.stub(), session.transmitter(),
+                                                             session.client().is_reader_thread_enabled(),
+                                                             options.get_stream_buffer_size(),
+                                                             options.get_stream_buffer_bytes())
             req = transaction_open_req(session.session_id(), transaction_type.proto(), options.proto(),
                                        session.network_latency_millis())
             self.execute(request=req, batch=False)
         except RpcError as e:
-            raise TypeDBClientException.of_rpc(e)
+            error = TypeDBClientException.of_rpc(e)
+            self._release_channel(error)
+            raise error
+        except TypeDBClientException as e:
+            self._release_channel(e)
+            raise e
 
     def transaction_type(self) -> TransactionType:
         return self._transaction_type
@@ -75,6 +98,24 @@ class _TypeDBTransactionImpl(_TypeDBTransactionExtended):
     def query(self) -> _QueryManager:
         return self._query_manager
 
+    def type_cache(self) -> _TypeCache:
+        return self._type_cache
+
+    def schema_cache(self) -> Optional[_SchemaCache]:
+        return self._session.schema_cache()
+
+    def query_cache(self) -> Optional[_QueryCache]:
+        return self._session.client().query_cache() if self._transaction_type.is_read() else None
+
+    def schema_cache_generation(self) -> int:
+        return self._schema_cache_generation
+
+    def query_cache_generation(self) -> int:
+        return self._query_cache_generation
+
+    def database_name(self) -> str:
+        return self._session.database().name()
+
     def execute(self, request: transaction_proto.Transaction.Req,
                 batch: bool = True) -> transaction_proto.Transaction.Res:
         return self.run_query(request, batch).get()
@@ -90,17 +131,32 @@ class _TypeDBTransactionImpl(_TypeDBTransactionExtended):
             self._raise_transaction_closed()
         return self._bidirectional_stream.stream(request)
 
+    def stream_void(self, request: transaction_proto.Transaction.Req) -> None:
+        if not self.is_open():
+            self._raise_transaction_closed()
+        self._bidirectional_stream.stream_void(request)
+
     def commit(self):
         try:
             self.execute(transaction_commit_req())
+            if self._transaction_type.is_write():
+                self._invalidate_caches()
         finally:
             self.close()
 
+    def _invalidate_caches(self):
+        client = self._session.client()
+        if self._session.session_type().is_schema():
+            client.invalidate_schema_caches(self.database_name())
+        if client.query_cache() is not None:
+            client.query_cache().invalidate(self.database_name())
+
     def rollback(self):
         self.execute(transaction_rollback_req())
 
     def close(self):
         self._bidirectional_stream.close()
+        self._release_channel(self._bidirectional_stream.get_error())
 
     def __enter__(self):
         return self
@@ -110,6 +166,12 @@ class _TypeDBTransactionImpl(_TypeDBTransactionExtended):
         if exc_tb is not None:
             return False
 
+    def _release_channel(self, error: TypeDBClientException = None):
+        if self._channel_borrowed.compare_and_set(True, False):
+            if error is not None and error.error_message is UNABLE_TO_CONNECT:
+                self._channel_entry.mark_broken()
+            self._channel_pool.give_back(self._channel_entry)
+
     def _raise_transaction_closed(self):
         error = self._bidirectional_stream.get_error()
         if error is None:
@@ -26,6 +26,7 @@ from typedb.api.answer.concept_map import ConceptMap
 from typedb.api.logic.explanation import Explanation
 from typedb.api.logic.rule import Rule
 from typedb.concept.answer.concept_map import _ConceptMap
+from typedb.concept.proto.type_cache import _TypeCache
 from typedb.logic.rule import _Rule
 
 
@@ -46,9 +47,10 @@ class _Explanation(Explanation):
         self._condition = condition
 
     @staticmethod
-    def of(explanation: logic_proto.Explanation):
+    def of(explanation: logic_proto.Explanation, type_cache: _TypeCache = None):
         return _Explanation(_Rule.of(explanation.rule), _var_mapping_of(explanation.var_mapping),
-                            _ConceptMap.of(explanation.conclusion), _ConceptMap.of(explanation.condition))
+                            _ConceptMap.of(explanation.conclusion, type_cache),
+                            _ConceptMap.of(explanation.condition, type_cache))
 
     def rule(self) -> Rule:
         return self._rule
@@ -0,0 +1,223 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from typing import Deque, Dict, Hashable, Iterator, Optional, Tuple
+
+from typedb.api.connection.client import TypeDBClient
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import SessionType, TypeDBSession
+from typedb.common.exception import TypeDBClientException, NEGATIVE_VALUE_NOT_ALLOWED, SESSION_POOL_CLOSED, \
+    SESSION_POOL_TIMEOUT
+
+
+class SessionPoolMetrics:
+
+    def __init__(self, sessions: int, idle: int, borrows: int, opened: int, replaced: int, total_wait_seconds: float,
+                 max_wait_seconds: float):
+        self._sessions = sessions
+        self._idle = idle
+        self._borrows = borrows
+        self._opened = opened
+        self._replaced = replaced
+        self._total_wait_seconds = total_wait_seconds
+        self._max_wait_seconds = max_wait_seconds
+
+    def sessions(self) -> int:
+        return self._sessions
+
+    def idle(self) -> int:
+        return self._idle
+
+    def in_use(self) -> int:
+        return self._sessions - self._idle
+
+    def borrows(self) -> int:
+        return self._borrows
+
+    def opened(self) -> int:
+        return self._opened
+
+    def replaced(self) -> int:
+        return self._replaced
+
+    def total_wait_seconds(self) -> float:
+        return self._total_wait_seconds
+
+    def mean_wait_seconds(self) -> float:
+        return self._total_wait_seconds / self._borrows if self._borrows else 0.0
+
+    def max_wait_seconds(self) -> float:
+        return self._max_wait_seconds
+
+    def __str__(self):
+        return "SessionPoolMetrics[sessions: %d, in use: %d, borrows: %d, opened: %d, replaced: %d, " \
+               "mean wait: %.3fms, max wait: %.3fms]" % (
+                   self._sessions, self.in_use(), self._borrows, self._opened, self._replaced,
+                   self.mean_wait_seconds() * 1000, self._max_wait_seconds * 1000)
+
+
+class SessionPool:
+    """
+    Hands out open sessions of a client to threads, keeping up to max_sessions of them per database, session type
+    and options. Idle sessions stay registered with the client, whose pulses keep them alive; a session found closed,
+    whether by a failed pulse or by its borrower, is dropped and replaced by a new one. Omitted options stand for the
+    client's default options, so they share a pool with those options given explicitly.
+    """
+
+    def __init__(self, client: TypeDBClient, max_sessions: int = 8, borrow_timeout_seconds: Optional[float] = None):
+        if max_sessions < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, max_sessions)
+        self._client = client
+        self._max_sessions = max_sessions
+        self._borrow_timeout_seconds = borrow_timeout_seconds
+        self._idle: Dict[Hashable, Deque[TypeDBSession]] = {}
+        self._sizes: Dict[Hashable, int] = {}
+        self._borrowed: Dict[TypeDBSession, Hashable] = {}
+        self._condition = Condition()
+        self._is_open = True
+        self._borrows = 0
+        self._opened = 0
+        self._replaced = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+
+    @contextmanager
+    def session(self, database: str, session_type: SessionType, options: TypeDBOptions = None) -> Iterator[TypeDBSession]:
+        session = self.borrow(database, session_type, options)
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def borrow(self, database: str, session_type: SessionType, options: TypeDBOptions = None) -> TypeDBSession:
+        if not options:
+            options = TypeDBOptions.cluster() if self._client.is_cluster() else TypeDBOptions.core()
+        key = _key(database, session_type, options)
+        start = time.monotonic()
+        deadline = start + self._borrow_timeout_seconds if self._borrow_timeout_seconds is not None else None
+        with self._condition:
+            while True:
+                if not self._is_open:
+                    raise TypeDBClientException.of(SESSION_POOL_CLOSED)
+                idle = self._idle.get(key)
+                if idle:
+                    session = idle.pop()
+                    if session.is_open():
+                        self._record_borrow(session, key, start)
+                        return session
+                    self._sizes[key] -= 1
+                    self._replaced += 1
+                elif self._sizes.get(key, 0) < self._max_sessions:
+                    self._sizes[key] = self._sizes.get(key, 0) + 1
+                    break
+                else:
+                    remaining = deadline - time.monotonic() if deadline is not None else None
+                    if remaining is not None and remaining <= 0:
+                        raise TypeDBClientException.of(SESSION_POOL_TIMEOUT, (self._borrow_timeout_seconds, session_type.name, database))
+                    self._condition.wait(remaining)
+        session = self._open(key, database, session_type, options)
+        with self._condition:
+            self._record_borrow(session, key, start)
+        return session
+
+    def release(self, session: TypeDBSession) -> None:
+        with self._condition:
+            key = self._borrowed.pop(session)
+            if self._is_open and session.is_open():
+                self._idle.setdefault(key, deque()).append(session)
+                session = None
+            else:
+                self._sizes[key] -= 1
+                if self._is_open:
+                    self._replaced += 1
+            self._condition.notify_all()
+        if session is not None:
+            session.close()
+
+    def prewarm(self, database: str, session_type: SessionType, options: TypeDBOptions = None, count: int = 1) -> None:
+        sessions = [self.borrow(database, session_type, options) for _ in range(count)]
+        for session in sessions:
+            self.release(session)
+
+    def metrics(self) -> SessionPoolMetrics:
+        with self._condition:
+            return SessionPoolMetrics(sum(self._sizes.values()), sum(len(idle) for idle in self._idle.values()),
+                                      self._borrows, self._opened, self._replaced, self._total_wait_seconds,
+                                      self._max_wait_seconds)
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_open = False
+            idle = []
+            for key, sessions in self._idle.items():
+                self._sizes[key] -= len(sessions)
+                idle.extend(sessions)
+            self._idle.clear()
+            self._condition.notify_all()
+        for session in idle:
+            session.close()
+
+    def _open(self, key: Hashable, database: str, session_type: SessionType, options: TypeDBOptions) -> TypeDBSession:
+        try:
+            session = self._client.session(database, session_type, options)
+        except BaseException:
+            with self._condition:
+                self._sizes[key] -= 1
+                self._condition.notify_all()
+            raise
+        session.on_close(lambda: self._evict(key, session))
+        with self._condition:
+            self._opened += 1
+        return session
+
+    def _evict(self, key: Hashable, session: TypeDBSession) -> None:
+        # An idle session that a pulse finds dead is dropped at once, rather than on its next borrow; a borrowed one is
+        # left to release()
+        with self._condition:
+            idle = self._idle.get(key)
+            if idle and session in idle:
+                idle.remove(session)
+                self._sizes[key] -= 1
+                self._replaced += 1
+                self._condition.notify_all()
+
+    def _record_borrow(self, session: TypeDBSession, key: Hashable, start: float):
+        wait_seconds = time.monotonic() - start
+        self._borrowed[session] = key
+        self._borrows += 1
+        self._total_wait_seconds += wait_seconds
+        self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
+
+
+def _key(database: str, session_type: SessionType, options: TypeDBOptions) -> Tuple:
+    return database, session_type, type(options), tuple(sorted(vars(options).items()))
@@ -0,0 +1,137 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+
+import time
+from collections import deque
+from threading import Condition, Thread
+from typing import Deque, Optional, Tuple
+
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.connection.session import TypeDBSession
+from typedb.api.connection.transaction import TypeDBTransaction, TransactionType
+from typedb.common.exception import TypeDBClientException, NEGATIVE_VALUE_NOT_ALLOWED, NON_POSITIVE_DURATION_NOT_ALLOWED
+
+_DEFAULT_TRANSACTION_TIMEOUT_MILLIS = 300_000
+_REFRESH_FRACTION = 0.8
+_RETRY_INTERVAL_SECONDS = 1.0
+
+
+class TransactionPool:
+    """
+    Keeps up to size READ transactions of a session open ahead of time, so that transaction() returns one without
+    waiting for the server. Each transaction is handed out once and closed by its borrower; a background thread opens
+    its replacement. Transactions read the data as of when they were opened, so idle ones are replaced once they reach
+    max_age_seconds, which defaults to a margin before the transaction timeout at which the server would close them.
+    """
+
+    def __init__(self, session: TypeDBSession, size: int = 4, options: TypeDBOptions = None,
+                 max_age_seconds: Optional[float] = None):
+        if size < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, size)
+        if max_age_seconds is not None and max_age_seconds <= 0:
+            raise TypeDBClientException.of(NON_POSITIVE_DURATION_NOT_ALLOWED, (max_age_seconds,))
+        if not options:
+            options = TypeDBOptions.core()
+        timeout_millis = options.get_transaction_timeout_millis() or _DEFAULT_TRANSACTION_TIMEOUT_MILLIS
+        self._session = session
+        self._size = size
+        self._options = options
+        self._max_age_seconds = min(float("inf") if max_age_seconds is None else max_age_seconds, timeout_millis / 1000 * _REFRESH_FRACTION)
+        self._ready: Deque[Tuple[float, TypeDBTransaction]] = deque()
+        self._condition = Condition()
+        self._is_open = True
+        self._hits = 0
+        self._misses = 0
+        self._refreshed = 0
+        Thread(target=self._refill, name="typedb-transaction-pool", daemon=True).start()
+
+    def transaction(self) -> TypeDBTransaction:
+        expired = []
+        try:
+            with self._condition:
+                while self._ready:
+                    opened_at, transaction = self._ready.popleft()
+                    if transaction.is_open() and time.monotonic() - opened_at < self._max_age_seconds:
+                        self._hits += 1
+                        return transaction
+                    expired.append(transaction)
+                self._misses += 1
+            return self._session.transaction(TransactionType.READ, self._options)
+        finally:
+            with self._condition:
+                self._condition.notify_all()
+            for transaction in expired:
+                transaction.close()
+
+    def hits(self) -> int:
+        return self._hits
+
+    def misses(self) -> int:
+        return self._misses
+
+    def refreshed(self) -> int:
+        return self._refreshed
+
+    def close(self) -> None:
+        with self._condition:
+            self._is_open = False
+            ready = [transaction for _, transaction in self._ready]
+            self._ready.clear()
+            self._condition.notify_all()
+        for transaction in ready:
+            transaction.close()
+
+    def _refill(self):
+        while True:
+            expired = None
+            with self._condition:
+                while self._is_open and len(self._ready) >= self._size \
+                        and time.monotonic() - self._ready[0][0] < self._max_age_seconds:
+                    self._condition.wait(self._ready[0][0] + self._max_age_seconds - time.monotonic())
+                if not self._is_open:
+                    return
+                if len(self._ready) >= self._size:
+                    expired = self._ready.popleft()[1]
+                    self._refreshed += 1
+            if expired is not None:
+                expired.close()
+            if not self._session.is_open():
+                self.close()
+                return
+            try:
+                transaction = self._session.transaction(TransactionType.READ, self._options)
+            except TypeDBClientException:
+                time.sleep(_RETRY_INTERVAL_SECONDS)
+                continue
+            with self._condition:
+                if self._is_open:
+                    self._ready.append((time.monotonic(), transaction))
+                    transaction = None
+            if transaction is not None:
+                transaction.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        if exc_tb is not None:
+            return False
@@ -0,0 +1,171 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import math
+import re
+from datetime import date, datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Mapping, Tuple
+
+import typedb_protocol.common.transaction_pb2 as transaction_proto
+
+from typedb.api.answer.concept_map import ConceptMap
+from typedb.api.answer.concept_map_group import ConceptMapGroup
+from typedb.api.answer.numeric import Numeric
+from typedb.api.answer.numeric_group import NumericGroup
+from typedb.api.connection.options import TypeDBOptions
+from typedb.api.query.future import QueryFuture
+from typedb.api.query.prepared_query import PreparedQuery
+from typedb.common.exception import TypeDBClientException, MISSING_QUERY_PARAMETER, UNKNOWN_QUERY_PARAMETER, \
+    INVALID_QUERY_PARAMETER
+from typedb.common.rpc.request_builder import query_manager_match_req, query_manager_match_aggregate_req, \
+    query_manager_match_group_req, query_manager_match_group_aggregate_req, query_manager_insert_req, \
+    query_manager_delete_req, query_manager_update_req
+
+if TYPE_CHECKING:
+    from typedb.query.query_manager import _QueryManager
+
+
+class _PreparedQuery(PreparedQuery):
+
+    def __init__(self, query_manager: "_QueryManager", template: str, options: TypeDBOptions):
+        self._query_manager = query_manager
+        self._template = _QueryTemplate(template)
+        self._options = options.proto()
+        self._reqs: Dict[str, transaction_proto.Transaction.Req] = {}
+
+    def template(self) -> str:
+        return self._template.text()
+
+    def parameters(self) -> Tuple[str, ...]:
+        return self._template.parameters()
+
+    def match(self, **parameters) -> Iterator[ConceptMap]:
+        return self._query_manager.run_match(self._req("match_req", query_manager_match_req, parameters))
+
+    def match_aggregate(self, **parameters) -> QueryFuture[Numeric]:
+        return self._query_manager.run_match_aggregate(self._req("match_aggregate_req", query_manager_match_aggregate_req, parameters))
+
+    def match_group(self, **parameters) -> Iterator[ConceptMapGroup]:
+        return self._query_manager.run_match_group(self._req("match_group_req", query_manager_match_group_req, parameters))
+
+    def match_group_aggregate(self, **parameters) -> Iterator[NumericGroup]:
+        return self._query_manager.run_match_group_aggregate(self._req("match_group_aggregate_req", query_manager_match_group_aggregate_req, parameters))
+
+    def insert(self, **parameters) -> Iterator[ConceptMap]:
+        return self._query_manager.run_insert(self._req("insert_req", query_manager_insert_req, parameters))
+
+    def insert_void(self, **parameters) -> None:
+        self._query_manager.run_insert_void(self._req("insert_req", query_manager_insert_req, parameters))
+
+    def delete(self, **parameters) -> QueryFuture:
+        return self._query_manager.query_void(self._req("delete_req", query_manager_delete_req, parameters))
+
+    def update(self, **parameters) -> Iterator[ConceptMap]:
+        return self._query_manager.run_update(self._req("update_req", query_manager_update_req, parameters))
+
+    def _req(self, field: str, build: Callable[[str, Any], transaction_proto.Transaction.Req],
+             parameters: Mapping[str, Any]) -> transaction_proto.Transaction.Req:
+        query = self._template.format(parameters)
+        skeleton = self._reqs.get(field)
+        if skeleton is None:
+            skeleton = self._reqs[field] = build("", self._options)
+        req = transaction_proto.Transaction.Req()
+        req.MergeFrom(skeleton)
+        getattr(req.query_manager_req, field).query = query
+        return req
+
+    def __str__(self):
+        return "PreparedQuery[%s]" % self._template.text()
+
+
+class _QueryTemplate:
+    _TOKENS = re.compile(r'"(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\'|#[^\n]*|~([A-Za-z_][A-Za-z0-9_]*)', re.DOTALL)
+
+    def __init__(self, text: str):
+        self._text = text
+        self._parts = []
+        self._names = []
+        start = 0
+        for token in self._TOKENS.finditer(text):
+            if token.group(1) is not None:
+                self._parts.append(text[start:token.start()])
+                self._names.append(token.group(1))
+                start = token.end()
+        self._parts.append(text[start:])
+        self._parameters = tuple(dict.fromkeys(self._names))
+
+    def text(self) -> str:
+        return self._text
+
+    def parameters(self) -> Tuple[str, ...]:
+        return self._parameters
+
+    def format(self, parameters: Mapping[str, Any]) -> str:
+        if len(parameters) != len(self._parameters):
+            for name in parameters:
+                if name not in self._parameters:
+                    raise TypeDBClientException.of(UNKNOWN_QUERY_PARAMETER, name)
+        chunks = [self._parts[0]]
+        for name, part in zip(self._names, self._parts[1:]):
+            if name not in parameters:
+                raise TypeDBClientException.of(MISSING_QUERY_PARAMETER, name)
+            chunks.append(_literal(name, parameters[name]))
+            chunks.append(part)
+        return "".join(chunks)
+
+
+def _literal(name: str, value: Any) -> str:
+    writer = _LITERAL_WRITERS.get(type(value))
+    if writer is None:
+        writer = next((writer for value_type, writer in _LITERAL_WRITERS.items() if isinstance(value, value_type)), None)
+    literal = writer(value) if writer is not None else None
+    if literal is None:
+        raise TypeDBClientException.of(INVALID_QUERY_PARAMETER, (value, name))
+    return literal
+
+
+def _string_literal(value: str):
+    quote = '"' if '"' not in value else "'" if "'" not in value else None
+    if quote is None or (len(value) - len(value.rstrip("\\"))) % 2 == 1:
+        return None
+    return quote + value + quote
+
+
+def _double_literal(value: float):
+    if not math.isfinite(value):
+        return None
+    literal = format(Decimal(repr(float(value))), "f")
+    return literal if "." in literal else literal + ".0"
+
+
+def _datetime_literal(value: datetime):
+    return value.isoformat(timespec="milliseconds") if value.tzinfo is None else None
+
+
+# Checked in order for subclasses, so bool precedes int and datetime precedes date.
+_LITERAL_WRITERS: Dict[type, Callable[[Any], str]] = {
+    str: _string_literal,
+    bool: lambda value: "true" if value else "false",
+    int: lambda value: str(int(value)),
+    float: _double_literal,
+    datetime: _datetime_literal,
+    date: lambda value: value.isoformat(),
+}
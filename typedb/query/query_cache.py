@@ -0,0 +1,188 @@
+#
+# Copyright (C) 2022 Vaticle
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+#
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import typedb_protocol.common.options_pb2 as options_proto
+import typedb_protocol.common.transaction_pb2 as transaction_proto
+from google.protobuf.message import Message
+
+from typedb.api.query.future import QueryFuture
+from typedb.api.query.query_cache import QueryCache
+
+
+class _QueryCache(QueryCache):
+    """
+    Holds the answer protos of match and match aggregate queries run in READ transactions, in least recently used
+    order. Entries are keyed by database and by the serialised request, which covers the query string and the
+    query options merged over the transaction options, and are sized by their serialised length.
+
+    Each database has a generation, advanced whenever it is invalidated. A transaction captures it when it opens and
+    passes it with the answers it records, which are refused if the database has since been invalidated, as they may
+    have been read before the write that invalidated it.
+    """
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, bytes], _QueryCache.Entry]" = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0
+        self._generations: Dict[str, int] = {}
+        self._lock = Lock()
+
+    @staticmethod
+    def key(database: str, transaction_options: options_proto.Options,
+            req: transaction_proto.Transaction.Req) -> Tuple[str, bytes]:
+        options = options_proto.Options()
+        options.CopyFrom(transaction_options)
+        options.MergeFrom(req.query_manager_req.options)
+        keyed_req = transaction_proto.Transaction.Req()
+        keyed_req.CopyFrom(req)
+        keyed_req.query_manager_req.options.CopyFrom(options)
+        return database, keyed_req.SerializeToString(deterministic=True)
+
+    def generation(self, database: str) -> int:
+        with self._lock:
+            return self._generation + self._generations.get(database, 0)
+
+    def stream(self, key: Tuple[str, bytes], generation: int,
+               load: Callable[[], Iterator[Message]]) -> Iterator[Message]:
+        answers = self._get(key)
+        if answers is not None:
+            return iter(answers)
+        return self._record(key, generation, load())
+
+    def future(self, key: Tuple[str, bytes], generation: int,
+               load: Callable[[], QueryFuture[Message]]) -> QueryFuture[Message]:
+        answers = self._get(key)
+        if answers is not None:
+            return _QueryCache.DoneFuture(answers[0])
+        return load().map(lambda answer: self._recorded(key, generation, answer))
+
+    def _record(self, key: Tuple[str, bytes], generation: int, answers: Iterator[Message]) -> Iterator[Message]:
+        recorded = []
+        size_bytes = 0
+        for answer in answers:
+            if recorded is not None:
+                size_bytes += answer.ByteSize()
+                if size_bytes > self._max_bytes:
+                    recorded = None
+                else:
+                    recorded.append(answer)
+            yield answer
+        if recorded is not None:
+            self._put(key, generation, recorded, size_bytes)
+
+    def _recorded(self, key: Tuple[str, bytes], generation: int, answer: Message) -> Message:
+        self._put(key, generation, [answer], answer.ByteSize())
+        return answer
+
+    def _get(self, key: Tuple[str, bytes]) -> Optional[List[Message]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.answers
+
+    def _put(self, key: Tuple[str, bytes], generation: int, answers: List[Message], size_bytes: int) -> None:
+        if size_bytes > self._max_bytes:
+            return
+        with self._lock:
+            if generation != self._generation + self._generations.get(key[0], 0):
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _QueryCache.Entry(answers, size_bytes, time.monotonic() + self._ttl_seconds)
+            self._size_bytes += size_bytes
+            while self._size_bytes > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+                self._evictions += 1
+
+    def _remove(self, key: Tuple[str, bytes]) -> None:
+        self._size_bytes -= self._entries.pop(key).size_bytes
+
+    def hits(self) -> int:
+        return self._hits
+
+    def misses(self) -> int:
+        return self._misses
+
+    def evictions(self) -> int:
+        return self._evictions
+
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds
+
+    def invalidate(self, database: Optional[str] = None) -> None:
+        with self._lock:
+            if database is None:
+                self._generation += 1
+            else:
+                self._generations[database] = self._generations.get(database, 0) + 1
+            for key in [key for key in self._entries if database is None or key[0] == database]:
+                self._remove(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __str__(self):
+        return "QueryCache[entries: %d, bytes: %d/%d, hits: %d, misses: %d, evictions: %d]" % (
+            len(self), self._size_bytes, self._max_bytes, self._hits, self._misses, self._evictions)
+
+    class Entry:
+        __slots__ = ["answers", "size_bytes", "expires_at"]
+
+        def __init__(self, answers: List[Message], size_bytes: int, expires_at: float):
+            self.answers = answers
+            self.size_bytes = size_bytes
+            self.expires_at = expires_at
+
+    class DoneFuture(QueryFuture[Message]):
+
+        def __init__(self, answer: Message):
+            self._answer = answer
+            self._future = Future()
+            self._future.set_result(answer)
+
+        def get(self) -> Message:
+            return self._answer
+
+        def as_future(self) -> "Future[Message]":
+            return self._future
@@ -19,10 +19,11 @@
 # under the License.
 #
 
-from typing import TYPE_CHECKING, Union, Iterator
+from typing import TYPE_CHECKING, Union, Iterable, Iterator, Mapping, Optional, Tuple
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 
+from typedb.api.answer.concept_column import ConceptColumn
 from typedb.api.answer.concept_map import ConceptMap
 from typedb.api.answer.concept_map_group import ConceptMapGroup
 from typedb.api.answer.numeric import Numeric
@@ -35,11 +36,14 @@ from typedb.common.rpc.request_builder import query_manager_match_req, query_man
     query_manager_match_group_req, query_manager_match_group_aggregate_req, query_manager_insert_req, \
     query_manager_delete_req, query_manager_update_req, query_manager_define_req, query_manager_undefine_req, \
     query_manager_explain_req
+from typedb.concept.answer.concept_column import _ConceptColumnsCollector
 from typedb.concept.answer.concept_map import _ConceptMap
 from typedb.concept.answer.concept_map_group import _ConceptMapGroup
 from typedb.concept.answer.numeric import _Numeric
 from typedb.concept.answer.numeric_group import _NumericGroup
 from typedb.logic.explanation import _Explanation
+from typedb.query.prepared_query import _PreparedQuery
+from typedb.query.query_cache import _QueryCache
 
 if TYPE_CHECKING:
     from typedb.api.connection.transaction import _TypeDBTransactionExtended, TypeDBTransaction
@@ -53,29 +57,72 @@ class _QueryManager(QueryManager):
     def match(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMap]:
         if not options:
             options = TypeDBOptions.core()
-        return (_ConceptMap.of(cm) for rp in self.stream(query_manager_match_req(query, options.proto())) for cm in rp.match_res_part.answers)
+        return self.run_match(query_manager_match_req(query, options.proto()))
+
+    def run_match(self, req: transaction_proto.Transaction.Req) -> Iterator[ConceptMap]:
+        type_cache = self._transaction_ext.type_cache()
+        query_cache = self._query_cache(req)
+        if query_cache is not None:
+            return (_ConceptMap.of(cm, type_cache) for cm in query_cache.stream(
+                self._query_cache_key(req), self._transaction_ext.query_cache_generation(),
+                lambda: (cm for rp in self.stream(req) for cm in rp.match_res_part.answers)))
+        return (_ConceptMap.of(cm, type_cache) for rp in self.stream(req) for cm in rp.match_res_part.answers)
+
+    def match_columnar(self, query: str, columns: Iterable[str] = None,
+                       options: TypeDBOptions = None) -> Mapping[str, ConceptColumn]:
+        if not options:
+            options = TypeDBOptions.core()
+        collector = _ConceptColumnsCollector(columns)
+        for rp in self.stream(query_manager_match_req(query, options.proto())):
+            collector.add_all(rp.match_res_part.answers)
+        return collector.columns()
 
     def match_aggregate(self, query: str, options: TypeDBOptions = None) -> QueryFuture[Numeric]:
         if not options:
             options = TypeDBOptions.core()
-        return self.query(query_manager_match_aggregate_req(query, options.proto())).map(lambda res: _Numeric.of(res.match_aggregate_res.answer))
+        return self.run_match_aggregate(query_manager_match_aggregate_req(query, options.proto()))
+
+    def run_match_aggregate(self, req: transaction_proto.Transaction.Req) -> QueryFuture[Numeric]:
+        query_cache = self._query_cache(req)
+        if query_cache is not None:
+            return query_cache.future(self._query_cache_key(req), self._transaction_ext.query_cache_generation(),
+                                      lambda: self.query(req).map(lambda res: res.match_aggregate_res.answer)).map(_Numeric.of)
+        return self.query(req).map(lambda res: _Numeric.of(res.match_aggregate_res.answer))
 
     def match_group(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMapGroup]:
         if not options:
             options = TypeDBOptions.core()
-        return (_ConceptMapGroup.of(cmg) for rp in self.stream(query_manager_match_group_req(query, options.proto()))
-                for cmg in rp.match_group_res_part.answers)
+        return self.run_match_group(query_manager_match_group_req(query, options.proto()))
+
+    def run_match_group(self, req: transaction_proto.Transaction.Req) -> Iterator[ConceptMapGroup]:
+        type_cache = self._transaction_ext.type_cache()
+        return (_ConceptMapGroup.of(cmg, type_cache) for rp in self.stream(req) for cmg in rp.match_group_res_part.answers)
 
     def match_group_aggregate(self, query: str, options: TypeDBOptions = None) -> Iterator[NumericGroup]:
         if not options:
             options = TypeDBOptions.core()
-        return (_NumericGroup.of(ng) for rp in self.stream(query_manager_match_group_aggregate_req(query, options.proto()))
-                for ng in rp.match_group_aggregate_res_part.answers)
+        return self.run_match_group_aggregate(query_manager_match_group_aggregate_req(query, options.proto()))
+
+    def run_match_group_aggregate(self, req: transaction_proto.Transaction.Req) -> Iterator[NumericGroup]:
+        type_cache = self._transaction_ext.type_cache()
+        return (_NumericGroup.of(ng, type_cache) for rp in self.stream(req) for ng in rp.match_group_aggregate_res_part.answers)
 
     def insert(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMap]:
         if not options:
             options = TypeDBOptions.core()
-        return (_ConceptMap.of(cm) for rp in self.stream(query_manager_insert_req(query, options.proto())) for cm in rp.insert_res_part.answers)
+        return self.run_insert(query_manager_insert_req(query, options.proto()))
+
+    def run_insert(self, req: transaction_proto.Transaction.Req) -> Iterator[ConceptMap]:
+        type_cache = self._transaction_ext.type_cache()
+        return (_ConceptMap.of(cm, type_cache) for rp in self.stream(req) for cm in rp.insert_res_part.answers)
+
+    def insert_void(self, query: str, options: TypeDBOptions = None) -> None:
+        if not options:
+            options = TypeDBOptions.core()
+        self.run_insert_void(query_manager_insert_req(query, options.proto()))
+
+    def run_insert_void(self, req: transaction_proto.Transaction.Req) -> None:
+        self._transaction_ext.stream_void(req)
 
     def delete(self, query: str, options: TypeDBOptions = None) -> QueryFuture:
         if not options:
@@ -85,12 +132,17 @@ class _QueryManager(QueryManager):
     def update(self, query: str, options: TypeDBOptions = None) -> Iterator[ConceptMap]:
         if not options:
             options = TypeDBOptions.core()
-        return (_ConceptMap.of(cm) for rp in self.stream(query_manager_update_req(query, options.proto())) for cm in rp.update_res_part.answers)
+        return self.run_update(query_manager_update_req(query, options.proto()))
+
+    def run_update(self, req: transaction_proto.Transaction.Req) -> Iterator[ConceptMap]:
+        type_cache = self._transaction_ext.type_cache()
+        return (_ConceptMap.of(cm, type_cache) for rp in self.stream(req) for cm in rp.update_res_part.answers)
 
     def explain(self, explainable: ConceptMap.Explainable, options: TypeDBOptions = None) -> Iterator[Explanation]:
         if not options:
             options = TypeDBOptions.core()
-        return (_Explanation.of(ex) for rp in self.stream(query_manager_explain_req(explainable.explainable_id(), options.proto())) for ex in rp.explain_res_part.explanations)
+        type_cache = self._transaction_ext.type_cache()
+        return (_Explanation.of(ex, type_cache) for rp in self.stream(query_manager_explain_req(explainable.explainable_id(), options.proto())) for ex in rp.explain_res_part.explanations)
 
     def define(self, query: str, options: TypeDBOptions = None) -> QueryFuture:
         if not options:
@@ -102,6 +154,19 @@ class _QueryManager(QueryManager):
             options = TypeDBOptions.core()
         return self.query_void(query_manager_undefine_req(query, options.proto()))
 
+    def prepare(self, template: str, options: TypeDBOptions = None) -> _PreparedQuery:
+        if not options:
+            options = TypeDBOptions.core()
+        return _PreparedQuery(self, template, options)
+
+    def _query_cache(self, req: transaction_proto.Transaction.Req) -> Optional[_QueryCache]:
+        options = req.query_manager_req.options
+        explain = options.explain if options.HasField("explain") else bool(self._transaction_ext.options().explain)
+        return None if explain else self._transaction_ext.query_cache()
+
+    def _query_cache_key(self, req: transaction_proto.Transaction.Req) -> Tuple[str, bytes]:
+        return _QueryCache.key(self._transaction_ext.database_name(), self._transaction_ext.options().proto(), req)
+
     def query_void(self, req: transaction_proto.Transaction.Req):
         return self._transaction_ext.run_query(req)
 
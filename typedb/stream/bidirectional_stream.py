@@ -18,9 +18,12 @@
 # specific language governing permissions and limitations
 # under the License.
 #
+from concurrent.futures import Future
+from collections import deque
 from queue import Empty, Queue
-from typing import TypeVar, Iterator, Union
-from uuid import uuid4, UUID
+from threading import Lock, Thread
+from typing import Deque, Optional, Set, TypeVar, Iterator, Union
+from itertools import count
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 from grpc import RpcError
@@ -28,6 +31,7 @@ from grpc import RpcError
 from typedb.api.query.future import QueryFuture
 from typedb.common.concurrent.atomic import AtomicBoolean
 from typedb.common.exception import TypeDBClientException, UNKNOWN_REQUEST_ID, TRANSACTION_CLOSED, ILLEGAL_ARGUMENT
+from typedb.common.rpc.request_builder import transaction_stream_req
 from typedb.common.rpc.stub import TypeDBStub
 from typedb.stream.request_transmitter import RequestTransmitter
 from typedb.stream.response_collector import ResponseCollector
@@ -37,18 +41,32 @@ T = TypeVar('T')
 
 
 class BidirectionalStream:
+    # A stream whose consumer has this many response parts waiting is not asked for its next batch, unless configured
+    _DEFAULT_BUFFER_SIZE = 32
 
-    def __init__(self, stub: TypeDBStub, transmitter: RequestTransmitter):
+    def __init__(self, stub: TypeDBStub, transmitter: RequestTransmitter, reader_thread: bool = False,
+                 buffer_size: Optional[int] = None, buffer_bytes: Optional[int] = None):
         self._response_collector: ResponseCollector[Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]] = ResponseCollector()
         self._request_iterator = RequestIterator()
         self._response_iterator = stub.transaction(self._request_iterator)
         self._dispatcher = transmitter.dispatcher(self._request_iterator)
         self._is_open = AtomicBoolean(True)
         self._error: TypeDBClientException = None
+        self._fetch_lock = Lock()
+        self._void_streams: Set[bytes] = set()
+        self._deferred_streams: Set[bytes] = set()
+        self._dropped_streams: Deque[bytes] = deque()
+        self._continue_lock = Lock()
+        self._buffer_size = buffer_size or self._DEFAULT_BUFFER_SIZE
+        self._buffer_bytes = buffer_bytes
+        self._request_ids = count(1)
+        self._reader_thread = reader_thread
+        if reader_thread:
+            Thread(target=self._read_responses, daemon=True).start()
 
     def single(self, req: transaction_proto.Transaction.Req, batch: bool) -> "BidirectionalStream.Single[transaction_proto.Transaction.Res]":
-        request_id = uuid4()
-        req.req_id = request_id.bytes
+        request_id = self._new_request_id()
+        req.req_id = request_id
         self._response_collector.new_queue(request_id)
         if batch:
             self._dispatcher.dispatch(req)
@@ -57,50 +75,185 @@ class BidirectionalStream:
         return BidirectionalStream.Single(request_id, self)
 
     def stream(self, req: transaction_proto.Transaction.Req) -> Iterator[transaction_proto.Transaction.ResPart]:
-        request_id = uuid4()
-        req.req_id = request_id.bytes
+        request_id = self._new_request_id()
+        req.req_id = request_id
         self._response_collector.new_queue(request_id)
         self._dispatcher.dispatch(req)
         return ResponsePartIterator(request_id, self)
 
+    def stream_void(self, req: transaction_proto.Transaction.Req) -> None:
+        """
+        Dispatches a streamed request whose answers are not wanted. Its response parts are dropped as soon as they are
+        read, and it is kept going until the server reports it done; a failure closes the transaction and is therefore
+        raised by the next request that waits on it, such as the commit.
+        """
+        request_id = self._new_request_id()
+        req.req_id = request_id
+        self._void_streams.add(request_id)
+        self._dispatcher.dispatch(req)
+
+    def _new_request_id(self) -> bytes:
+        # Request IDs only need to be unique within the transaction; the server reads them as 16-byte UUIDs
+        return next(self._request_ids).to_bytes(16, "big")
+
+    def cancel(self, request_id: bytes) -> None:
+        """
+        Stops a streamed request that its consumer no longer reads: its queued response parts are freed, parts still
+        in flight are dropped as they arrive, and the server is not asked for another batch, so it stops at the end of
+        the current one.
+        """
+        with self._continue_lock:
+            self._deferred_streams.discard(request_id)
+            self._response_collector.remove(request_id)
+
+    def finish(self, request_id: bytes) -> None:
+        # Frees a streamed request whose consumer has read its DONE; a late second DONE is dropped as it arrives
+        with self._continue_lock:
+            self._deferred_streams.discard(request_id)
+            self._response_collector.remove(request_id)
+
+    def drop(self, request_id: bytes) -> None:
+        """
+        Cancels a streamed request whose consumer was garbage collected. That may happen on any thread at any point,
+        including while this stream holds its locks, so the request is only queued here and cancelled by the next
+        call to collect a response.
+        """
+        self._dropped_streams.append(request_id)
+
     def is_open(self) -> bool:
         return self._is_open.get()
 
-    def fetch(self, request_id: UUID) -> Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]:
+    def fetch_part(self, request_id: bytes) -> transaction_proto.Transaction.ResPart:
+        res_part = self.fetch(request_id)
+        if request_id in self._deferred_streams:
+            self._resume(request_id)
+        return res_part
+
+    def fetch(self, request_id: bytes) -> Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]:
         # Keep taking responses until we get one that matches the request ID
         while True:
+            if self._reader_thread:
+                return self._response_collector.get(request_id).get(block=True)
             try:
                 return self._response_collector.get(request_id).get(block=False)
             except Empty:
                 pass
 
-            try:
-                if not self._is_open.get():
+            with self._fetch_lock:
+                # Another thread may have collected our response, or started the reader, while we were waiting
+                if self._reader_thread or self._response_collector.get(request_id).has_responses():
+                    continue
+                try:
+                    if not self._is_open.get():
+                        raise TypeDBClientException.of(TRANSACTION_CLOSED)
+                    server_msg = next(self._response_iterator)
+                except RpcError as e:
+                    error = TypeDBClientException.of_rpc(e)
+                    self.close(error)
+                    raise error
+                except StopIteration:
+                    self.close()
                     raise TypeDBClientException.of(TRANSACTION_CLOSED)
-                server_msg = next(self._response_iterator)
-            except RpcError as e:
-                error = TypeDBClientException.of_rpc(e)
-                self.close(error)
-                raise error
-            except StopIteration:
-                self.close()
-                raise TypeDBClientException.of(TRANSACTION_CLOSED)
-
-            server_case = server_msg.WhichOneof("server")
-            if server_case == "res":
-                self._collect(server_msg.res)
-            elif server_case == "res_part":
-                self._collect(server_msg.res_part)
-            else:
-                raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
+
+                server_case = server_msg.WhichOneof("server")
+                if server_case == "res":
+                    self._collect(server_msg.res)
+                elif server_case == "res_part":
+                    self._collect(server_msg.res_part)
+                else:
+                    raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
+
+    def future(self, request_id: bytes) -> Future:
+        """
+        Returns a concurrent.futures.Future that completes as soon as the response to the request is collected. Since
+        nothing else might be reading responses while the caller waits on it, this starts the reader thread.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        self._start_reader()
+        self._response_collector.get(request_id).on_response(lambda: self._resolve(future, request_id))
+        return future
+
+    def _resolve(self, future: Future, request_id: bytes):
+        try:
+            future.set_result(self.fetch(request_id))
+        except BaseException as e:
+            future.set_exception(e)
+
+    def _start_reader(self):
+        with self._fetch_lock:
+            if not self._reader_thread:
+                self._reader_thread = True
+                Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self):
+        # Drains the server stream into the response queues, so that consumers only ever block on their own queue
+        try:
+            for server_msg in self._response_iterator:
+                server_case = server_msg.WhichOneof("server")
+                if server_case == "res":
+                    self._collect(server_msg.res)
+                elif server_case == "res_part":
+                    self._collect(server_msg.res_part)
+                else:
+                    raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
+            self.close()
+        except RpcError as e:
+            self.close(TypeDBClientException.of_rpc(e))
+        except TypeDBClientException as e:
+            self.close(e)
 
     def _collect(self, response: Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]):
-        request_id = UUID(bytes=response.req_id)
+        while self._dropped_streams:
+            self.cancel(self._dropped_streams.popleft())
+        request_id = response.req_id
+        if request_id in self._void_streams:
+            self._discard(request_id, response)
+            return
         collector = self._response_collector.get(request_id)
-        if collector:
-            collector.put(response)
+        if not collector:
+            # The parts of a cancelled stream that were in flight, and the late DONE that the server may send after
+            # the DONE of a finished stream, need no request state: their IDs are recognised as already issued
+            if self._is_issued(request_id):
+                return
+            raise TypeDBClientException.of(UNKNOWN_REQUEST_ID, (request_id.hex(), str(response)))
+        elif _is_continue(response):
+            self._continue(request_id)
         else:
-            raise TypeDBClientException.of(UNKNOWN_REQUEST_ID, (request_id, str(response)))
+            collector.put(response, response.ByteSize() if self._buffer_bytes is not None else 0)
+
+    def _is_issued(self, request_id: bytes) -> bool:
+        # Drawing the next ID is the only thread-safe way to read the counter; IDs need not be consecutive
+        return int.from_bytes(request_id, "big") < next(self._request_ids)
+
+    def _continue(self, request_id: bytes):
+        # Asks for the next batch as soon as the server pauses the stream, unless the consumer is far enough behind
+        # that it would only pile up; in that case the consumer asks once it has caught up.
+        with self._continue_lock:
+            if not self._response_collector.get(request_id):
+                return
+            elif not self._is_buffer_full(request_id):
+                self._dispatcher.dispatch(transaction_stream_req(request_id))
+            else:
+                self._deferred_streams.add(request_id)
+
+    def _resume(self, request_id: bytes):
+        with self._continue_lock:
+            if request_id in self._deferred_streams and not self._is_buffer_full(request_id):
+                self._deferred_streams.remove(request_id)
+                self._dispatcher.dispatch(transaction_stream_req(request_id))
+
+    def _is_buffer_full(self, request_id: bytes) -> bool:
+        collector = self._response_collector.get(request_id)
+        return collector.size() >= self._buffer_size or \
+            (self._buffer_bytes is not None and collector.size_bytes() >= self._buffer_bytes)
+
+    def _discard(self, request_id: bytes, response: transaction_proto.Transaction.ResPart):
+        # Once DONE, a void stream is forgotten; like any finished stream, a late second DONE is dropped as it arrives
+        if _is_continue(response):
+            self._dispatcher.dispatch(transaction_stream_req(request_id))
+        elif _is_done(response):
+            self._void_streams.discard(request_id)
 
     def dispatcher(self):
         return self._dispatcher
@@ -128,12 +281,41 @@ class BidirectionalStream:
     # TODO: Ideally, stream package should not have to depend on api
     class Single(QueryFuture[T]):
 
-        def __init__(self, request_id: UUID, stream: "BidirectionalStream"):
+        def __init__(self, request_id: bytes, stream: "BidirectionalStream"):
             self._request_id = request_id
             self._stream = stream
+            self._future: Optional[Future] = None
+            self._future_lock = Lock()
 
         def get(self) -> T:
-            return self._stream.fetch(self._request_id)
+            # The response can only be read once, so whichever of get() and as_future() comes first keeps it in the
+            # future that both serve it from
+            with self._future_lock:
+                fetch = self._future is None
+                if fetch:
+                    self._future = Future()
+                    self._future.set_running_or_notify_cancel()
+            if fetch:
+                self._stream._resolve(self._future, self._request_id)
+            return self._future.result()
+
+        def as_future(self) -> "Future[T]":
+            with self._future_lock:
+                if self._future is None:
+                    self._future = self._stream.future(self._request_id)
+                return self._future
+
+
+def _is_continue(response: Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]) -> bool:
+    return response.WhichOneof("res") == "stream_res_part" and response.stream_res_part.state == _CONTINUE
+
+
+def _is_done(response: Union[transaction_proto.Transaction.Res, transaction_proto.Transaction.ResPart]) -> bool:
+    return response.WhichOneof("res") == "stream_res_part" and response.stream_res_part.state == _DONE
+
+
+_CONTINUE = transaction_proto.Transaction.Stream.State.Value("CONTINUE")
+_DONE = transaction_proto.Transaction.Stream.State.Value("DONE")
 
 
 class RequestIterator(Iterator[Union[transaction_proto.Transaction.Req, StopIteration]]):
@@ -20,14 +20,15 @@
 #
 
 from queue import Queue, Empty
-from threading import Lock, Semaphore, Thread
-from time import sleep
-from typing import List, TYPE_CHECKING
+from threading import Condition, Lock, Semaphore, Thread
+from time import monotonic, sleep
+from typing import List, Optional, TYPE_CHECKING
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
 
+from typedb.api.connection.client import TransmitterMode
 from typedb.common.concurrent.lock import ReadWriteLock
-from typedb.common.exception import TypeDBClientException, CLIENT_NOT_OPEN
+from typedb.common.exception import TypeDBClientException, CLIENT_NOT_OPEN, NEGATIVE_VALUE_NOT_ALLOWED
 from typedb.common.rpc.request_builder import transaction_client_msg
 
 if TYPE_CHECKING:
@@ -35,18 +36,26 @@ if TYPE_CHECKING:
 
 BATCH_WINDOW_SMALL_SECS = 0.001
 BATCH_WINDOW_LARGE_SECS = 0.003
+EVENT_DRIVEN_MAX_BATCH_SIZE = 128
+EVENT_DRIVEN_MAX_DELAY_SECS = 0.0005
 
 
 class RequestTransmitter:
 
-    def __init__(self, parallelisation: int):
+    def __init__(self, parallelisation: int, mode: TransmitterMode = TransmitterMode.BATCH_WINDOW,
+                 max_batch_size: int = EVENT_DRIVEN_MAX_BATCH_SIZE, max_delay_secs: float = EVENT_DRIVEN_MAX_DELAY_SECS):
+        if max_batch_size < 1:
+            raise TypeDBClientException.of(NEGATIVE_VALUE_NOT_ALLOWED, (max_batch_size,))
         self._executors: List[RequestTransmitter.Executor] = []
         self._executor_index = 0
         self._is_open = True
         self._executor_index_lock = Lock()
         self.access_lock = ReadWriteLock()
         for i in range(parallelisation):
-            self._executors.append(RequestTransmitter.Executor(self))
+            if mode.is_event_driven():
+                self._executors.append(RequestTransmitter.EventDrivenExecutor(self, max_batch_size, max_delay_secs))
+            else:
+                self._executors.append(RequestTransmitter.Executor(self))
 
     def _next_executor(self):
         with self._executor_index_lock:
@@ -132,6 +141,59 @@ class RequestTransmitter:
             if exc_tb is not None:
                 return False
 
+    class EventDrivenExecutor:
+        """
+        Flushes a dispatcher as soon as it has requests, unless it already flushed within the last
+        ``max_delay_secs``: requests that arrive faster than that are coalesced into one message, which is sent once
+        ``max_batch_size`` requests are queued or the delay runs out.
+        """
+
+        def __init__(self, transmitter: "RequestTransmitter", max_batch_size: int, max_delay_secs: float):
+            self._transmitter = transmitter
+            self._max_batch_size = max_batch_size
+            self._max_delay_secs = max_delay_secs
+            self.dispatchers: List[RequestTransmitter.Dispatcher] = []
+            self._has_requests = False
+            self._condition = Condition()
+            Thread(target=self.run, daemon=True).start()
+
+        def may_start_running(self):
+            with self._condition:
+                if not self._has_requests:
+                    self._has_requests = True
+                    self._condition.notify()
+
+        def run(self):
+            timeout: Optional[float] = None
+            while self._transmitter.is_open():
+                with self._condition:
+                    if not self._has_requests:
+                        self._condition.wait(timeout)
+                    self._has_requests = False
+                timeout = None
+                now = monotonic()
+                for dispatcher in list(self.dispatchers):
+                    if not dispatcher.has_requests():
+                        continue
+                    wait = dispatcher.last_sent() + self._max_delay_secs - now
+                    if wait <= 0 or dispatcher.queued_requests() >= self._max_batch_size:
+                        dispatcher.send_batched_requests(self._max_batch_size)
+                    else:
+                        timeout = wait if timeout is None else min(timeout, wait)
+
+        def close(self):
+            for dispatcher in list(self.dispatchers):
+                dispatcher.close()
+            self.may_start_running()
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            self.close()
+            if exc_tb is not None:
+                return False
+
     class Dispatcher:
 
         def __init__(self, executor: "RequestTransmitter.Executor", request_iterator: "RequestIterator", transmitter: "RequestTransmitter"):
@@ -140,8 +202,18 @@ class RequestTransmitter:
             self._transmitter = transmitter
             self._request_queue = Queue()
             self._send_batch_lock = Lock()
+            self._last_sent = 0.0
+
+        def has_requests(self) -> bool:
+            return not self._request_queue.empty()
 
-        def send_batched_requests(self):
+        def queued_requests(self) -> int:
+            return self._request_queue.qsize()
+
+        def last_sent(self) -> float:
+            return self._last_sent
+
+        def send_batched_requests(self, max_batch_size: int = None):
             with self._send_batch_lock:
                 if not self._transmitter.is_open():
                     return
@@ -151,8 +223,15 @@ class RequestTransmitter:
                         requests.append(self._request_queue.get(block=False))
                     except Empty:
                         break
+                    if len(requests) == max_batch_size:
+                        self._send(requests)
+                        requests = []
                 if requests:
-                    self._request_iterator.put(transaction_client_msg(requests))
+                    self._send(requests)
+
+        def _send(self, requests: List[transaction_proto.Transaction.Req]):
+            self._request_iterator.put(transaction_client_msg(requests))
+            self._last_sent = monotonic()
 
         def dispatch(self, proto_req: transaction_proto.Transaction.Req):
             try:
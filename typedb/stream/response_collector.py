@@ -21,8 +21,7 @@
 
 import queue
 from threading import Lock
-from typing import Generic, TypeVar, Dict, Optional
-from uuid import UUID
+from typing import Callable, Generic, TypeVar, Dict, Optional, Union
 
 from grpc import RpcError
 from typedb.common.exception import TypeDBClientException, TRANSACTION_CLOSED, ILLEGAL_STATE
@@ -33,20 +32,30 @@ R = TypeVar('R')
 class ResponseCollector(Generic[R]):
 
     def __init__(self):
-        self._response_queues: Dict[UUID, ResponseCollector.Queue[R]] = {}
+        self._response_queues: Dict[bytes, ResponseCollector.Queue[R]] = {}
         self._collectors_lock = Lock()
+        self._is_open = True
+        self._error: Optional[TypeDBClientException] = None
 
-    def new_queue(self, request_id: UUID):
+    def new_queue(self, request_id: bytes):
         with self._collectors_lock:
             collector: ResponseCollector.Queue[R] = ResponseCollector.Queue()
             self._response_queues[request_id] = collector
+            if not self._is_open:
+                collector.close(self._error)
             return collector
 
-    def get(self, request_id: UUID) -> Optional["ResponseCollector.Queue[R]"]:
+    def get(self, request_id: bytes) -> Optional["ResponseCollector.Queue[R]"]:
         return self._response_queues.get(request_id)
 
+    def remove(self, request_id: bytes) -> None:
+        with self._collectors_lock:
+            self._response_queues.pop(request_id, None)
+
     def close(self, error: Optional[TypeDBClientException]):
         with self._collectors_lock:
+            self._is_open = False
+            self._error = error
             for collector in self._response_queues.values():
                 collector.close(error)
 
@@ -54,23 +63,63 @@ class ResponseCollector(Generic[R]):
 
         def __init__(self):
             self._response_queue: queue.Queue[Response] = queue.Queue()
+            self._size_bytes = 0
+            self._size_bytes_lock = Lock()
+            self._callback: Optional[Callable[[], None]] = None
+            self._callback_lock = Lock()
 
         def get(self, block: bool) -> R:
             response = self._response_queue.get(block=block)
             if response.is_value():
+                if response.size_bytes:
+                    with self._size_bytes_lock:
+                        self._size_bytes -= response.size_bytes
                 return response.value
-            elif response.is_done() and response.error is None:
+            # Keep the done marker queued so that every later call to get() fails the same way
+            self._response_queue.put(response)
+            if response.is_done() and response.error is None:
                 raise TypeDBClientException.of(TRANSACTION_CLOSED)
+            elif response.is_done() and isinstance(response.error, TypeDBClientException):
+                raise response.error
             elif response.is_done() and response.error is not None:
                 raise TypeDBClientException.of_rpc(response.error)
             else:
                 raise TypeDBClientException.of(ILLEGAL_STATE)
 
-        def put(self, response: R):
-            self._response_queue.put(ValueResponse(response))
+        def has_responses(self) -> bool:
+            return not self._response_queue.empty()
+
+        def size(self) -> int:
+            return self._response_queue.qsize()
+
+        def size_bytes(self) -> int:
+            return self._size_bytes
+
+        def put(self, response: R, size_bytes: int = 0):
+            if size_bytes:
+                with self._size_bytes_lock:
+                    self._size_bytes += size_bytes
+            self._response_queue.put(ValueResponse(response, size_bytes))
+            if self._callback is not None:
+                self._notify()
+
+        def on_response(self, callback: Callable[[], None]) -> None:
+            # Calls back once, from the thread that queues the next response, or now if one is already queued
+            with self._callback_lock:
+                self._callback = callback
+            if not self._response_queue.empty():
+                self._notify()
+
+        def _notify(self):
+            with self._callback_lock:
+                callback, self._callback = self._callback, None
+            if callback is not None:
+                callback()
 
         def close(self, error: Optional[TypeDBClientException]):
             self._response_queue.put(DoneResponse(error))
+            if self._callback is not None:
+                self._notify()
 
 
 class Response:
@@ -84,8 +133,9 @@ class Response:
 
 class ValueResponse(Response, Generic[R]):
 
-    def __init__(self, value: R):
+    def __init__(self, value: R, size_bytes: int = 0):
         self.value = value
+        self.size_bytes = size_bytes
 
     def is_value(self):
         return True
@@ -93,7 +143,7 @@ class ValueResponse(Response, Generic[R]):
 
 class DoneResponse(Response):
 
-    def __init__(self, error: Optional[RpcError]):
+    def __init__(self, error: Optional[Union[RpcError, TypeDBClientException]]):
         self.error = error
 
     def is_done(self):
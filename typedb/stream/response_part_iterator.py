@@ -19,63 +19,51 @@
 # under the License.
 #
 from typing import Iterator, TYPE_CHECKING
-from uuid import UUID
 
 import typedb_protocol.common.transaction_pb2 as transaction_proto
-from enum import Enum
-from typedb.common.exception import TypeDBClientException, ILLEGAL_ARGUMENT, MISSING_RESPONSE, ILLEGAL_STATE
-from typedb.common.rpc.request_builder import transaction_stream_req
+from typedb.common.exception import TypeDBClientException, ILLEGAL_ARGUMENT, MISSING_RESPONSE
 
 if TYPE_CHECKING:
     from typedb.stream.bidirectional_stream import BidirectionalStream
 
 
 class ResponsePartIterator(Iterator[transaction_proto.Transaction.ResPart]):
+    """
+    Yields the response parts of one streamed request until the server reports it done. The bidirectional stream asks
+    for each following batch as soon as the server pauses the stream, so only the end of the stream reaches here.
+    Closing the iterator, or dropping the last reference to it, cancels the rest of the stream, unless it is done.
+    """
 
-    def __init__(self, request_id: UUID, bidirectional_stream: "BidirectionalStream"):
+    def __init__(self, request_id: bytes, bidirectional_stream: "BidirectionalStream"):
         self._request_id = request_id
         self._bidirectional_stream = bidirectional_stream
-        self._state = ResponsePartIterator.State.EMPTY
-        self._next: transaction_proto.Transaction.ResPart = None
+        self._done = False
+        self._closed = False
 
-    class State(Enum):
-        EMPTY = 0,
-        FETCHED = 1,
-        DONE = 2
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            if not self._done:
+                self._bidirectional_stream.cancel(self._request_id)
 
-    def _fetch_and_check(self) -> bool:
-        res_part = self._bidirectional_stream.fetch(self._request_id)
+    def __del__(self):
+        # Garbage collection may run this on a thread that holds the stream's locks, so it must not take them
+        if not self._closed and not self._done:
+            self._closed = True
+            self._bidirectional_stream.drop(self._request_id)
+
+    def __next__(self) -> transaction_proto.Transaction.ResPart:
+        if self._done or self._closed:
+            raise StopIteration
+        res_part = self._bidirectional_stream.fetch_part(self._request_id)
         res_case = res_part.WhichOneof("res")
         if res_case == "stream_res_part":
-            state = res_part.stream_res_part.state
-            if state == transaction_proto.Transaction.Stream.State.Value("DONE"):
-                self._state = ResponsePartIterator.State.DONE
-                return False
-            elif state == transaction_proto.Transaction.Stream.State.Value("CONTINUE"):
-                self._bidirectional_stream.dispatcher().dispatch(transaction_stream_req(self._request_id))
-                return self._fetch_and_check()
-            else:
+            if res_part.stream_res_part.state != transaction_proto.Transaction.Stream.State.Value("DONE"):
                 raise TypeDBClientException.of(ILLEGAL_ARGUMENT)
-        elif res_case is None:
-            raise TypeDBClientException.of(MISSING_RESPONSE, self._request_id)
-        else:
-            self._next = res_part
-            self._state = ResponsePartIterator.State.FETCHED
-            return True
-
-    def _has_next(self) -> bool:
-        if self._state == ResponsePartIterator.State.DONE:
-            return False
-        elif self._state == ResponsePartIterator.State.FETCHED:
-            return True
-        elif self._state == ResponsePartIterator.State.EMPTY:
-            return self._fetch_and_check()
-        else:
-            raise TypeDBClientException.of(ILLEGAL_STATE)
-
-    def __next__(self) -> transaction_proto.Transaction.ResPart:
-        if not self._has_next():
+            self._done = True
+            self._closed = True
+            self._bidirectional_stream.finish(self._request_id)
             raise StopIteration
-        else:
-            self._state = ResponsePartIterator.State.EMPTY
-            return self._next
+        elif res_case is None:
+            raise TypeDBClientException.of(MISSING_RESPONSE, self._request_id.hex())
+        return res_part